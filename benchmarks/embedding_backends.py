@@ -0,0 +1,141 @@
+"""
+Embedding backend benchmark for ApplyCopilot.
+
+Indexes a synthetic portfolio with each available backend and reports indexing
+throughput (chunks/sec, cold embedding cache) and retrieval quality (recall@k of the
+project a query is about). "openai" runs only when OPENAI_API_KEY is set and
+"sentence-transformers" only when the package is installed. Run from the project root:
+
+    python benchmarks/embedding_backends.py [--copies 10] [--k 3]
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# (project title, description, query an employer might ask about it)
+PROJECTS = [
+    ("Retail Demand Forecasting",
+     "Built a demand forecasting pipeline for 2,000 retail stores using LightGBM and weekly sales, "
+     "promotions and holiday features. Reduced inventory overstock by 12% and automated retraining with Airflow.",
+     "Have you forecasted product demand for retail stores?"),
+    ("Customer Support RAG Assistant",
+     "Developed a retrieval-augmented generation assistant over 40k support tickets with LangChain, FAISS "
+     "and GPT-4. Added citation of source tickets and cut average handling time by 30%.",
+     "Tell me about building a RAG chatbot over support tickets."),
+    ("Credit Card Fraud Detection",
+     "Trained an XGBoost fraud classifier on highly imbalanced card transactions with SMOTE and cost-sensitive "
+     "thresholds. Served real-time scores through a FastAPI service under 50 ms latency.",
+     "What experience do you have detecting fraudulent transactions?"),
+    ("Medical Image Segmentation",
+     "Implemented a U-Net in PyTorch to segment lung nodules in CT scans, with heavy augmentation and Dice loss. "
+     "Reached 0.87 Dice on the held-out hospital data.",
+     "Have you worked on segmentation of medical CT images?"),
+    ("Marketing Mix Modeling",
+     "Built a Bayesian marketing mix model in PyMC to attribute revenue to TV, search and social spend, "
+     "including adstock and saturation curves, and an optimizer for budget allocation.",
+     "How would you measure the revenue impact of marketing spend across channels?"),
+    ("Streaming Churn Prediction",
+     "Predicted subscriber churn for a video streaming service from viewing logs in Spark, with survival "
+     "analysis and SHAP explanations used by the retention team for targeted offers.",
+     "Have you predicted customer churn for a subscription business?"),
+    ("Document OCR Extraction",
+     "Automated invoice data extraction with Tesseract OCR and a LayoutLM model fine-tuned on 5k labelled "
+     "invoices, writing vendor, totals and line items into the ERP system.",
+     "Can you extract fields from scanned invoices automatically?"),
+    ("Recommendation Engine",
+     "Designed a two-tower recommendation model for an e-commerce catalogue with implicit feedback, "
+     "approximate nearest neighbour retrieval and an A/B test that lifted click-through rate by 8%.",
+     "Describe a product recommender system you built for an online store."),
+]
+
+
+# Shared boilerplate so projects aren't separable by length or wording alone
+COMMON_DETAILS = (
+    "Worked with stakeholders to define success metrics, wrote the data validation checks, "
+    "documented the model in the team wiki and presented results to leadership. "
+    "Code was reviewed, tested in CI and deployed with Docker on the cloud platform."
+)
+
+
+def build_portfolio(copies: int) -> str:
+    """Build a portfolio text with `copies` variants of every project, one section (chunk) each."""
+    sections = []
+    for copy in range(copies):
+        for title, description, _ in PROJECTS:
+            sections.append(f"=== Project: {title} (v{copy + 1})\n{description}\n{COMMON_DETAILS}")
+    return "\n".join(sections)
+
+
+def available_backends() -> list:
+    """List the backends that can run in this environment."""
+    backends = ["hashing"]
+    if importlib.util.find_spec("sentence_transformers") is not None:
+        backends.append("sentence-transformers")
+    if os.getenv("OPENAI_API_KEY"):
+        backends.append("openai")
+    return backends
+
+
+def run_backend(backend: str, portfolio_path: Path, cache_dir: Path, k: int) -> dict:
+    """Index the portfolio with one backend and measure throughput and recall@k."""
+    # FAISS is imported up front so its import time stays out of the measurement
+    from langchain_community.vectorstores import FAISS  # noqa: F401
+    from src.core.embedding_backends import create_embeddings
+    from src.core.embedding_cache import CachedEmbeddings
+    from src.core.vector_store import VectorStoreManager
+
+    manager = VectorStoreManager(embedding_backend=backend)
+    # Fresh cache file so every backend is measured cold
+    manager.embeddings = CachedEmbeddings(
+        create_embeddings(backend, manager.embeddings_model), manager.embeddings_model,
+        cache_path=cache_dir / f"{backend}.sqlite3"
+    )
+
+    start = time.perf_counter()
+    info = manager.load_and_index_portfolio(str(portfolio_path))
+    elapsed = time.perf_counter() - start
+
+    hits = 0
+    for title, _, query in PROJECTS:
+        chunks = manager.get_portfolio_chunks(query, k=k)
+        hits += any(f"Project: {title} " in chunk for chunk in chunks)
+
+    return {
+        "chunks": info["chunks_added"],
+        "seconds": elapsed,
+        "chunks_per_sec": info["chunks_added"] / elapsed if elapsed else float("inf"),
+        "recall": hits / len(PROJECTS),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare embedding backends on indexing speed and retrieval quality")
+    parser.add_argument("--copies", type=int, default=10, help="Variants of each project in the synthetic portfolio")
+    parser.add_argument("--k", type=int, default=3, help="Chunks retrieved per query")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        portfolio_path = tmp_dir / "portfolio.txt"
+        portfolio_path.write_text(build_portfolio(args.copies), encoding="utf-8")
+
+        print(f"{'backend':<24} {'chunks':>7} {'index (s)':>10} {'chunks/sec':>11} {f'recall@{args.k}':>9}")
+        for backend in available_backends():
+            result = run_backend(backend, portfolio_path, tmp_dir, args.k)
+            print(f"{backend:<24} {result['chunks']:>7} {result['seconds']:>10.2f} "
+                  f"{result['chunks_per_sec']:>11.1f} {result['recall']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Import-time benchmark for ApplyCopilot modules.
+
+Each measurement runs in a fresh interpreter so module caches don't hide the real
+cold-start cost. Run from the project root:
+
+    python benchmarks/import_time.py [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# (label, statement executed after the timer starts)
+CASES = [
+    ("import src.config.settings", "import src.config.settings"),
+    ("import src.core.vector_store", "import src.core.vector_store"),
+    ("import src.core.generator", "import src.core.generator"),
+    ("import src.core.chatbot", "import src.core.chatbot"),
+    ("import src.cli", "import src.cli"),
+    ("construct CoverLetterGenerator", "from src.core.generator import CoverLetterGenerator; CoverLetterGenerator()"),
+    ("import src.ui.gradio_interface", "import src.ui.gradio_interface"),
+]
+
+TIMER_TEMPLATE = """
+import logging, time, warnings
+warnings.simplefilter("ignore")
+logging.disable(logging.INFO)
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, runs: int) -> list:
+    """Run a statement in fresh interpreters and return the elapsed seconds of each run."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER_TEMPLATE.format(statement=statement)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+            env={"OPENAI_API_KEY": "benchmark", "ANTHROPIC_API_KEY": "benchmark", "PATH": ""}
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import/construction times")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<36} {'median (ms)':>12} {'min (ms)':>10}")
+    for label, statement in CASES:
+        timings = measure(statement, args.runs)
+        print(f"{label:<36} {statistics.median(timings) * 1000:>12.1f} {min(timings) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Headless command-line entry point for ApplyCopilot.
+
+Usage:
+    python -m src.cli generate-cover-letter --resume resume.pdf --company "Acme" --title "ML Engineer" --description-file jd.txt
+    python -m src.cli generate-cold-message --resume resume.pdf --company "Acme" --title "ML Engineer" --description-file jd.txt --contact-name "Jane" --contact-position "Tech Lead" --resume-link https://...
+    python -m src.cli index --resume resume.pdf --portfolio portfolio.txt
+    python -m src.cli ask "What is your experience with RAG?"
+    python -m src.cli batch --postings jobs.csv
+
+`index` saves a persistent candidate profile; other subcommands reuse it when --resume is omitted.
+
+Heavy dependencies (LangChain, ReportLab, Gradio) are imported inside each subcommand,
+so only what the subcommand needs is loaded and `--help` starts instantly.
+"""
+
+import argparse
+import logging
+import sys
+
+from src.config.settings import BATCH_MAX_CONCURRENCY, DEFAULT_PROFILE_NAME
+
+
+def _read_description(args: argparse.Namespace) -> str:
+    """Resolve the job description from --description, --description-file or stdin ('-')."""
+    if args.description_file == "-":
+        return sys.stdin.read()
+    if args.description_file:
+        with open(args.description_file, encoding="utf-8") as f:
+            return f.read()
+    if args.description:
+        return args.description
+    raise SystemExit("error: provide --description or --description-file")
+
+
+def _build_generator(args: argparse.Namespace, load_examples: bool = True):
+    """
+    Create a CoverLetterGenerator with the candidate documents loaded.
+
+    Indexes --resume/--portfolio when given, otherwise restores the saved --profile.
+    """
+    from src.core.generator import CoverLetterGenerator
+
+    generator = CoverLetterGenerator()
+    vector_store_manager = generator.vector_store_manager
+
+    if args.resume:
+        vector_store_manager.load_and_index_resume(args.resume)
+        if args.portfolio:
+            vector_store_manager.load_and_index_portfolio(args.portfolio)
+        if load_examples:
+            generator.load_cover_letter_examples()
+        return generator
+
+    from src.core.profile_store import CandidateProfileStore
+
+    if CandidateProfileStore().load(generator, args.profile) is None:
+        raise SystemExit(f"error: no saved profile '{args.profile}'; pass --resume or run `index` first")
+    return generator
+
+
+def cmd_generate_cover_letter(args: argparse.Namespace) -> int:
+    """Generate a cover letter, print it and save it to disk."""
+    job_description = _read_description(args)
+    generator = _build_generator(args)
+
+    cover_letter = generator.generate_cover_letter(
+        job_description=job_description,
+        company_name=args.company,
+        job_title=args.title
+    )
+    file_path = generator.save_cover_letter(
+        cover_letter=cover_letter,
+        company_name=args.company,
+        job_title=args.title,
+        format=args.format
+    )
+
+    print(cover_letter)
+    print(f"\nSaved to: {file_path}", file=sys.stderr)
+    return 0
+
+
+def cmd_generate_cold_message(args: argparse.Namespace) -> int:
+    """Generate a cold message, print it and save it to disk."""
+    job_description = _read_description(args)
+    generator = _build_generator(args)
+
+    cold_message = generator.generate_cold_message(
+        job_description=job_description,
+        company_name=args.company,
+        job_title=args.title,
+        contact_name=args.contact_name,
+        contact_position=args.contact_position,
+        resume_link=args.resume_link
+    )
+    file_path = generator.save_cold_message(
+        cold_message=cold_message,
+        contact_name=args.contact_name,
+        company_name=args.company
+    )
+
+    print(cold_message)
+    print(f"\nSaved to: {file_path}", file=sys.stderr)
+    return 0
+
+
+def cmd_index(args: argparse.Namespace) -> int:
+    """Index a resume (and optional portfolio) into a candidate profile or a vector store directory."""
+    from pathlib import Path
+
+    if not args.resume:
+        raise SystemExit("error: index requires --resume")
+
+    generator = _build_generator(args)
+    vector_store_manager = generator.vector_store_manager
+
+    if args.output:
+        output_dir = Path(args.output)
+        vector_store_manager.save_vector_store(str(output_dir / "resume"), store_type="resume")
+        if args.portfolio:
+            vector_store_manager.save_vector_store(str(output_dir / "portfolio"), store_type="portfolio")
+    else:
+        from src.core.profile_store import CandidateProfileStore
+        output_dir = CandidateProfileStore().save(generator, args.profile)
+
+    stats = vector_store_manager.get_embedding_cache_stats()
+    print(f"Indexed into {output_dir} (embedding cache: {stats['hits']} hits, {stats['misses']} misses)")
+    return 0
+
+
+def cmd_ask(args: argparse.Namespace) -> int:
+    """Answer a single employer question."""
+    from src.core.chatbot import EmployerQAChatbot
+
+    generator = _build_generator(args, load_examples=False)
+    chatbot = EmployerQAChatbot(generator.vector_store_manager, context_service=generator.context_service)
+    if args.company or args.title:
+        job_context = f"Position: {args.title} at {args.company}" if args.title and args.company else f"Position: {args.title or args.company}"
+        job_description = _read_description(args) if (args.description or args.description_file) else ""
+        chatbot.set_job_context(job_context, job_description)
+
+    answer = chatbot.answer_question(args.question, [])
+    print(answer)
+    return 1 if answer.startswith("❌") else 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    """Generate cover letters for every posting in a CSV/JSONL file."""
+    import asyncio
+    from src.core.batch import load_job_postings
+
+    postings = load_job_postings(args.postings)
+    generator = _build_generator(args)
+    manifest = asyncio.run(generator.agenerate_batch(
+        postings,
+        output_formats=args.formats,
+        max_concurrency=args.concurrency,
+        output_dir=args.output
+    ))
+
+    print(f"{manifest['succeeded']}/{manifest['total']} cover letters generated in "
+          f"{manifest['elapsed_seconds']}s. Manifest: {manifest['manifest_path']}")
+    return 0 if manifest["failed"] == 0 else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="ApplyCopilot headless CLI")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show INFO logs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_documents(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument("--resume", help="Path to the resume PDF (default: use the saved --profile)")
+        sub.add_argument("--portfolio", help="Path to the portfolio TXT (optional)")
+        sub.add_argument("--profile", default=DEFAULT_PROFILE_NAME, help="Name of the saved candidate profile")
+
+    def add_job(sub: argparse.ArgumentParser, required: bool = True) -> None:
+        sub.add_argument("--company", required=required, help="Company name")
+        sub.add_argument("--title", required=required, help="Job title")
+        sub.add_argument("--description", help="Job description text")
+        sub.add_argument("--description-file", help="File with the job description ('-' for stdin)")
+
+    cover = subparsers.add_parser("generate-cover-letter", help="Generate a cover letter")
+    add_documents(cover)
+    add_job(cover)
+    cover.add_argument("--format", choices=["txt", "pdf"], default="txt", help="Output format")
+    cover.set_defaults(func=cmd_generate_cover_letter)
+
+    cold = subparsers.add_parser("generate-cold-message", help="Generate a cold outreach message")
+    add_documents(cold)
+    add_job(cold)
+    cold.add_argument("--contact-name", required=True, help="Name of the contact person")
+    cold.add_argument("--contact-position", required=True, help="Position of the contact person")
+    cold.add_argument("--resume-link", required=True, help="Link to the resume")
+    cold.set_defaults(func=cmd_generate_cold_message)
+
+    index = subparsers.add_parser("index", help="Index a resume/portfolio and save them as a candidate profile")
+    add_documents(index)
+    index.add_argument("--output", help="Save raw vector stores to this directory instead of the profile")
+    index.set_defaults(func=cmd_index)
+
+    ask = subparsers.add_parser("ask", help="Answer an employer question")
+    add_documents(ask)
+    add_job(ask, required=False)
+    ask.add_argument("question", help="The employer's question")
+    ask.set_defaults(func=cmd_ask)
+
+    batch = subparsers.add_parser("batch", help="Generate cover letters for a CSV/JSONL of job postings")
+    add_documents(batch)
+    batch.add_argument("--postings", required=True, help="CSV/JSONL with company_name, job_title, job_description")
+    batch.add_argument("--formats", nargs="+", choices=["txt", "pdf"], default=["txt", "pdf"], help="Output formats")
+    batch.add_argument("--concurrency", type=int, default=BATCH_MAX_CONCURRENCY, help="Maximum concurrent LLM calls")
+    batch.add_argument("--output", help="Batch output directory (default: data/output/batch_<timestamp>)")
+    batch.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """CLI entry point."""
+    args = build_parser().parse_args(argv)
+
+    if not args.verbose:
+        # Keep stdout clean for scripting; warnings and errors still show
+        logging.disable(logging.INFO)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,18 +4,12 @@ These templates are flexible to handle both AI Engineer and Data-related roles.
 """
 
 # Cover Letter Generation Prompt
-COVER_LETTER_TEMPLATE = """You are an expert cover letter writer with extensive experience in crafting compelling cover letters for technical positions in both AI/ML engineering and data-related roles.
+# Split into a stable system prefix (instructions; resume and examples are appended as
+# cacheable blocks) and a per-request part (portfolio retrieval + job description), so
+# repeat generations for the same candidate can reuse the provider's prompt cache.
+COVER_LETTER_SYSTEM_TEMPLATE = """You are an expert cover letter writer with extensive experience in crafting compelling cover letters for technical positions in both AI/ML engineering and data-related roles.
 
-Your task is to create a personalized cover letter using the following information:
-
-**Candidate Context (Resume + Portfolio):**
-{context}
-
-**Job Description:**
-{job_description}
-
-**Cover Letter Style Reference:**
-{example_style}
+Your task is to create a personalized cover letter using the candidate's RESUME and the cover letter style reference provided below, together with the relevant PORTFOLIO projects and the job description given in each request.
 
 **Candidate name (use exactly for signature):** {candidate_name}
 
@@ -46,7 +40,20 @@ Your task is to create a personalized cover letter using the following informati
 - Reference 1-2 specific portfolio projects that align with the role
 - Demonstrate enthusiasm for the role and company
 - End with a call to action expressing interest in further discussion
-- Use Indonesian formal business letter style if the examples are in Indonesian, otherwise use English
+- Use Indonesian formal business letter style if the examples are in Indonesian, otherwise use English"""
+
+COVER_LETTER_RESUME_BLOCK = """**Candidate Context (Resume):**
+=== RESUME ===
+{resume}"""
+
+COVER_LETTER_EXAMPLES_BLOCK = """**Cover Letter Style Reference:**
+{example_style}"""
+
+COVER_LETTER_REQUEST_TEMPLATE = """**Candidate Context (Portfolio):**
+{portfolio_context}
+
+**Job Description:**
+{job_description}
 
 Generate the complete cover letter following these guidelines:"""
 
@@ -137,17 +144,36 @@ You have access to Cikal's resume (full text) and portfolio (relevant projects v
 Always represent Cikal's interests professionally and accurately, while emphasizing his fit for the {job_title} position at {company_name}."""
 
 
-def get_cover_letter_prompt(max_words: int = 500) -> str:
+def get_cover_letter_system_prompt(candidate_name: str, max_words: int = 500) -> str:
     """
-    Get the cover letter generation prompt template.
+    Get the stable cover letter system prompt (instructions only).
     
     Args:
+        candidate_name: Full name of the candidate
         max_words: Maximum word count for the cover letter
     
     Returns:
-        Formatted prompt template
+        Formatted system prompt
     """
-    return COVER_LETTER_TEMPLATE.replace("{max_words}", str(max_words))
+    return COVER_LETTER_SYSTEM_TEMPLATE.replace("{max_words}", str(max_words)).replace(
+        "{candidate_name}", candidate_name)
+
+
+def get_cover_letter_request(portfolio_context: str, job_description: str) -> str:
+    """
+    Get the per-request part of the cover letter prompt.
+    
+    Args:
+        portfolio_context: Portfolio chunks retrieved for the job (may be empty)
+        job_description: Full job description text
+    
+    Returns:
+        Formatted request prompt
+    """
+    return COVER_LETTER_REQUEST_TEMPLATE.format(
+        portfolio_context=portfolio_context or "No portfolio provided.",
+        job_description=job_description
+    )
 
 
 def get_employer_qa_system_prompt(job_context: str = None, job_description: str = None) -> str:
@@ -189,6 +215,37 @@ def get_employer_qa_system_prompt(job_context: str = None, job_description: str
         return EMPLOYER_QA_SYSTEM_PROMPT_BASE
 
 
+# Rolling summary of older employer Q&A turns
+CHAT_SUMMARY_TEMPLATE = """You maintain a running summary of a conversation between an employer/recruiter and an AI assistant answering on behalf of a job candidate.
+
+**Summary So Far:**
+{previous_summary}
+
+**New Conversation Turns:**
+{transcript}
+
+Update the summary so it covers both the summary so far and the new turns. Keep the employer's questions, the key facts and claims given in the answers, and any preferences or follow-ups the employer mentioned. Write plain prose in at most {max_words} words. Return only the updated summary."""
+
+
+def get_chat_summary_prompt(previous_summary: str, transcript: str, max_words: int) -> str:
+    """
+    Get the prompt that folds new conversation turns into the running summary.
+    
+    Args:
+        previous_summary: Summary of the turns folded so far (may be empty)
+        transcript: The turns to fold in, as "Employer:/Assistant:" lines
+        max_words: Maximum length of the updated summary
+    
+    Returns:
+        Formatted prompt
+    """
+    return CHAT_SUMMARY_TEMPLATE.format(
+        previous_summary=previous_summary or "(none yet)",
+        transcript=transcript,
+        max_words=max_words
+    )
+
+
 # Cold Message / Outreach Message Prompt
 COLD_MESSAGE_TEMPLATE = """You are an expert at writing concise, engaging cold messages and LinkedIn connection requests for job seekers in technical fields.
 
@@ -11,14 +11,41 @@ COVER_LETTER_EXAMPLES_DIR = DATA_DIR / "cover_letter_examples"
 VECTOR_STORES_DIR = DATA_DIR / "vector_stores"
 OUTPUT_DIR = DATA_DIR / "output"
 
-# Ensure directories exist
-for directory in [DATA_DIR, RESUMES_DIR, COVER_LETTER_EXAMPLES_DIR, VECTOR_STORES_DIR, OUTPUT_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+
+def ensure_data_dirs() -> None:
+    """Create the data directories (called by entry points, not at import time)."""
+    for directory in [DATA_DIR, RESUMES_DIR, COVER_LETTER_EXAMPLES_DIR, VECTOR_STORES_DIR, OUTPUT_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+# Persistent candidate profile settings
+PROFILES_DIR = VECTOR_STORES_DIR / "profiles"
+DEFAULT_PROFILE_NAME = "default"  # Profile used by the CLI when --profile is omitted
+# Opt-in UI persistence for single-owner deployments: UI sessions save to and restore this profile.
+# Leave unset on shared deployments, otherwise every visitor would load the last visitor's documents.
+UI_PROFILE_NAME = os.getenv("UI_PROFILE_NAME") or None
 
 # Model settings
-EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai")  # "openai", "hashing" (no embedding API or model) or "sentence-transformers" (local CPU)
+EMBEDDING_MODEL = "text-embedding-3-small"  # OpenAI embeddings model
+LOCAL_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"  # Used by the sentence-transformers backend
+HASHING_EMBEDDING_DIM = 1024  # Vector size of the hashing backend
+EMBEDDING_BATCH_SIZE = 64  # Max texts per embedding request during indexing (and per local inference batch)
 LLM_MODEL = "claude-sonnet-4-6"  # Anthropic Claude Sonnet 4.6
 
+# Embedding cache settings (persistent, keyed by model + chunk text hash)
+EMBEDDING_CACHE_PATH = VECTOR_STORES_DIR / "embedding_cache.sqlite3"
+EMBEDDING_CACHE_MAX_ENTRIES = 50000  # Least recently used entries are evicted beyond this
+EMBEDDING_CACHE_BUSY_TIMEOUT_SECONDS = 15  # Wait this long for another session's write lock on the cache
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 256  # In-memory LRU of query embeddings (job descriptions, questions)
+
+# Embedding pipeline settings (indexing)
+EMBEDDING_BATCH_MAX_TOKENS = 8000  # Max tokens per embedding request (chunks are packed up to this)
+EMBEDDING_MAX_CONCURRENCY = 4  # Concurrent embedding requests
+EMBEDDING_MAX_RETRIES = 5  # Retries per request on rate limits / connection errors
+EMBEDDING_BACKOFF_BASE_SECONDS = 1.0  # Exponential backoff base (doubles per retry, plus jitter)
+EMBEDDING_BACKOFF_MAX_SECONDS = 30.0
+
 # Vector store settings - Optimized for Portfolio RAG
 CHUNK_SIZE = 800  # Increased for larger semantic units in portfolio
 CHUNK_OVERLAP = 100  # Increased overlap for better context continuity
@@ -27,15 +54,71 @@ TOP_K_RESULTS = 5  # Increased to get more relevant project details
 # Resume context settings (no RAG for resume - direct injection)
 MAX_RESUME_LENGTH_FOR_DIRECT = 3000  # If resume < this chars, use direct injection
 
+# PDF parsing settings
+PDF_PARSE_MAX_WORKERS = min(4, os.cpu_count() or 1)  # Worker processes for parsing many PDFs at once
+PDF_PARSE_PARALLEL_MIN_FILES = 4  # Below this many uncached files, parse in-process (pool startup costs more)
+PDF_PARSE_CACHE_MAX_ENTRIES = 512  # Parsed-text cache entries, keyed by file content hash
+
 # Portfolio settings
 PORTFOLIO_CHUNK_SIZE = 1000
 PORTFOLIO_CHUNK_OVERLAP = 150
-PORTFOLIO_TOP_K = 8  # Get more results for comprehensive portfolio coverage
+PORTFOLIO_TOP_K = 5  # Hybrid (BM25 + vector) retrieval ranks precisely enough for fewer chunks
+HYBRID_CANDIDATES = 20  # Candidates taken from each retriever before rank fusion
+RRF_K = 60  # Reciprocal rank fusion constant
+BM25_K1 = 1.5  # BM25 term frequency saturation
+BM25_B = 0.75  # BM25 document length normalization
+RETRIEVAL_CACHE_MAX_ENTRIES = 128  # Retrieval results cached per (store, query hash, k, index version)
 
 # Cover letter settings
 MAX_WORDS = 500
+EXAMPLES_TOP_N = 3  # Most relevant example letters included per prompt
 CANDIDATE_NAME = "Muhammad Cikal Merdeka"
 
+# Context token budgets per prompt section (lowest-ranked pieces are dropped first)
+RESUME_TOKEN_BUDGET = 4000  # Resume is trimmed from the end beyond this
+PORTFOLIO_TOKEN_BUDGET = 2500  # Lowest-similarity portfolio chunks are dropped beyond this
+EXAMPLES_TOKEN_BUDGET = 2500  # Token budget for the examples block
+HISTORY_TOKEN_BUDGET = 3000  # Oldest chat turns are dropped beyond this
+
+# Employer Q&A history settings
+CHAT_HISTORY_KEEP_TURNS = 6  # Most recent question/answer turns replayed verbatim
+CHAT_HISTORY_FOLD_TURNS = 4  # Older turns are folded into the summary in blocks of this many (one LLM call per block)
+CHAT_SUMMARY_TOKEN_BUDGET = 400  # Max tokens of the running summary of folded turns
+SEEN_PORTFOLIO_TOKEN_BUDGET = 4000  # Portfolio chunks already shown stay in the conversation prefix (oldest dropped beyond this)
+CHAT_MAX_STORED_MESSAGES = 100  # Server-side messages kept per conversation (oldest, normally already summarized, dropped first)
+
+# Employer Q&A answer cache (near-duplicate questions for the same profile and job)
+ANSWER_CACHE_SIMILARITY_THRESHOLD = 0.92  # Minimum cosine similarity between questions for a hit
+ANSWER_CACHE_TTL_SECONDS = 24 * 60 * 60  # Cached answers expire after a day
+ANSWER_CACHE_MAX_ENTRIES = 256  # Least recently used answers are evicted beyond this
+
+# Common employer questions, shown as examples in the Q&A tab and answered in the background
+# whenever the resume, portfolio or job details change (served instantly from the answer cache)
+FAQ_QUESTIONS = [
+    "Can you tell me about your experience with machine learning?",
+    "What projects have you worked on related to data analysis?",
+    "Are you familiar with Python and its data science libraries?",
+    "What is your experience with cloud platforms like AWS or GCP?",
+    "Can you describe a challenging technical problem you've solved?",
+    "What is your educational background?",
+    "Are you comfortable working in a team environment?",
+    "What are your salary expectations?",
+    "When would you be available to start?",
+]
+FAQ_PRECOMPUTE_ENABLED = True  # Set to False to skip background pre-generation (saves LLM calls)
+FAQ_MAX_CONCURRENCY = 3  # Concurrent LLM calls while pre-generating FAQ answers
+
+# Batch generation settings
+BATCH_MAX_CONCURRENCY = 5  # Concurrent LLM calls per batch
+BATCH_MAX_RETRIES = 5  # Retries per posting on rate limits / overloaded API
+BATCH_BACKOFF_BASE_SECONDS = 2.0  # Exponential backoff base (doubles per retry, plus jitter)
+BATCH_BACKOFF_MAX_SECONDS = 60.0
+
+# UI settings
+UI_CONCURRENCY_LIMIT = 32  # Max concurrent events per Gradio handler (handlers are async)
+SESSION_IDLE_TIMEOUT_SECONDS = 3600  # Evict browser sessions idle for longer than this
+MAX_SESSIONS = 200  # Cap on in-memory sessions; least recently active are evicted first
+
 # Contact Links
 RESUME_AI_LINK = "https://drive.google.com/file/d/1ie89a22v7E1iMEglhj9KXBgu72YSq2K2/view?usp=sharing"
 RESUME_DATA_LINK = "https://drive.google.com/file/d/14vDbB6alxpNIlo266OStm0lHaqusHsxc/view?usp=sharing"
@@ -0,0 +1,161 @@
+"""
+Semantic answer cache for the ApplyCopilot employer Q&A chatbot.
+Recruiters ask the same few questions again and again; answers are cached per
+(candidate profile version, job context) and served for any question whose embedding
+is close enough to a cached question, until the entry expires.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.config.logging_config import setup_logger
+from src.config.settings import (ANSWER_CACHE_SIMILARITY_THRESHOLD, ANSWER_CACHE_TTL_SECONDS,
+                                 ANSWER_CACHE_MAX_ENTRIES)
+
+logger = setup_logger(__name__)
+
+
+def job_context_hash(job_context: Optional[str], job_description: Optional[str]) -> str:
+    """
+    Hash the job context an answer was generated for.
+
+    Args:
+        job_context: Position string (e.g. "Position: ML Engineer at Acme"), may be None
+        job_description: Job description text, may be None
+
+    Returns:
+        Hex digest (the same for "no job context")
+    """
+    return hashlib.sha256(f"{job_context or ''}\x00{job_description or ''}".encode("utf-8")).hexdigest()
+
+
+class SemanticAnswerCache:
+    """Answers keyed by (profile version, job hash) and matched by question similarity."""
+
+    def __init__(self, threshold: float = ANSWER_CACHE_SIMILARITY_THRESHOLD,
+                 ttl_seconds: float = ANSWER_CACHE_TTL_SECONDS,
+                 max_entries: int = ANSWER_CACHE_MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            threshold: Minimum cosine similarity between questions for a hit
+            ttl_seconds: Seconds an answer stays valid
+            max_entries: Maximum cached answers (least recently used evicted first)
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(vector: List[float]):
+        """Convert a vector to a unit-length float32 array."""
+        import numpy as np
+
+        array = np.asarray(vector, dtype="float32")
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _drop_expired(self, now: float) -> None:
+        """Remove expired entries (caller holds the lock)."""
+        expired = [entry_id for entry_id, entry in self._entries.items() if entry["expires_at"] <= now]
+        for entry_id in expired:
+            del self._entries[entry_id]
+
+    def lookup(self, question_vector: List[float], profile_version: Tuple[int, ...],
+               job_hash: str, record_stats: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a near-duplicate question.
+
+        Args:
+            question_vector: Embedding of the new question
+            profile_version: Version of the candidate's indexed documents
+            job_hash: job_context_hash() of the current job context
+            record_stats: Count the lookup in the hit/miss metrics (off for internal checks)
+
+        Returns:
+            Dictionary with question, answer and similarity, or None on a miss
+        """
+        query = self._unit(question_vector)
+        now = time.time()
+
+        with self._lock:
+            self._drop_expired(now)
+            best_id, best_score = None, self.threshold
+            for entry_id, entry in self._entries.items():
+                if entry["profile_version"] != profile_version or entry["job_hash"] != job_hash:
+                    continue
+                if entry["vector"].shape != query.shape:
+                    continue
+                score = float(entry["vector"] @ query)
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                if record_stats:
+                    self.misses += 1
+                return None
+
+            if record_stats:
+                self.hits += 1
+            self._entries.move_to_end(best_id)
+            entry = self._entries[best_id]
+
+        logger.info(f"Answer cache hit (similarity {best_score:.3f}): {entry['question'][:80]}")
+        return {"question": entry["question"], "answer": entry["answer"], "similarity": best_score}
+
+    def store(self, question: str, question_vector: List[float], answer: str,
+              profile_version: Tuple[int, ...], job_hash: str) -> None:
+        """
+        Cache an answer.
+
+        Args:
+            question: The question that was answered
+            question_vector: Embedding of the question
+            answer: The generated answer
+            profile_version: Version of the candidate's indexed documents
+            job_hash: job_context_hash() of the job context used
+        """
+        entry = {
+            "question": question,
+            "vector": self._unit(question_vector),
+            "answer": answer,
+            "profile_version": profile_version,
+            "job_hash": job_hash,
+            "expires_at": time.time() + self.ttl_seconds
+        }
+
+        with self._lock:
+            self._entries[self._next_id] = entry
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and number of cached answers
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries)
+            }
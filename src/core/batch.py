@@ -0,0 +1,95 @@
+"""
+Batch helpers for ApplyCopilot.
+Reads job postings from CSV/JSONL files and writes batch manifests.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import List, Dict, Any
+
+from src.config.logging_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# Accepted column names for each posting field (first match wins)
+POSTING_FIELDS = {
+    "company_name": ["company_name", "company"],
+    "job_title": ["job_title", "title", "position"],
+    "job_description": ["job_description", "description"],
+}
+
+
+def _normalize_posting(row: Dict[str, Any], row_number: int) -> Dict[str, str]:
+    """
+    Map a raw CSV/JSONL row onto the posting fields.
+
+    Args:
+        row: Raw row dictionary
+        row_number: 1-based row number (for error messages)
+
+    Returns:
+        Dictionary with company_name, job_title and job_description
+    """
+    lowered = {str(key).strip().lower(): value for key, value in row.items() if key is not None}
+    posting = {}
+    for field, aliases in POSTING_FIELDS.items():
+        value = next((lowered[alias] for alias in aliases if lowered.get(alias)), "")
+        posting[field] = str(value).strip()
+
+    missing = [field for field, value in posting.items() if not value]
+    if missing:
+        raise ValueError(f"Row {row_number} is missing required fields: {', '.join(missing)}")
+
+    return posting
+
+
+def load_job_postings(postings_path: str) -> List[Dict[str, str]]:
+    """
+    Load job postings from a CSV or JSONL file.
+
+    Each row needs a company (company_name/company), a title (job_title/title/position)
+    and a description (job_description/description).
+
+    Args:
+        postings_path: Path to a .csv or .jsonl file
+
+    Returns:
+        List of posting dictionaries
+    """
+    path = Path(postings_path)
+    suffix = path.suffix.lower()
+    postings = []
+
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row_number, row in enumerate(csv.DictReader(f), start=1):
+                postings.append(_normalize_posting(row, row_number))
+    elif suffix in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for row_number, line in enumerate(f, start=1):
+                if line.strip():
+                    postings.append(_normalize_posting(json.loads(line), row_number))
+    else:
+        raise ValueError(f"Unsupported postings file type: {suffix} (use .csv or .jsonl)")
+
+    logger.info(f"Loaded {len(postings)} job postings from {path}")
+    return postings
+
+
+def write_manifest(manifest: Dict[str, Any], output_dir: Path) -> str:
+    """
+    Write a batch manifest as JSON.
+
+    Args:
+        manifest: Manifest dictionary (summary + per-posting results)
+        output_dir: Directory of the batch outputs
+
+    Returns:
+        Path to the manifest file
+    """
+    manifest_path = Path(output_dir) / "manifest.json"
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    logger.info(f"Batch manifest saved to: {manifest_path}")
+    return str(manifest_path)
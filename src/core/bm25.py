@@ -0,0 +1,145 @@
+"""
+Keyword retrieval for ApplyCopilot.
+An incrementally updated in-memory BM25 inverted index, plus reciprocal rank fusion
+to merge its ranking with dense (FAISS) results. Exact tech-stack terms from a job
+description ("LangGraph", "dbt") match even when their embeddings are not close.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import List, Dict, Tuple, Iterable
+
+from src.config.settings import BM25_K1, BM25_B, RRF_K
+
+# Keeps tech tokens like "c++", "c#", "node.js" and "scikit-learn" intact
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will "
+    "with we you your our they their who what which how i me my".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase a text and split it into keyword terms (stopwords removed)."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """In-memory BM25 inverted index supporting incremental adds and removals."""
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}  # term -> {doc id: term frequency}
+        self._doc_terms: Dict[str, Counter] = {}  # doc id -> term frequencies
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, doc_id: str, text: str) -> None:
+        """
+        Index a document (replacing any document with the same id).
+
+        Args:
+            doc_id: Document id
+            text: Document text
+        """
+        terms = Counter(tokenize(text))
+        with self._lock:
+            self._remove(doc_id)
+            self._doc_terms[doc_id] = terms
+            self._doc_lengths[doc_id] = sum(terms.values())
+            self._total_length += self._doc_lengths[doc_id]
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, {})[doc_id] = frequency
+
+    def add_many(self, documents: Iterable[Tuple[str, str]]) -> None:
+        """Index (doc id, text) pairs."""
+        for doc_id, text in documents:
+            self.add(doc_id, text)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index (no-op if absent)."""
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: str) -> None:
+        """Remove a document; the caller holds the lock."""
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0
+
+    def search(self, query: str, k: int) -> List[Tuple[str, float]]:
+        """
+        Rank documents by BM25 score for a query.
+
+        Args:
+            query: Query text (repeated terms count once)
+            k: Maximum number of results
+
+        Returns:
+            List of (doc id, score), best first; documents sharing no term are omitted
+        """
+        query_terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._doc_terms)
+            if not doc_count or not query_terms:
+                return []
+
+            average_length = self._total_length / doc_count
+            scores: Dict[str, float] = {}
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = RRF_K) -> List[str]:
+    """
+    Fuse ranked id lists with reciprocal rank fusion (score = sum of 1 / (k + rank)).
+
+    Args:
+        rankings: Ranked lists of ids, best first
+        k: RRF constant (larger values flatten the rank differences)
+
+    Returns:
+        Ids ordered by fused score (ties keep first-seen order)
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=lambda doc_id: scores[doc_id], reverse=True)
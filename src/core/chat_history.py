@@ -0,0 +1,261 @@
+"""
+Rolling chat history for the ApplyCopilot employer Q&A chatbot.
+Keeps the most recent turns verbatim and folds older turns into a running summary.
+Folding is incremental: each evicted block of turns is summarized once, together with
+the previous summary, so the prompt stays the same size however long the conversation gets.
+SeenChunkTracker remembers which portfolio chunks a conversation has already been shown,
+and ConversationStore keeps the conversation itself server-side.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.config.logging_config import setup_logger
+from src.config.settings import (CHAT_HISTORY_KEEP_TURNS, CHAT_HISTORY_FOLD_TURNS, CHAT_SUMMARY_TOKEN_BUDGET,
+                                 SEEN_PORTFOLIO_TOKEN_BUDGET, CHAT_MAX_STORED_MESSAGES)
+from src.config.prompts import get_chat_summary_prompt
+from src.core.tokens import count_tokens, truncate_to_tokens
+from src.core.usage import UsageTracker
+
+logger = setup_logger(__name__)
+
+
+class ChatHistoryManager:
+    """Rolling window of recent turns plus an incrementally updated summary of older turns."""
+
+    def __init__(self, keep_turns: int = CHAT_HISTORY_KEEP_TURNS, fold_turns: int = CHAT_HISTORY_FOLD_TURNS,
+                 summary_token_budget: int = CHAT_SUMMARY_TOKEN_BUDGET):
+        """
+        Initialize the history manager.
+
+        Args:
+            keep_turns: Most recent turns (user message + replies) always kept verbatim
+            fold_turns: Older turns are folded into the summary once this many have accumulated
+            summary_token_budget: Maximum tokens of the summary
+        """
+        self.keep_turns = keep_turns
+        self.fold_turns = max(1, fold_turns)
+        self.summary_token_budget = summary_token_budget
+        self.usage = UsageTracker("chat_summary")
+        self.summary = ""
+        self._folded = 0  # Number of leading history messages covered by the summary
+        self._folded_digest = self._digest([])
+
+    @property
+    def folded_count(self) -> int:
+        """Number of leading history messages covered by the summary."""
+        return self._folded
+
+    def reset(self) -> None:
+        """Forget the summary (e.g. when the conversation is cleared)."""
+        self.summary = ""
+        self._folded = 0
+        self._folded_digest = self._digest([])
+
+    def drop_prefix(self, count: int, history: List[Dict[str, Any]]) -> None:
+        """
+        Account for the oldest messages being dropped from the stored conversation.
+
+        Args:
+            count: Number of messages removed from the front
+            history: The conversation after the removal
+        """
+        self._folded = max(0, self._folded - count)
+        self._folded_digest = self._digest(history[:self._folded])
+
+    @staticmethod
+    def _digest(messages: List[Dict[str, Any]]) -> str:
+        """Fingerprint a list of messages (to detect a different conversation)."""
+        digest = hashlib.sha256()
+        for msg in messages:
+            digest.update(f"{msg.get('role', '')}\x00{msg.get('content', '')}\x01".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _plan(self, history: List[Dict[str, Any]]) -> Optional[Tuple[int, int]]:
+        """
+        Decide which messages to fold next.
+
+        Returns:
+            (start, end) slice of history to fold, or None if nothing is due
+        """
+        if self._folded > len(history) or self._digest(history[:self._folded]) != self._folded_digest:
+            logger.info("Chat history does not extend the summarized conversation, resetting summary")
+            self.reset()
+
+        turn_starts = [i for i, msg in enumerate(history) if msg.get("role") == "user" and i >= self._folded]
+        evictable = len(turn_starts) - self.keep_turns
+        if evictable < self.fold_turns:
+            return None
+        return self._folded, turn_starts[evictable]
+
+    @staticmethod
+    def _transcript(messages: List[Dict[str, Any]]) -> str:
+        """Render messages as an Employer/Assistant transcript."""
+        speakers = {"user": "Employer", "assistant": "Assistant"}
+        return "\n".join(
+            f"{speakers[msg['role']]}: {msg.get('content', '')}" for msg in messages if msg.get("role") in speakers
+        )
+
+    def _summary_messages(self, messages: List[Dict[str, Any]]) -> list:
+        """Build the LLM messages that fold `messages` into the running summary."""
+        from langchain_core.messages import HumanMessage
+
+        prompt = get_chat_summary_prompt(
+            previous_summary=self.summary,
+            transcript=self._transcript(messages),
+            max_words=int(self.summary_token_budget * 0.75)
+        )
+        return [HumanMessage(content=prompt)]
+
+    def _apply_fold(self, history: List[Dict[str, Any]], end: int, summary: str) -> None:
+        """Record a new summary covering history[:end]."""
+        self.summary = truncate_to_tokens(summary.strip(), self.summary_token_budget)
+        self._folded = end
+        self._folded_digest = self._digest(history[:end])
+        logger.info(f"Folded chat history into summary: {end} messages covered, "
+                    f"summary {count_tokens(self.summary)} tokens")
+
+    def _result(self, history: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Split the history into (summary, messages not covered by it)."""
+        return self.summary, history[self._folded:]
+
+    def prepare(self, history: List[Dict[str, Any]], llm) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Fold evicted turns into the summary if due, and split the history for the prompt.
+
+        A failed summarization is logged and retried on the next turn; meanwhile the
+        unfolded turns stay in the verbatim part (which is still token-budgeted).
+
+        Args:
+            history: Full conversation so far (OpenAI-style message dicts)
+            llm: Chat model used to summarize
+
+        Returns:
+            Tuple of (summary of older turns, recent messages to replay verbatim)
+        """
+        plan = self._plan(history)
+        if plan is not None:
+            start, end = plan
+            try:
+                response = llm.invoke(self._summary_messages(history[start:end]))
+                self.usage.record(response.usage_metadata)
+                self._apply_fold(history, end, response.content)
+            except Exception as e:
+                logger.warning(f"Could not summarize chat history, keeping turns verbatim: {str(e)}")
+        return self._result(history)
+
+    async def aprepare(self, history: List[Dict[str, Any]], llm) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Asynchronously fold evicted turns into the summary if due, and split the history.
+
+        Args:
+            history: Full conversation so far (OpenAI-style message dicts)
+            llm: Chat model used to summarize
+
+        Returns:
+            Tuple of (summary of older turns, recent messages to replay verbatim)
+        """
+        plan = self._plan(history)
+        if plan is not None:
+            start, end = plan
+            try:
+                response = await llm.ainvoke(self._summary_messages(history[start:end]))
+                self.usage.record(response.usage_metadata)
+                self._apply_fold(history, end, response.content)
+            except Exception as e:
+                logger.warning(f"Could not summarize chat history, keeping turns verbatim: {str(e)}")
+        return self._result(history)
+
+
+class SeenChunkTracker:
+    """Portfolio chunks already shown in a conversation, in the order they were first shown."""
+
+    def __init__(self, token_budget: int = SEEN_PORTFOLIO_TOKEN_BUDGET):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            token_budget: Maximum tokens of shown chunks to keep (oldest forgotten first)
+        """
+        self.token_budget = token_budget
+        self._shown: "OrderedDict[str, str]" = OrderedDict()  # Chunk id -> chunk text
+        self._tokens = 0
+
+    @staticmethod
+    def chunk_id(chunk: str) -> str:
+        """Content id of a chunk."""
+        return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+    def reset(self) -> None:
+        """Forget all shown chunks (new conversation)."""
+        self._shown.clear()
+        self._tokens = 0
+
+    def shown_chunks(self) -> List[str]:
+        """Chunks shown so far, oldest first (append-only until the budget is exceeded)."""
+        return list(self._shown.values())
+
+    def unseen(self, chunks: List[str]) -> List[str]:
+        """Filter chunks down to those not shown yet, keeping their order."""
+        return [chunk for chunk in chunks if self.chunk_id(chunk) not in self._shown]
+
+    def mark_shown(self, chunks: List[str]) -> None:
+        """
+        Record chunks as shown, forgetting the oldest ones beyond the token budget.
+
+        Args:
+            chunks: Chunks included in the current turn
+        """
+        for chunk in chunks:
+            chunk_id = self.chunk_id(chunk)
+            if chunk_id not in self._shown:
+                self._shown[chunk_id] = chunk
+                self._tokens += count_tokens(chunk)
+
+        while self._tokens > self.token_budget and len(self._shown) > 1:
+            _, oldest = self._shown.popitem(last=False)
+            self._tokens -= count_tokens(oldest)
+
+
+class ConversationStore:
+    """Append-only, size-bounded conversation kept on the server as (role, content) tuples."""
+
+    def __init__(self, max_messages: int = CHAT_MAX_STORED_MESSAGES):
+        """
+        Initialize an empty conversation.
+
+        Args:
+            max_messages: Messages kept before the oldest are dropped
+        """
+        self.max_messages = max_messages
+        self._messages: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def append(self, role: str, content: str) -> int:
+        """
+        Append a message, dropping the oldest messages beyond max_messages.
+
+        Args:
+            role: "user" or "assistant"
+            content: Message text
+
+        Returns:
+            Number of messages dropped from the front
+        """
+        self._messages.append((role, content))
+        overflow = len(self._messages) - self.max_messages
+        if overflow <= 0:
+            return 0
+        del self._messages[:overflow]
+        return overflow
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        self._messages.clear()
+
+    def as_dicts(self) -> List[Dict[str, str]]:
+        """The conversation as OpenAI-style message dicts, oldest first."""
+        return [{"role": role, "content": content} for role, content in self._messages]
@@ -4,32 +4,47 @@ Handles conversations with employers/recruiters based on indexed resume and port
 Uses hybrid approach: Resume (direct injection) + Portfolio (RAG)
 """
 
-from typing import List, Dict, Any, Optional
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, AsyncIterator, Sequence, Tuple
 
 from src.config.logging_config import setup_logger
-from src.config.settings import LLM_MODEL, CANDIDATE_NAME
+from src.config.settings import LLM_MODEL, CANDIDATE_NAME, FAQ_MAX_CONCURRENCY
 from src.config.prompts import get_employer_qa_system_prompt
+from src.core.usage import UsageTracker, cached_text_block, merge_usage
+from src.core.context import ContextService
+from src.core.chat_history import ChatHistoryManager, SeenChunkTracker, ConversationStore
+from src.core.answer_cache import SemanticAnswerCache, job_context_hash
 
 logger = setup_logger(__name__)
 
+NO_RESUME_MESSAGE = "❌ Error: No resume indexed yet. Please index a resume first before using the chatbot."
+
 
 class EmployerQAChatbot:
     """Chatbot for answering employer questions based on resume (direct) and portfolio (RAG)."""
     
-    def __init__(self, vector_store_manager, llm_model: str = LLM_MODEL):
+    def __init__(self, vector_store_manager, llm_model: str = LLM_MODEL,
+                 context_service: Optional[ContextService] = None):
         """
         Initialize the employer Q&A chatbot.
         
         Args:
             vector_store_manager: VectorStoreManager instance with loaded resume/portfolio
             llm_model: LLM model name to use
+            context_service: ContextService to share with the generator (created if not given)
         """
-        self.llm = ChatAnthropic(model=llm_model, temperature=0.7)
+        self.llm_model = llm_model
+        self._llm = None  # Created on first use
         self.vector_store_manager = vector_store_manager
-        self.chat_history: List[Dict[str, str]] = []
+        self.chat_history = ConversationStore()  # Server-side conversation for reply()/astream_reply()
         self.candidate_name = CANDIDATE_NAME
+        self.usage = UsageTracker("employer_qa")
+        self.context_service = context_service or ContextService(vector_store_manager)
+        self.history_manager = ChatHistoryManager()  # Recent turns verbatim, older turns summarized
+        self.seen_chunks = SeenChunkTracker()  # Portfolio chunks this conversation has already been shown
+        self.answer_cache = SemanticAnswerCache()  # Answers to near-duplicate questions per profile/job
+        self.record_cache_stats = True  # Off for background FAQ workers, so metrics reflect real questions
         
         # Job context (optional, for more contextual answers)
         self.job_context: Optional[str] = None
@@ -37,6 +52,18 @@ class EmployerQAChatbot:
         
         logger.info(f"Initialized EmployerQAChatbot with LLM model: {llm_model}")
     
+    @property
+    def llm(self):
+        """Anthropic chat model, constructed on first use to keep construction cheap."""
+        if self._llm is None:
+            from langchain_anthropic import ChatAnthropic
+            self._llm = ChatAnthropic(model=self.llm_model, temperature=0.7)
+        return self._llm
+    
+    @llm.setter
+    def llm(self, llm) -> None:
+        self._llm = llm
+    
     def set_job_context(self, job_context: str, job_description: str = "") -> None:
         """
         Set job context for more contextual answers.
@@ -57,41 +84,323 @@ class EmployerQAChatbot:
     
     def clear_history(self) -> None:
         """Clear the chat history."""
-        self.chat_history = []
+        self.chat_history.clear()
+        self.history_manager.reset()
+        self.seen_chunks.reset()
         logger.info("Chat history cleared")
     
     def get_chat_history(self) -> List[Dict[str, str]]:
-        """Get the current chat history."""
-        return self.chat_history.copy()
+        """Get the current (server-side) chat history as OpenAI-style message dicts."""
+        return self.chat_history.as_dicts()
     
-    def _build_context(self, question: str) -> str:
+    def _record_turn(self, question: str, answer: str) -> None:
+        """Append a question/answer pair to the server-side history, applying its retention bound."""
+        dropped = self.chat_history.append("user", question) + self.chat_history.append("assistant", answer)
+        if dropped:
+            self.history_manager.drop_prefix(dropped, self.chat_history.as_dicts())
+            logger.info(f"Dropped {dropped} oldest stored chat messages")
+    
+    def _build_messages(self, question: str, history: List[Dict[str, Any]], portfolio_chunks: List[str],
+                        history_summary: str = "") -> Tuple[list, List[str]]:
         """
-        Build context using hybrid approach:
-        - Resume: Direct injection (full text, no RAG)
-        - Portfolio: RAG retrieval (if available)
+        Prepare the LLM messages: cached system prefix, previous turns and the current question.
+        
+        The system prompt and full resume form a stable prefix marked with an Anthropic
+        cache-control breakpoint, so each turn reads the resume from the prompt cache
+        instead of resending it inside the question. Portfolio chunks shown in earlier turns
+        follow as a second, append-only cached block; the question only carries chunks the
+        conversation has not seen yet. Those are returned rather than recorded, so the caller
+        marks them as seen only once the LLM call succeeded. The summary of older turns comes last. Resume, portfolio and history are each fitted into their token budgets.
         
         Args:
-            question: The employer's question for portfolio retrieval
-            
+            question: The employer's question
+            history: Recent messages in OpenAI format (older ones are in history_summary)
+            portfolio_chunks: Portfolio chunks retrieved for the question, most relevant first (may be empty)
+            history_summary: Running summary of the turns before history (may be empty)
+        
         Returns:
-            Combined context string
+            Tuple of (messages for the LLM, new portfolio chunks included in the question)
         """
-        context_parts = []
+        from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+        
+        # Get system prompt with optional job context
+        system_prompt = get_employer_qa_system_prompt(
+            job_context=self.job_context,
+            job_description=self.job_description
+        )
+        system_blocks = [{"type": "text", "text": system_prompt}]
         
-        # 1. Add resume context (always direct injection)
-        if self.vector_store_manager.has_resume():
-            resume_context = self.vector_store_manager.get_resume_context(use_rag=False)
-            context_parts.append("=== RESUME ===\n" + resume_context)
+        if not history:
+            self.seen_chunks.reset()  # New conversation
+        shown_chunks = self.seen_chunks.shown_chunks()
+        
+        context = self.context_service.assemble(
+            portfolio_chunks=self.seen_chunks.unseen(portfolio_chunks), history=history, label="employer_qa"
+        )
+        portfolio_context = context["portfolio"]
+        
+        # Add resume context (always direct injection) as the cached part of the prefix
+        if context["resume"] is not None:
+            resume_context = context["resume"]
+            system_blocks.append(cached_text_block(
+                "**Candidate Context (Resume):**\n=== RESUME ===\n" + resume_context
+            ))
             logger.info(f"Added resume context to chat ({len(resume_context)} chars)")
         
-        # 2. Add portfolio context via RAG (if available)
-        if self.vector_store_manager.has_portfolio():
-            portfolio_context = self.vector_store_manager.get_portfolio_context(question)
-            if portfolio_context:
-                context_parts.append("\n\n=== RELEVANT PROJECTS FROM PORTFOLIO ===\n" + portfolio_context)
-                logger.info(f"Added portfolio context to chat via RAG ({len(portfolio_context)} chars)")
+        if shown_chunks:
+            system_blocks.append(cached_text_block(
+                "**Candidate Context (Portfolio, shown earlier in this conversation):**\n"
+                "=== PREVIOUSLY SHOWN PROJECTS FROM PORTFOLIO ===\n" + "\n\n".join(shown_chunks)
+            ))
+            logger.info(f"Reusing {len(shown_chunks)} previously shown portfolio chunks from the conversation prefix")
+        
+        if history_summary:
+            system_blocks.append({"type": "text", "text": "**Earlier Conversation (Summary):**\n" + history_summary})
         
-        return "\n\n".join(context_parts) if context_parts else "No context available."
+        # Prepare messages for the LLM
+        messages = [SystemMessage(content=system_blocks)]
+        
+        # Add previous chat history (most recent turns that fit the budget)
+        for msg in context["history"]:
+            role = msg.get("role", "")
+            content = msg.get("content", "")
+            if role == "user":
+                messages.append(HumanMessage(content=content))
+            elif role == "assistant":
+                messages.append(AIMessage(content=content))
+        
+        # Add current question with the portfolio chunks not shown before
+        if portfolio_context:
+            logger.info(f"Added new portfolio context to chat via RAG ({len(portfolio_context)} chars)")
+            portfolio_section = "=== RELEVANT PROJECTS FROM PORTFOLIO ===\n" + portfolio_context
+        elif shown_chunks:
+            portfolio_section = "No new projects; the relevant ones were shown earlier in this conversation."
+        else:
+            portfolio_section = "No portfolio provided."
+        
+        current_prompt = f"""**Candidate Context (Portfolio):**
+{portfolio_section}
+
+**Employer's Question:**
+{question}
+
+**Context Usage Guidelines:**
+- Use the RESUME section (in your context) for work experience, education, and core skills
+- Use the PORTFOLIO section for specific project examples and technical demonstrations
+- Reference specific projects from the portfolio when relevant to the question
+- Answer based ONLY on the information available in the candidate context
+
+**Your Response:**
+Please provide a helpful, professional answer to the employer's question based on the candidate context."""
+        messages.append(HumanMessage(content=current_prompt))
+        
+        return messages, context["portfolio_chunks"]
+    
+    def _answer_cache_key(self) -> Tuple[Tuple[int, ...], str]:
+        """Key answers by the indexed documents' versions and the current job context."""
+        versions = self.vector_store_manager.index_versions
+        return (versions["resume"], versions["portfolio"]), job_context_hash(self.job_context, self.job_description)
+    
+    def _recall_answer(self, question: str,
+                       history: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Look up a cached answer for a near-duplicate question.
+        
+        Follow-ups (non-empty history) are never looked up, matching _remember_answer:
+        only standalone answers are cached, and they don't fit a conversation in progress.
+        
+        Returns:
+            Tuple of (cached answer or None, question embedding or None if not embedded)
+        """
+        if history:
+            return None, None
+        try:
+            question_vector = self.vector_store_manager.embeddings.embed_query(question)
+        except Exception as e:
+            logger.warning(f"Could not embed question for the answer cache: {str(e)}")
+            return None, None
+        return self._lookup_answer(question_vector), question_vector
+    
+    async def _arecall_answer(self, question: str,
+                              history: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[List[float]]]:
+        """Asynchronously look up a cached answer for a near-duplicate standalone question."""
+        if history:
+            return None, None
+        try:
+            question_vector = await self.vector_store_manager.embeddings.aembed_query(question)
+        except Exception as e:
+            logger.warning(f"Could not embed question for the answer cache: {str(e)}")
+            return None, None
+        return self._lookup_answer(question_vector), question_vector
+    
+    def _lookup_answer(self, question_vector: List[float]) -> Optional[str]:
+        """Look up an answer by question embedding, logging the running hit rate for real questions."""
+        cached = self.answer_cache.lookup(question_vector, *self._answer_cache_key(),
+                                          record_stats=self.record_cache_stats)
+        if self.record_cache_stats:
+            stats = self.answer_cache.get_stats()
+            logger.info(f"Answer cache: {stats['hits']} hits, {stats['misses']} misses "
+                        f"(hit rate {stats['hit_rate']:.0%}), {stats['entries']} cached answers")
+        return cached["answer"] if cached else None
+    
+    def _remember_answer(self, question: str, question_vector: Optional[List[float]], answer: str,
+                         history: List[Dict[str, Any]], cache_key: Tuple[Tuple[int, ...], str]) -> None:
+        """
+        Cache an answer for later near-duplicate questions.
+        
+        Only answers to standalone questions (no earlier turns) are cached, since a
+        follow-up's answer depends on the conversation it was asked in.
+        """
+        if question_vector is None or history or not answer or answer.startswith("❌"):
+            return
+        self.answer_cache.store(question, question_vector, answer, *cache_key)
+    
+    def get_answer_cache_stats(self) -> Dict[str, Any]:
+        """Get answer cache hit/miss counters (hits, misses, hit_rate, entries)."""
+        return self.answer_cache.get_stats()
+    
+    def _faq_worker(self) -> "EmployerQAChatbot":
+        """
+        Create a chatbot sharing this one's model, context, job and answer cache, but with
+        its own conversation state, so pre-generation never touches the live conversation.
+        """
+        worker = EmployerQAChatbot(self.vector_store_manager, self.llm_model, context_service=self.context_service)
+        worker.llm = self.llm
+        worker.usage = self.usage
+        worker.answer_cache = self.answer_cache
+        worker.record_cache_stats = False
+        worker.job_context = self.job_context
+        worker.job_description = self.job_description
+        return worker
+    
+    def precompute_answers(self, questions: Sequence[str],
+                           max_concurrency: int = FAQ_MAX_CONCURRENCY) -> Dict[str, Any]:
+        """
+        Pre-generate answers to common questions into the answer cache.
+        
+        Questions already answered for the current profile and job are skipped. If the
+        profile or job context changes meanwhile, the remaining questions are abandoned
+        (a newer run covers them).
+        
+        Args:
+            questions: Questions to answer
+            max_concurrency: Maximum concurrent LLM calls
+        
+        Returns:
+            Dictionary with generated, cached, failed, abandoned counts and seconds
+        """
+        stats = {"generated": 0, "cached": 0, "failed": 0, "abandoned": 0}
+        if not self.vector_store_manager.has_resume() or not questions:
+            return {**stats, "seconds": 0.0}
+        
+        start = time.perf_counter()
+        cache_key = self._answer_cache_key()
+        
+        def answer_one(question: str) -> str:
+            if self._answer_cache_key() != cache_key:
+                return "abandoned"
+            try:
+                question_vector = self.vector_store_manager.embeddings.embed_query(question)
+            except Exception as e:
+                logger.warning(f"Could not embed FAQ question: {str(e)}")
+                return "failed"
+            if self.answer_cache.lookup(question_vector, *cache_key, record_stats=False) is not None:
+                return "cached"
+            answer = self._faq_worker().answer_question(question, [])
+            return "failed" if answer.startswith("❌") else "generated"
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            for outcome in executor.map(answer_one, questions):
+                stats[outcome] += 1
+        
+        stats["seconds"] = round(time.perf_counter() - start, 2)
+        logger.info(f"Pre-generated FAQ answers: {stats}")
+        return stats
+    
+    def _generate(self, question: str, history: List[Dict[str, Any]]) -> str:
+        """
+        Answer a question from the cache or the LLM, raising on failure.
+        
+        Args:
+            question: The employer's question
+            history: List of previous messages in OpenAI format
+        
+        Returns:
+            Generated (or cached) response
+        """
+        # Near-duplicate questions for the same profile and job are answered from the cache
+        cache_key = self._answer_cache_key()
+        cached_answer, question_vector = self._recall_answer(question, history)
+        if cached_answer is not None:
+            return cached_answer
+        
+        # Build hybrid context (resume in cached prefix + portfolio RAG)
+        portfolio_chunks = self.context_service.get_portfolio_chunks(question)
+        summary, recent_history = self.history_manager.prepare(history, self.llm)
+        messages, new_chunks = self._build_messages(question, recent_history, portfolio_chunks, summary)
+        
+        # Generate response
+        response = self.llm.invoke(messages)
+        self.usage.record(response.usage_metadata)
+        self.seen_chunks.mark_shown(new_chunks)
+        answer = response.content
+        self._remember_answer(question, question_vector, answer, history, cache_key)
+        
+        logger.info(f"Generated answer (length: {len(answer)} chars)")
+        return answer
+    
+    async def _agenerate(self, question: str, history: List[Dict[str, Any]]) -> str:
+        """Asynchronously answer a question from the cache or the LLM, raising on failure."""
+        cache_key = self._answer_cache_key()
+        cached_answer, question_vector = await self._arecall_answer(question, history)
+        if cached_answer is not None:
+            return cached_answer
+        
+        portfolio_chunks = await self.context_service.aget_portfolio_chunks(question)
+        summary, recent_history = await self.history_manager.aprepare(history, self.llm)
+        messages, new_chunks = self._build_messages(question, recent_history, portfolio_chunks, summary)
+        
+        response = await self.llm.ainvoke(messages)
+        self.usage.record(response.usage_metadata)
+        self.seen_chunks.mark_shown(new_chunks)
+        answer = response.content
+        self._remember_answer(question, question_vector, answer, history, cache_key)
+        
+        logger.info(f"Generated answer (length: {len(answer)} chars)")
+        return answer
+    
+    async def _astream(self, question: str, history: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        """Stream an answer from the cache or the LLM, raising on failure (possibly mid-stream)."""
+        cache_key = self._answer_cache_key()
+        cached_answer, question_vector = await self._arecall_answer(question, history)
+        if cached_answer is not None:
+            yield cached_answer
+            return
+        
+        portfolio_chunks = await self.context_service.aget_portfolio_chunks(question)
+        summary, recent_history = await self.history_manager.aprepare(history, self.llm)
+        messages, new_chunks = self._build_messages(question, recent_history, portfolio_chunks, summary)
+        
+        parts = []
+        usage = None
+        async for chunk in self.llm.astream(messages):
+            usage = merge_usage(usage, chunk.usage_metadata)
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
+        self.usage.record(usage)
+        self.seen_chunks.mark_shown(new_chunks)
+        answer = "".join(parts)
+        self._remember_answer(question, question_vector, answer, history, cache_key)
+        
+        logger.info(f"Streamed answer (length: {len(answer)} chars)")
+    
+    @staticmethod
+    def _error_message(e: Exception) -> str:
+        """Log a failed answer and format it for the user."""
+        error_msg = f"❌ Error generating response: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
     
     def answer_question(self, question: str, history: List[Dict[str, Any]]) -> str:
         """
@@ -102,67 +411,87 @@ class EmployerQAChatbot:
             history: List of previous messages in OpenAI format
         
         Returns:
-            Generated response
+            Generated response (or an error message starting with "❌")
         """
         try:
             logger.info(f"Processing employer question: {question[:100]}...")
             
             # Check if resume is available
             if not self.vector_store_manager.has_resume():
-                return "❌ Error: No resume indexed yet. Please index a resume first before using the chatbot."
-            
-            # Build hybrid context (resume direct + portfolio RAG)
-            context = self._build_context(question)
-            
-            # Get system prompt with optional job context
-            system_prompt = get_employer_qa_system_prompt(
-                job_context=self.job_context,
-                job_description=self.job_description
-            )
+                return NO_RESUME_MESSAGE
+            return self._generate(question, history)
             
-            # Prepare messages for the LLM
-            messages = []
-            
-            # Add system context
-            messages.append(SystemMessage(content=system_prompt))
+        except Exception as e:
+            return self._error_message(e)
+    
+    async def aanswer_question(self, question: str, history: List[Dict[str, Any]]) -> str:
+        """
+        Asynchronously answer an employer question (non-blocking LLM call and retrieval).
+        
+        Args:
+            question: The employer's question
+            history: List of previous messages in OpenAI format
+        
+        Returns:
+            Generated response (or an error message starting with "❌")
+        """
+        try:
+            logger.info(f"Processing employer question (async): {question[:100]}...")
             
-            # Add previous chat history
-            for msg in history:
-                role = msg.get("role", "")
-                content = msg.get("content", "")
-                if role == "user":
-                    messages.append(HumanMessage(content=content))
-                elif role == "assistant":
-                    messages.append(AIMessage(content=content))
+            if not self.vector_store_manager.has_resume():
+                return NO_RESUME_MESSAGE
+            return await self._agenerate(question, history)
             
-            # Add current question with hybrid context
-            current_prompt = f"""**Candidate Context (Resume + Portfolio):**
-{context}
-
-**Employer's Question:**
-{question}
-
-**Context Usage Guidelines:**
-- Use the RESUME section for work experience, education, and core skills
-- Use the PORTFOLIO section for specific project examples and technical demonstrations
-- Reference specific projects from the portfolio when relevant to the question
-- Answer based ONLY on the information available in the context above
-
-**Your Response:**
-Please provide a helpful, professional answer to the employer's question based on the candidate context above."""
-            messages.append(HumanMessage(content=current_prompt))
+        except Exception as e:
+            return self._error_message(e)
+    
+    async def astream_answer(self, question: str, history: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        """
+        Stream an answer to an employer question token by token.
+        
+        Args:
+            question: The employer's question
+            history: List of previous messages in OpenAI format
+        
+        Yields:
+            Text chunks of the answer (or a single error message)
+        """
+        try:
+            logger.info(f"Streaming answer to employer question: {question[:100]}...")
             
-            # Generate response
-            response = self.llm.invoke(messages)
-            answer = response.content
+            if not self.vector_store_manager.has_resume():
+                yield NO_RESUME_MESSAGE
+                return
             
-            logger.info(f"Generated answer (length: {len(answer)} chars)")
-            return answer
+            async for chunk in self._astream(question, history):
+                yield chunk
             
         except Exception as e:
-            error_msg = f"❌ Error generating response: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            yield self._error_message(e)
+    
+    @staticmethod
+    def _normalize_history(history: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Convert Gradio history format to OpenAI-style message dicts.
+        
+        Args:
+            history: Chat history in Gradio format
+        
+        Returns:
+            List of {"role", "content"} dicts
+        """
+        formatted_history = []
+        if history:
+            for msg in history:
+                if isinstance(msg, dict):
+                    formatted_history.append(msg)
+                elif isinstance(msg, (list, tuple)) and len(msg) == 2:
+                    # Handle old format [user_msg, assistant_msg]
+                    if msg[0]:
+                        formatted_history.append({"role": "user", "content": msg[0]})
+                    if msg[1]:
+                        formatted_history.append({"role": "assistant", "content": msg[1]})
+        return formatted_history
     
     def chat(self, message: str, history: List[Dict[str, Any]]) -> str:
         """
@@ -176,23 +505,93 @@ Please provide a helpful, professional answer to the employer's question based o
             Assistant's response
         """
         try:
-            # Convert Gradio history format to our format if needed
-            formatted_history = []
-            if history:
-                for msg in history:
-                    if isinstance(msg, dict):
-                        formatted_history.append(msg)
-                    elif isinstance(msg, (list, tuple)) and len(msg) == 2:
-                        # Handle old format [user_msg, assistant_msg]
-                        if msg[0]:
-                            formatted_history.append({"role": "user", "content": msg[0]})
-                        if msg[1]:
-                            formatted_history.append({"role": "assistant", "content": msg[1]})
-            
-            response = self.answer_question(message, formatted_history)
+            response = self.answer_question(message, self._normalize_history(history))
             return response
             
         except Exception as e:
             error_msg = f"❌ Error in chat: {str(e)}"
             logger.error(error_msg)
             return error_msg
+    
+    def astream_chat(self, message: str, history: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        """
+        Streaming chat interface function for Gradio handlers.
+        
+        Args:
+            message: User's message
+            history: Chat history in Gradio format
+        
+        Returns:
+            Async iterator over text chunks of the assistant's response
+        """
+        return self.astream_answer(message, self._normalize_history(history))
+    
+    async def achat(self, message: str, history: List[Dict[str, Any]]) -> str:
+        """
+        Async chat interface function for Gradio handlers.
+        
+        Args:
+            message: User's message
+            history: Chat history in Gradio format
+        
+        Returns:
+            Assistant's response
+        """
+        try:
+            return await self.aanswer_question(message, self._normalize_history(history))
+            
+        except Exception as e:
+            error_msg = f"❌ Error in chat: {str(e)}"
+            logger.error(error_msg)
+            return error_msg
+    
+    def reply(self, message: str) -> str:
+        """
+        Answer a message in the server-side conversation (the caller sends only the new message).
+        
+        Only successful turns are recorded; errors are returned but never replayed to the LLM.
+        
+        Args:
+            message: User's message
+        
+        Returns:
+            Assistant's response
+        """
+        if not self.vector_store_manager.has_resume():
+            return NO_RESUME_MESSAGE
+        
+        try:
+            answer = self._generate(message, self.chat_history.as_dicts())
+        except Exception as e:
+            return self._error_message(e)
+        
+        self._record_turn(message, answer)
+        return answer
+    
+    async def astream_reply(self, message: str) -> AsyncIterator[str]:
+        """
+        Stream the answer to a message in the server-side conversation.
+        
+        The question and the complete answer are appended to the history once the
+        stream finishes successfully; a failed (or partial) answer is not recorded.
+        
+        Args:
+            message: User's message
+        
+        Yields:
+            Text chunks of the assistant's response
+        """
+        if not self.vector_store_manager.has_resume():
+            yield NO_RESUME_MESSAGE
+            return
+        
+        parts = []
+        try:
+            async for chunk in self._astream(message, self.chat_history.as_dicts()):
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            yield ("\n\n" if parts else "") + self._error_message(e)
+            return
+        
+        self._record_turn(message, "".join(parts))
@@ -0,0 +1,253 @@
+"""
+Context building for ApplyCopilot.
+ContextAssembler fits each prompt section (resume, portfolio, examples, history) into
+its own token budget, dropping the lowest-ranked pieces first, and logs the final
+allocation. ContextService is the single place features get candidate context from;
+retrieval results are cached per index version, so the same job is only searched once.
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.config.logging_config import setup_logger
+from src.config.settings import (RESUME_TOKEN_BUDGET, PORTFOLIO_TOKEN_BUDGET,
+                                 EXAMPLES_TOKEN_BUDGET, HISTORY_TOKEN_BUDGET,
+                                 PORTFOLIO_TOP_K)
+from src.core.tokens import count_tokens, truncate_to_tokens
+
+logger = setup_logger(__name__)
+
+DEFAULT_BUDGETS = {
+    "resume": RESUME_TOKEN_BUDGET,
+    "portfolio": PORTFOLIO_TOKEN_BUDGET,
+    "examples": EXAMPLES_TOKEN_BUDGET,
+    "history": HISTORY_TOKEN_BUDGET,
+}
+
+CHUNK_SEPARATOR = "\n\n"
+TRUNCATION_MARKER = "\n[...]"
+
+
+class ContextAssembler:
+    """Fits prompt sections into per-section token budgets."""
+    
+    def __init__(self, budgets: Optional[Dict[str, int]] = None):
+        """
+        Initialize the assembler.
+        
+        Args:
+            budgets: Per-section token budgets overriding the settings defaults
+        """
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+    
+    def fit_text(self, text: str, section: str) -> Tuple[str, int]:
+        """
+        Trim a single text (e.g. the resume) to its section budget, keeping the beginning.
+        
+        Args:
+            text: Section text
+            section: Section name (budget key)
+        
+        Returns:
+            Tuple of (fitted text, token count)
+        """
+        budget = self.budgets[section]
+        tokens = count_tokens(text)
+        if tokens <= budget:
+            return text, tokens
+        
+        fitted = truncate_to_tokens(text, budget - count_tokens(TRUNCATION_MARKER)) + TRUNCATION_MARKER
+        logger.warning(f"Trimmed {section} from {tokens} to {budget} tokens")
+        return fitted, count_tokens(fitted)
+    
+    def fit_ranked(self, pieces: List[str], section: str) -> Tuple[List[str], int]:
+        """
+        Keep the highest-ranked pieces (e.g. retrieved chunks) that fit the section budget.
+        
+        Pieces are expected best-first; lower-ranked pieces that would overflow the budget
+        are dropped. The top piece is trimmed rather than dropped if it alone is too large.
+        
+        Args:
+            pieces: Pieces ordered from most to least relevant
+            section: Section name (budget key)
+        
+        Returns:
+            Tuple of (kept pieces in rank order, token count)
+        """
+        budget = self.budgets[section]
+        kept, used = [], 0
+        
+        for piece in pieces:
+            tokens = count_tokens(piece)
+            if used + tokens <= budget:
+                kept.append(piece)
+                used += tokens
+            elif not kept:
+                piece, tokens = self.fit_text(piece, section)
+                kept.append(piece)
+                used += tokens
+        
+        if len(kept) < len(pieces):
+            logger.info(f"Dropped {len(pieces) - len(kept)} lowest-ranked {section} pieces to fit {budget} tokens")
+        return kept, used
+    
+    def fit_history(self, history: List[Dict[str, Any]], section: str = "history") -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Keep the most recent chat messages that fit the history budget.
+        
+        Args:
+            history: Messages in OpenAI format, oldest first
+            section: Section name (budget key)
+        
+        Returns:
+            Tuple of (kept messages oldest first, token count)
+        """
+        budget = self.budgets[section]
+        kept, used = [], 0
+        
+        for message in reversed(history):
+            tokens = count_tokens(str(message.get("content", "")))
+            if used + tokens > budget:
+                break
+            kept.append(message)
+            used += tokens
+        kept.reverse()
+        
+        # A conversation must not start with an orphaned assistant reply
+        while kept and kept[0].get("role") != "user":
+            used -= count_tokens(str(kept.pop(0).get("content", "")))
+        
+        if len(kept) < len(history):
+            logger.info(f"Dropped {len(history) - len(kept)} oldest history messages to fit {budget} tokens")
+        return kept, used
+    
+    def assemble(self, resume: Optional[str] = None, portfolio: Optional[List[str]] = None,
+                 examples: Optional[str] = None, history: Optional[List[Dict[str, Any]]] = None,
+                 label: str = "request") -> Dict[str, Any]:
+        """
+        Fit all given sections into their budgets and log the token allocation.
+        
+        Sections passed as None are left out of the result.
+        
+        Args:
+            resume: Full resume text
+            portfolio: Retrieved portfolio chunks, most relevant first
+            examples: Rendered cover letter examples
+            history: Chat history in OpenAI format, oldest first
+            label: Name of the request type for the allocation log
+        
+        Returns:
+            Dictionary with the fitted sections (portfolio joined into one string, the kept
+            chunks also as "portfolio_chunks") and a "tokens" dictionary of tokens used per section
+        """
+        context: Dict[str, Any] = {}
+        tokens: Dict[str, int] = {}
+        
+        if resume is not None:
+            context["resume"], tokens["resume"] = self.fit_text(resume, "resume")
+        if portfolio is not None:
+            kept, tokens["portfolio"] = self.fit_ranked(portfolio, "portfolio")
+            context["portfolio"] = CHUNK_SEPARATOR.join(kept)
+            context["portfolio_chunks"] = kept
+        if examples is not None:
+            context["examples"], tokens["examples"] = self.fit_text(examples, "examples")
+        if history is not None:
+            context["history"], tokens["history"] = self.fit_history(history)
+        
+        context["tokens"] = tokens
+        allocation = ", ".join(f"{name} {used}/{self.budgets[name]}" for name, used in tokens.items())
+        logger.info(f"Context allocation for {label}: {allocation} (total {sum(tokens.values())} tokens)")
+        return context
+
+
+class ContextService:
+    """Candidate context shared by the cover letter, cold message and Q&A features."""
+    
+    def __init__(self, vector_store_manager, assembler: Optional[ContextAssembler] = None):
+        """
+        Initialize the context service.
+        
+        Args:
+            vector_store_manager: VectorStoreManager holding the resume and portfolio
+            assembler: Token-budget assembler (defaults to the settings budgets)
+        """
+        self.vector_store_manager = vector_store_manager
+        self.assembler = assembler or ContextAssembler()
+    
+    def get_portfolio_chunks(self, query: str, k: int = PORTFOLIO_TOP_K) -> List[str]:
+        """
+        Retrieve portfolio chunks for a query, most relevant first.
+        
+        Results are cached by the VectorStoreManager per (query hash, k, index version),
+        so every feature asking about the same job shares one retrieval.
+        
+        Args:
+            query: Search query (job description or question)
+            k: Number of chunks to retrieve
+        
+        Returns:
+            List of chunk texts (empty if no portfolio is loaded)
+        """
+        if not self.vector_store_manager.has_portfolio():
+            logger.info("No portfolio loaded (optional)")
+            return []
+        
+        return self.vector_store_manager.get_portfolio_chunks(query, k=k)
+    
+    async def aget_portfolio_chunks(self, query: str, k: int = PORTFOLIO_TOP_K) -> List[str]:
+        """
+        Asynchronously retrieve portfolio chunks for a query (see get_portfolio_chunks).
+        
+        Args:
+            query: Search query (job description or question)
+            k: Number of chunks to retrieve
+        
+        Returns:
+            List of chunk texts (empty if no portfolio is loaded)
+        """
+        if not self.vector_store_manager.has_portfolio():
+            logger.info("No portfolio loaded (optional)")
+            return []
+        
+        return await self.vector_store_manager.aget_portfolio_chunks(query, k=k)
+    
+    def get_resume(self) -> Optional[str]:
+        """Full resume text for direct injection (None if no resume is loaded)."""
+        if not self.vector_store_manager.has_resume():
+            logger.warning("No resume loaded")
+            return None
+        return self.vector_store_manager.get_resume_context(use_rag=False)
+    
+    def assemble(self, portfolio_chunks: Optional[List[str]] = None, examples: Optional[str] = None,
+                 history: Optional[List[Dict[str, Any]]] = None, label: str = "request") -> Dict[str, Any]:
+        """
+        Fit the resume plus the given sections into their token budgets (see ContextAssembler.assemble).
+        
+        Args:
+            portfolio_chunks: Retrieved portfolio chunks, most relevant first
+            examples: Rendered cover letter examples
+            history: Chat history in OpenAI format, oldest first
+            label: Name of the request type for the allocation log
+        
+        Returns:
+            Dictionary with the fitted sections and per-section token usage
+            ("resume" is None when no resume is loaded)
+        """
+        resume = self.get_resume()
+        context = self.assembler.assemble(
+            resume=resume, portfolio=portfolio_chunks, examples=examples, history=history, label=label
+        )
+        context.setdefault("resume", None)
+        return context
+    
+    def clear(self) -> None:
+        """Drop all cached retrievals."""
+        self.vector_store_manager.clear_retrieval_cache()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get retrieval cache counters.
+        
+        Returns:
+            Dictionary with hits, misses and number of cached retrievals
+        """
+        return self.vector_store_manager.get_retrieval_cache_stats()
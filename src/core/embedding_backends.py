@@ -0,0 +1,62 @@
+"""
+Embedding backends for ApplyCopilot.
+Selects the embeddings model behind VectorStoreManager from settings.EMBEDDING_BACKEND:
+
+- "openai": OpenAI embeddings API (default, needs network and OPENAI_API_KEY)
+- "hashing": deterministic feature-hashing embedder (offline, no model download, near-zero latency)
+- "sentence-transformers": local CPU sentence-transformer (needs `pip install sentence-transformers`)
+
+Models are imported only when created, so resolving a backend's model name stays cheap.
+"""
+
+from src.config.logging_config import setup_logger
+from src.config.settings import EMBEDDING_MODEL, LOCAL_EMBEDDING_MODEL, HASHING_EMBEDDING_DIM
+
+logger = setup_logger(__name__)
+
+EMBEDDING_BACKENDS = ("openai", "hashing", "sentence-transformers")
+
+
+def default_model_name(backend: str) -> str:
+    """
+    Get the default model name of a backend (also part of embedding cache keys).
+    
+    Args:
+        backend: One of EMBEDDING_BACKENDS
+    
+    Returns:
+        Model name
+    """
+    if backend == "openai":
+        return EMBEDDING_MODEL
+    if backend == "hashing":
+        return f"hashing-{HASHING_EMBEDDING_DIM}"
+    if backend == "sentence-transformers":
+        return LOCAL_EMBEDDING_MODEL
+    raise ValueError(f"Unknown embedding backend: {backend!r} (choose from {', '.join(EMBEDDING_BACKENDS)})")
+
+
+def create_embeddings(backend: str, model_name: str):
+    """
+    Create the embeddings model for a backend.
+    
+    Args:
+        backend: One of EMBEDDING_BACKENDS
+        model_name: Model name (for "hashing", "hashing-<dim>")
+    
+    Returns:
+        LangChain embeddings model
+    """
+    logger.info(f"Using {backend} embedding backend ({model_name})")
+    
+    if backend == "openai":
+        from langchain_openai import OpenAIEmbeddings
+        return OpenAIEmbeddings(model=model_name)
+    if backend == "hashing":
+        from src.core.local_embeddings import HashingEmbeddings
+        dim = int(model_name.rsplit("-", 1)[-1]) if model_name.startswith("hashing-") else HASHING_EMBEDDING_DIM
+        return HashingEmbeddings(dim=dim)
+    if backend == "sentence-transformers":
+        from src.core.local_embeddings import SentenceTransformerEmbeddings
+        return SentenceTransformerEmbeddings(model_name)
+    raise ValueError(f"Unknown embedding backend: {backend!r} (choose from {', '.join(EMBEDDING_BACKENDS)})")
@@ -0,0 +1,265 @@
+"""
+Persistent embedding cache for ApplyCopilot.
+Wraps any LangChain embeddings model with a content-addressed on-disk cache so
+re-indexing identical (or mostly identical) documents costs no embedding calls, and an
+in-memory LRU of query embeddings so repeated searches skip the network round trip.
+The cache file is shared by all sessions (WAL mode, busy timeout); if it is locked or
+unreadable anyway, lookups count as misses and the underlying model is used.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from src.config.logging_config import setup_logger
+from src.config.settings import (EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ENTRIES,
+                                 EMBEDDING_CACHE_BUSY_TIMEOUT_SECONDS, QUERY_EMBEDDING_CACHE_MAX_ENTRIES)
+
+logger = setup_logger(__name__)
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper with a SQLite-backed, LRU-bounded cache keyed by (model, text hash)."""
+
+    def __init__(self, underlying: Embeddings, model_name: str,
+                 cache_path: Path = EMBEDDING_CACHE_PATH,
+                 max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES,
+                 max_query_entries: int = QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+                 busy_timeout: float = EMBEDDING_CACHE_BUSY_TIMEOUT_SECONDS):
+        """
+        Initialize the cached embeddings wrapper.
+
+        Args:
+            underlying: Embeddings model used for cache misses
+            model_name: Embeddings model name (part of the cache key)
+            cache_path: Path to the SQLite cache file
+            max_entries: Maximum number of cached vectors before LRU eviction
+            max_query_entries: Maximum number of query embeddings kept in memory
+            busy_timeout: Seconds to wait for a lock held by another connection
+        """
+        self.underlying = underlying
+        self.model_name = model_name
+        self.cache_path = Path(cache_path)
+        self.max_entries = max_entries
+        self.max_query_entries = max_query_entries
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self.query_hits = 0
+        self.query_misses = 0
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_path), timeout=self.busy_timeout, check_same_thread=False)
+            try:
+                # WAL lets sessions read while another one writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used)"
+                )
+                conn.commit()
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+            logger.info(f"Opened embedding cache at: {self.cache_path}")
+        return self._conn
+
+    def _rollback(self) -> None:
+        """Roll back a failed transaction (caller holds the lock)."""
+        if self._conn is not None:
+            try:
+                self._conn.rollback()
+            except sqlite3.Error:
+                pass
+
+    def _key(self, text: str) -> str:
+        """Build the content-addressed cache key for a text."""
+        return hashlib.sha256(f"{self.model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Fetch cached vectors for the given keys and mark them as recently used (empty if the cache fails)."""
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(unique_keys), 500):
+                    batch = unique_keys[start:start + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = array("f", blob).tolist()
+
+                if found:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key in found]
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                self._rollback()
+                logger.warning(f"Embedding cache lookup failed, embedding without it: {str(e)}")
+                return {}
+
+        return found
+
+    def _store(self, items: Dict[str, List[float]]) -> None:
+        """Persist new vectors and evict least recently used entries beyond the size bound (best effort)."""
+        if not items:
+            return
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                now = time.time()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    [(key, array("f", vector).tobytes(), now) for key, vector in items.items()]
+                )
+
+                total = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                overflow = total - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM embeddings WHERE key IN ("
+                        "SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                        (overflow,)
+                    )
+                    logger.info(f"Evicted {overflow} least recently used embeddings from cache")
+                conn.commit()
+            except sqlite3.Error as e:
+                self._rollback()
+                logger.warning(f"Could not write {len(items)} embeddings to the cache: {str(e)}")
+
+    def _split_cached(self, texts: List[str]) -> tuple:
+        """Resolve cached vectors and collect the unique texts that still need embedding."""
+        keys = [self._key(text) for text in texts]
+        cached = self._lookup(keys)
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        miss_count = sum(1 for key in keys if key not in cached)
+        with self._lock:
+            self.hits += len(keys) - miss_count
+            self.misses += miss_count
+
+        return keys, cached, missing
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, calling the underlying model only for uncached texts."""
+        keys, cached, missing = self._split_cached(texts)
+
+        if missing:
+            vectors = self.underlying.embed_documents(list(missing.values()))
+            new_items = dict(zip(missing.keys(), vectors))
+            self._store(new_items)
+            cached.update(new_items)
+
+        logger.info(f"Embedded {len(texts)} texts ({len(texts) - len(missing)} from cache, {len(missing)} new)")
+        return [cached[key] for key in keys]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed documents, calling the underlying model only for uncached texts."""
+        keys, cached, missing = self._split_cached(texts)
+
+        if missing:
+            vectors = await self.underlying.aembed_documents(list(missing.values()))
+            new_items = dict(zip(missing.keys(), vectors))
+            self._store(new_items)
+            cached.update(new_items)
+
+        logger.info(f"Embedded {len(texts)} texts ({len(texts) - len(missing)} from cache, {len(missing)} new)")
+        return [cached[key] for key in keys]
+
+    @staticmethod
+    def _normalize_query(text: str) -> str:
+        """Collapse whitespace so trivially different copies of a query share one embedding."""
+        return re.sub(r"\s+", " ", text).strip()
+
+    def _recall_query(self, text: str) -> tuple:
+        """Look up a query embedding in the in-memory LRU (returns key, normalized text, vector or None)."""
+        normalized = self._normalize_query(text)
+        key = self._key(normalized)
+        with self._lock:
+            vector = self._query_cache.get(key)
+            if vector is None:
+                self.query_misses += 1
+            else:
+                self._query_cache.move_to_end(key)
+                self.query_hits += 1
+        return key, normalized, vector
+
+    def _remember_query(self, key: str, vector: List[float]) -> None:
+        """Store a query embedding, evicting the least recently used beyond the bound."""
+        with self._lock:
+            self._query_cache[key] = vector
+            while len(self._query_cache) > self.max_query_entries:
+                self._query_cache.popitem(last=False)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a search query (kept in an in-memory LRU, not persisted)."""
+        key, normalized, vector = self._recall_query(text)
+        if vector is None:
+            vector = self.underlying.embed_query(normalized)
+            self._remember_query(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Asynchronously embed a search query (kept in an in-memory LRU, not persisted)."""
+        key, normalized, vector = self._recall_query(text)
+        if vector is None:
+            vector = await self.underlying.aembed_query(normalized)
+            self._remember_query(key, vector)
+        return vector
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dictionary with document hits, misses, hit_rate and number of stored entries
+            (None if the cache file could not be read),
+            plus query_hits and query_misses of the query embedding LRU
+        """
+        with self._lock:
+            try:
+                entries = self._connect().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.warning(f"Could not count embedding cache entries: {str(e)}")
+                entries = None
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "query_hits": self.query_hits,
+                "query_misses": self.query_misses
+            }
@@ -0,0 +1,145 @@
+"""
+Embedding pipeline for ApplyCopilot indexing.
+Packs chunks into token-bounded batches, embeds the batches concurrently with a
+bounded number of in-flight requests, retries rate-limited requests with backoff and
+hands each batch's vectors to a callback as soon as it arrives.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Any
+
+from langchain_core.embeddings import Embeddings
+
+from src.config.logging_config import setup_logger
+from src.config.settings import (EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_MAX_TOKENS, EMBEDDING_MAX_CONCURRENCY,
+                                 EMBEDDING_MAX_RETRIES, EMBEDDING_BACKOFF_BASE_SECONDS,
+                                 EMBEDDING_BACKOFF_MAX_SECONDS)
+from src.core.tokens import count_tokens
+
+logger = setup_logger(__name__)
+
+
+def batch_by_tokens(texts: List[str], max_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+                    max_size: int = EMBEDDING_BATCH_SIZE,
+                    token_counter: Callable[[str], int] = count_tokens) -> List[List[int]]:
+    """
+    Pack texts (in order) into batches bounded by total tokens and number of texts.
+
+    A single text larger than max_tokens gets a batch of its own.
+
+    Args:
+        texts: Texts to batch
+        max_tokens: Maximum total tokens per batch
+        max_size: Maximum texts per batch
+        token_counter: Function counting the tokens of a text
+
+    Returns:
+        List of batches, each a list of indices into texts
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for index, text in enumerate(texts):
+        tokens = token_counter(text)
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_size):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an embedding error is transient (rate limit, overload, connection)."""
+    try:
+        import openai
+        if isinstance(error, (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)):
+            return True
+    except ImportError:
+        pass
+    return getattr(error, "status_code", None) in (429, 500, 502, 503, 529)
+
+
+def _embed_with_retry(embeddings: Embeddings, texts: List[str]) -> tuple:
+    """
+    Embed one batch, retrying transient errors with exponential backoff.
+
+    Returns:
+        Tuple of (vectors, number of retries)
+    """
+    for attempt in range(1, EMBEDDING_MAX_RETRIES + 2):
+        try:
+            return embeddings.embed_documents(texts), attempt - 1
+        except Exception as e:
+            if attempt > EMBEDDING_MAX_RETRIES or not _is_retryable(e):
+                raise
+
+            delay = min(EMBEDDING_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), EMBEDDING_BACKOFF_MAX_SECONDS)
+            delay += random.uniform(0, EMBEDDING_BACKOFF_BASE_SECONDS)
+            logger.warning(f"Embedding request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt}/{EMBEDDING_MAX_RETRIES})")
+            time.sleep(delay)
+
+
+def embed_in_batches(embeddings: Embeddings, texts: List[str],
+                     on_batch: Callable[[List[int], List[List[float]]], None],
+                     max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+                     token_counter: Callable[[str], int] = count_tokens) -> Dict[str, Any]:
+    """
+    Embed texts in token-bounded batches with at most max_concurrency requests in flight.
+
+    on_batch is called from the calling thread, once per batch and in completion order,
+    so callers can consume vectors while later batches are still embedding.
+
+    Args:
+        embeddings: Embeddings model
+        texts: Texts to embed
+        on_batch: Callback receiving (indices into texts, vectors)
+        max_concurrency: Maximum concurrent embedding requests
+        token_counter: Function counting the tokens of a text (for the per-batch token bound)
+
+    Returns:
+        Dictionary with chunks, batches, retries, seconds and chunks_per_sec
+    """
+    start = time.perf_counter()
+    batches = batch_by_tokens(texts, token_counter=token_counter)
+    retries = 0
+
+    if len(batches) <= 1 or max_concurrency <= 1:
+        for batch in batches:
+            vectors, batch_retries = _embed_with_retry(embeddings, [texts[i] for i in batch])
+            retries += batch_retries
+            on_batch(batch, vectors)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+            futures = {
+                executor.submit(_embed_with_retry, embeddings, [texts[i] for i in batch]): batch
+                for batch in batches
+            }
+            try:
+                for future in as_completed(futures):
+                    vectors, batch_retries = future.result()
+                    retries += batch_retries
+                    on_batch(futures[future], vectors)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    seconds = time.perf_counter() - start
+    stats = {
+        "chunks": len(texts),
+        "batches": len(batches),
+        "retries": retries,
+        "seconds": round(seconds, 3),
+        "chunks_per_sec": round(len(texts) / seconds, 1) if seconds > 0 else 0.0
+    }
+    logger.info(f"Embedded {len(texts)} chunks in {len(batches)} batches ({stats['chunks_per_sec']} chunks/sec, "
+                f"{retries} retries)")
+    return stats
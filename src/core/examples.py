@@ -0,0 +1,287 @@
+"""
+Cover letter example registry for ApplyCopilot.
+Keeps the example letters keyed by content hash so reloading is idempotent: unchanged
+files are skipped, changed files are re-parsed, removed files are dropped, and duplicate
+letters appear in the prompt only once. Examples are embedded once, and each prompt gets
+the top-N letters most similar to the job description within a token budget.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+from src.config.logging_config import setup_logger
+from src.config.settings import COVER_LETTER_EXAMPLES_DIR, EXAMPLES_TOP_N, EXAMPLES_TOKEN_BUDGET
+from src.core.pdf_loader import load_pdfs
+from src.core.tokens import count_tokens
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+logger = setup_logger(__name__)
+
+EXAMPLE_SEPARATOR = "\n\n=== EXAMPLE SEPARATOR ===\n\n"
+
+
+class ExampleRegistry:
+    """Content-hash keyed registry of cover letter examples mirroring the examples directory."""
+    
+    def __init__(self, examples_dir: Path = COVER_LETTER_EXAMPLES_DIR):
+        """
+        Initialize an empty registry.
+        
+        Args:
+            examples_dir: Directory containing the example PDFs
+        """
+        self.examples_dir = Path(examples_dir)
+        self._examples: Dict[str, Dict[str, Any]] = {}  # content hash -> example
+        self._files: Dict[str, Tuple[int, int, str]] = {}  # path -> (mtime, size, content hash)
+        self._block: Optional[str] = None  # Rendered examples block, rebuilt only on change
+        self._block_tokens: Optional[int] = None
+        self._vectors: Dict[str, List[float]] = {}  # content hash -> normalized embedding
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _hash(content: str) -> str:
+        """Content hash used to deduplicate examples."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _layout(examples: Dict[str, Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """What the rendered block depends on: example order, hashes and filenames."""
+        return [(content_hash, example["filename"]) for content_hash, example in examples.items()]
+    
+    def reload(self) -> Dict[str, int]:
+        """
+        Sync the registry with the examples directory, parsing only new or changed files.
+        
+        Returns:
+            Dictionary with counts of examples added, removed and unchanged, the total
+            number of examples and the token footprint of the examples block
+        """
+        pdf_files = sorted(str(path) for path in self.examples_dir.glob("*.pdf"))
+        
+        with self._lock:
+            signatures = {}
+            changed = []
+            for path in pdf_files:
+                stat = Path(path).stat()
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+                previous = self._files.get(path)
+                if previous is None or previous[:2] != signatures[path]:
+                    changed.append(path)
+            
+            parsed = load_pdfs(changed) if changed else {}
+            
+            files: Dict[str, Tuple[int, int, str]] = {}
+            examples: Dict[str, Dict[str, Any]] = {}
+            for path in pdf_files:
+                if path in parsed:
+                    pages = parsed[path]
+                    content = pages[0] if pages else ""
+                    content_hash = self._hash(content)
+                    example = self._examples.get(content_hash) or {
+                        "filename": Path(path).name,
+                        "content": content,
+                        "hash": content_hash,
+                        "tokens": count_tokens(content)
+                    }
+                else:
+                    content_hash = self._files[path][2]
+                    example = self._examples[content_hash]
+                
+                files[path] = (*signatures[path], content_hash)
+                # Duplicates are listed under the first file (in name order) holding them
+                examples.setdefault(content_hash, {**example, "filename": Path(path).name})
+            
+            added = len(examples.keys() - self._examples.keys())
+            removed = len(self._examples.keys() - examples.keys())
+            if self._layout(examples) != self._layout(self._examples):
+                self._block = None
+                self._block_tokens = None
+            self._files = files
+            self._examples = examples
+            self._vectors = {h: v for h, v in self._vectors.items() if h in examples}
+        
+        stats = {
+            "added": added,
+            "removed": removed,
+            "unchanged": len(examples) - added,
+            "total": len(examples),
+            "tokens": self.token_count()
+        }
+        logger.info(
+            f"Cover letter examples: {stats['total']} loaded ({added} new, {removed} removed, "
+            f"{len(pdf_files) - len(examples)} duplicates skipped), ~{stats['tokens']} tokens"
+        )
+        return stats
+    
+    @property
+    def examples(self) -> List[Dict[str, Any]]:
+        """Registered examples (one per distinct letter)."""
+        with self._lock:
+            return list(self._examples.values())
+    
+    def set_examples(self, examples: List[Dict[str, Any]]) -> None:
+        """
+        Replace the registry contents, e.g. with examples restored from a saved profile.
+        
+        The next reload() re-syncs with the examples directory.
+        
+        Args:
+            examples: List of dictionaries with filename and content
+        """
+        with self._lock:
+            self._examples = {}
+            for example in examples:
+                content_hash = self._hash(example["content"])
+                self._examples.setdefault(content_hash, {
+                    "filename": example["filename"],
+                    "content": example["content"],
+                    "hash": content_hash,
+                    "tokens": example.get("tokens") or count_tokens(example["content"])
+                })
+            self._files = {}
+            self._vectors = {h: v for h, v in self._vectors.items() if h in self._examples}
+            self._block = None
+            self._block_tokens = None
+    
+    def render(self, examples: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Render the examples block used in the prompt.
+        
+        The block for the full registry is cached until the examples change.
+        
+        Args:
+            examples: Subset of examples to render (None renders all of them)
+        
+        Returns:
+            Combined example letters, or an empty string if there are none
+        """
+        if examples is not None:
+            return self._format(examples)
+        
+        with self._lock:
+            if self._block is None:
+                self._block = self._format(list(self._examples.values()))
+            return self._block
+    
+    @staticmethod
+    def _format(examples: List[Dict[str, Any]]) -> str:
+        """Join examples into the prompt block."""
+        return EXAMPLE_SEPARATOR.join(
+            f"Example from {ex['filename']}:\n{ex['content']}" for ex in examples
+        )
+    
+    def _fits_whole(self, top_n: int, token_budget: int) -> bool:
+        """Whether every example can be used without ranking."""
+        return len(self) <= top_n and self.token_count() <= token_budget
+    
+    def _missing_vectors(self) -> List[Dict[str, Any]]:
+        """Examples that have not been embedded yet."""
+        with self._lock:
+            return [ex for content_hash, ex in self._examples.items() if content_hash not in self._vectors]
+    
+    def _store_vectors(self, examples: List[Dict[str, Any]], vectors: List[List[float]]) -> None:
+        """Keep normalized example embeddings for cosine similarity."""
+        import numpy as np
+        
+        with self._lock:
+            for example, vector in zip(examples, vectors):
+                array = np.asarray(vector, dtype="float32")
+                norm = np.linalg.norm(array)
+                self._vectors[example["hash"]] = array / norm if norm else array
+    
+    def _rank(self, query_vector: List[float], top_n: int, token_budget: int) -> List[Dict[str, Any]]:
+        """
+        Pick the most similar examples greedily within the count and token budgets.
+        
+        The chosen examples are returned in registry order, so the same selection always
+        renders to the same bytes (and keeps hitting the prompt cache).
+        """
+        import numpy as np
+        
+        with self._lock:
+            candidates = [ex for ex in self._examples.values() if ex["hash"] in self._vectors]
+            if not candidates:
+                return []
+            matrix = np.stack([self._vectors[ex["hash"]] for ex in candidates])
+            order = list(self._examples)
+        
+        query = np.asarray(query_vector, dtype="float32")
+        scores = matrix @ (query / (np.linalg.norm(query) or 1.0))
+        
+        selected, used_tokens = [], 0
+        for index in np.argsort(-scores):
+            example = candidates[int(index)]
+            if len(selected) >= top_n:
+                break
+            # Always keep the best match, even if it alone exceeds the budget
+            if selected and used_tokens + example["tokens"] > token_budget:
+                continue
+            selected.append(example)
+            used_tokens += example["tokens"]
+        
+        selected.sort(key=lambda ex: order.index(ex["hash"]))
+        logger.info(f"Selected {len(selected)} of {len(candidates)} cover letter examples (~{used_tokens} tokens)")
+        return selected
+    
+    def select(self, query: str, embeddings: "Embeddings", top_n: int = EXAMPLES_TOP_N,
+               token_budget: int = EXAMPLES_TOKEN_BUDGET) -> List[Dict[str, Any]]:
+        """
+        Select the examples most relevant to a job description.
+        
+        When all examples fit within top_n and the token budget they are all used
+        (no embedding calls); otherwise they are ranked by embedding similarity.
+        
+        Args:
+            query: Job description to match
+            embeddings: Embeddings model (example vectors are computed once and kept)
+            top_n: Maximum number of examples
+            token_budget: Maximum total tokens of the selected examples
+        
+        Returns:
+            Selected examples
+        """
+        if self._fits_whole(top_n, token_budget):
+            return self.examples
+        
+        missing = self._missing_vectors()
+        if missing:
+            self._store_vectors(missing, embeddings.embed_documents([ex["content"] for ex in missing]))
+        return self._rank(embeddings.embed_query(query), top_n, token_budget)
+    
+    async def aselect(self, query: str, embeddings: "Embeddings", top_n: int = EXAMPLES_TOP_N,
+                      token_budget: int = EXAMPLES_TOKEN_BUDGET) -> List[Dict[str, Any]]:
+        """
+        Asynchronously select the examples most relevant to a job description (see select).
+        
+        Args:
+            query: Job description to match
+            embeddings: Embeddings model (example vectors are computed once and kept)
+            top_n: Maximum number of examples
+            token_budget: Maximum total tokens of the selected examples
+        
+        Returns:
+            Selected examples
+        """
+        if self._fits_whole(top_n, token_budget):
+            return self.examples
+        
+        missing = self._missing_vectors()
+        if missing:
+            self._store_vectors(missing, await embeddings.aembed_documents([ex["content"] for ex in missing]))
+        return self._rank(await embeddings.aembed_query(query), top_n, token_budget)
+    
+    def token_count(self) -> int:
+        """Token footprint of the rendered examples block."""
+        block = self.render()
+        with self._lock:
+            if self._block_tokens is None:
+                self._block_tokens = count_tokens(block)
+            return self._block_tokens
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._examples)
@@ -1,22 +1,24 @@
 import os
+import time
+import random
+import asyncio
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-from reportlab.lib.enums import TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from typing import Optional, AsyncIterator, List, Dict, Any, Sequence
 
 from src.config.logging_config import setup_logger
 from src.config.settings import (LLM_MODEL, MAX_WORDS, COVER_LETTER_EXAMPLES_DIR, 
-                                 OUTPUT_DIR, CANDIDATE_NAME, GITHUB_LINK, WEBSITE_LINK)
-from src.config.prompts import get_cover_letter_prompt, get_cold_message_prompt
+                                 OUTPUT_DIR, CANDIDATE_NAME, GITHUB_LINK, WEBSITE_LINK,
+                                 BATCH_MAX_CONCURRENCY, BATCH_MAX_RETRIES,
+                                 BATCH_BACKOFF_BASE_SECONDS, BATCH_BACKOFF_MAX_SECONDS)
+from src.config.prompts import (get_cover_letter_system_prompt, get_cover_letter_request,
+                                get_cold_message_prompt, COVER_LETTER_RESUME_BLOCK,
+                                COVER_LETTER_EXAMPLES_BLOCK)
 from src.core.vector_store import VectorStoreManager
+from src.core.examples import ExampleRegistry
+from src.core.context import ContextService
+from src.core.usage import UsageTracker, cached_text_block, merge_usage
+from src.core.batch import write_manifest
 
 logger = setup_logger(__name__)
 
@@ -31,33 +33,52 @@ class CoverLetterGenerator:
         Args:
             llm_model: LLM model name to use
         """
-        self.llm = ChatAnthropic(model=llm_model, temperature=0.7)
+        self.llm_model = llm_model
+        self._llm = None  # Created on first use
         self.vector_store_manager = VectorStoreManager()
-        self.cover_letter_examples = []
+        self.examples = ExampleRegistry(COVER_LETTER_EXAMPLES_DIR)
+        self.context_service = ContextService(self.vector_store_manager)  # Shared with the Q&A chatbot
+        self.usage = UsageTracker("generator")
         logger.info(f"Initialized CoverLetterGenerator with LLM model: {llm_model}")
     
-    def load_cover_letter_examples(self) -> None:
-        """Load all cover letter examples from the examples directory."""
+    @property
+    def llm(self):
+        """Anthropic chat model, constructed on first use to keep construction cheap."""
+        if self._llm is None:
+            from langchain_anthropic import ChatAnthropic
+            self._llm = ChatAnthropic(model=self.llm_model, temperature=0.7)
+        return self._llm
+    
+    @llm.setter
+    def llm(self, llm) -> None:
+        self._llm = llm
+    
+    @property
+    def cover_letter_examples(self) -> List[Dict[str, Any]]:
+        """Loaded cover letter examples (deduplicated by content)."""
+        return self.examples.examples
+    
+    @cover_letter_examples.setter
+    def cover_letter_examples(self, examples: List[Dict[str, Any]]) -> None:
+        self.examples.set_examples(examples)
+    
+    def load_cover_letter_examples(self) -> Dict[str, int]:
+        """
+        Load (or hot-reload) the cover letter examples from the examples directory.
+        
+        Safe to call repeatedly: only new or changed files are parsed, removed files are
+        dropped, and identical letters are kept once.
+        
+        Returns:
+            Dictionary with example counts and the token footprint of the examples block
+        """
         try:
-            examples_dir = Path(COVER_LETTER_EXAMPLES_DIR)
-            pdf_files = list(examples_dir.glob("*.pdf"))
+            stats = self.examples.reload()
             
-            if not pdf_files:
-                logger.warning(f"No PDF examples found in {examples_dir}")
-                return
+            if not stats["total"]:
+                logger.warning(f"No PDF examples found in {self.examples.examples_dir}")
             
-            logger.info(f"Found {len(pdf_files)} cover letter examples")
-            
-            for pdf_file in pdf_files:
-                loader = PyPDFLoader(str(pdf_file))
-                documents = loader.load()
-                self.cover_letter_examples.append({
-                    'filename': pdf_file.name,
-                    'content': documents[0].page_content
-                })
-                logger.info(f"Loaded example: {pdf_file.name}")
-            
-            logger.info(f"Successfully loaded {len(self.cover_letter_examples)} cover letter examples")
+            return stats
             
         except Exception as e:
             logger.error(f"Error loading cover letter examples: {str(e)}")
@@ -81,19 +102,43 @@ class CoverLetterGenerator:
             logger.error(f"Error loading portfolio: {str(e)}")
             raise
     
-    def _get_combined_examples(self) -> str:
-        """Combine all cover letter examples into a single reference text."""
-        if not self.cover_letter_examples:
+    def _get_combined_examples(self, job_description: str) -> str:
+        """
+        Combine the cover letter examples most relevant to the job into a single reference text.
+        
+        Args:
+            job_description: Job description used to rank the examples
+            
+        Returns:
+            Examples reference text
+        """
+        if not len(self.examples):
             logger.warning("No cover letter examples loaded")
             return "No examples available."
         
-        combined = "\n\n=== EXAMPLE SEPARATOR ===\n\n".join(
-            [f"Example from {ex['filename']}:\n{ex['content']}" 
-             for ex in self.cover_letter_examples]
-        )
-        return combined
+        selected = self.examples.select(job_description, self.vector_store_manager.embeddings,
+                                        token_budget=self.context_service.assembler.budgets["examples"])
+        return self.examples.render(selected)
+    
+    async def _aget_combined_examples(self, job_description: str) -> str:
+        """
+        Asynchronously combine the most relevant cover letter examples (see _get_combined_examples).
+        
+        Args:
+            job_description: Job description used to rank the examples
+            
+        Returns:
+            Examples reference text
+        """
+        if not len(self.examples):
+            logger.warning("No cover letter examples loaded")
+            return "No examples available."
+        
+        selected = await self.examples.aselect(job_description, self.vector_store_manager.embeddings,
+                                               token_budget=self.context_service.assembler.budgets["examples"])
+        return self.examples.render(selected)
     
-    def _build_context(self, job_description: str) -> str:
+    def _build_context(self, job_description: str, label: str) -> str:
         """
         Build context using hybrid approach:
         - Resume: Direct injection (full text, no RAG)
@@ -101,31 +146,97 @@ class CoverLetterGenerator:
         
         Args:
             job_description: Job description for portfolio retrieval
+            label: Name of the request type for the context allocation log
+            
+        Returns:
+            Combined context string
+        """
+        return self._format_context(self.context_service.get_portfolio_chunks(job_description), label)
+    
+    async def _abuild_context(self, job_description: str, label: str) -> str:
+        """
+        Asynchronously build context using the hybrid approach (see _build_context).
+        
+        Args:
+            job_description: Job description for portfolio retrieval
+            label: Name of the request type for the context allocation log
+            
+        Returns:
+            Combined context string
+        """
+        return self._format_context(await self.context_service.aget_portfolio_chunks(job_description), label)
+    
+    def _format_context(self, portfolio_chunks: List[str], label: str) -> str:
+        """
+        Combine the resume (direct injection) with retrieved portfolio chunks,
+        each fitted into its token budget.
+        
+        Args:
+            portfolio_chunks: Portfolio chunks retrieved via RAG, most relevant first (may be empty)
+            label: Name of the request type for the context allocation log
             
         Returns:
             Combined context string
         """
         context_parts = []
+        context = self.context_service.assemble(portfolio_chunks=portfolio_chunks, label=label)
+        portfolio_context = context["portfolio"]
         
         # 1. Add resume context (always direct injection)
-        if self.vector_store_manager.has_resume():
-            resume_context = self.vector_store_manager.get_resume_context(use_rag=False)
-            context_parts.append("=== RESUME ===\n" + resume_context)
-            logger.info(f"Added resume context ({len(resume_context)} chars)")
-        else:
-            logger.warning("No resume loaded")
+        if context["resume"] is not None:
+            context_parts.append("=== RESUME ===\n" + context["resume"])
+            logger.info(f"Added resume context ({len(context['resume'])} chars)")
         
         # 2. Add portfolio context via RAG (if available)
-        if self.vector_store_manager.has_portfolio():
-            portfolio_context = self.vector_store_manager.get_portfolio_context(job_description)
-            if portfolio_context:
-                context_parts.append("\n\n=== RELEVANT PROJECTS FROM PORTFOLIO ===\n" + portfolio_context)
-                logger.info(f"Added portfolio context via RAG ({len(portfolio_context)} chars)")
-        else:
-            logger.info("No portfolio loaded (optional)")
+        if portfolio_context:
+            context_parts.append("\n\n=== RELEVANT PROJECTS FROM PORTFOLIO ===\n" + portfolio_context)
+            logger.info(f"Added portfolio context via RAG ({len(portfolio_context)} chars)")
         
         return "\n\n".join(context_parts)
     
+    def _cover_letter_messages(self, job_description: str, portfolio_chunks: List[str],
+                               examples_text: str) -> list:
+        """
+        Build the cover letter messages with a stable, cacheable prefix.
+        
+        The system message holds the instructions, the full resume and the style
+        examples, marked with Anthropic cache-control breakpoints so repeat generations
+        for the same candidate read them from the prompt cache. Only the portfolio
+        retrieval and job description vary per request (and the examples, when the
+        library is large enough that they are selected per job).
+        
+        Args:
+            job_description: The job description text
+            portfolio_chunks: Portfolio chunks retrieved for the job, most relevant first (may be empty)
+            examples_text: Selected cover letter examples
+        
+        Returns:
+            List of messages for the LLM
+        """
+        from langchain_core.messages import SystemMessage, HumanMessage
+        
+        system_blocks = [{"type": "text", "text": get_cover_letter_system_prompt(CANDIDATE_NAME, MAX_WORDS)}]
+        
+        # Fit every section into its token budget (trimming is deterministic, so the prefix stays cacheable)
+        context = self.context_service.assemble(
+            portfolio_chunks=portfolio_chunks, examples=examples_text, label="cover_letter"
+        )
+        portfolio_context = context["portfolio"]
+        
+        if context["resume"] is not None:
+            system_blocks.append(cached_text_block(COVER_LETTER_RESUME_BLOCK.format(resume=context["resume"])))
+            logger.info(f"Added resume context ({len(context['resume'])} chars)")
+        
+        system_blocks.append(cached_text_block(COVER_LETTER_EXAMPLES_BLOCK.format(example_style=context["examples"])))
+        
+        if portfolio_context:
+            logger.info(f"Added portfolio context via RAG ({len(portfolio_context)} chars)")
+        
+        return [
+            SystemMessage(content=system_blocks),
+            HumanMessage(content=get_cover_letter_request(portfolio_context, job_description))
+        ]
+    
     def generate_cover_letter(self, job_description: str, company_name: str, 
                             job_title: str) -> str:
         """
@@ -142,26 +253,43 @@ class CoverLetterGenerator:
         try:
             logger.info(f"Generating cover letter for {job_title} at {company_name}")
             
-            # Get the prompt template
-            template = get_cover_letter_prompt(MAX_WORDS)
-            prompt = ChatPromptTemplate.from_template(template)
+            # Retrieve portfolio context and the most relevant examples (resume lives in the cached prefix)
+            portfolio_chunks = self.context_service.get_portfolio_chunks(job_description)
+            examples_text = self._get_combined_examples(job_description)
             
-            # Get combined examples
-            examples_text = self._get_combined_examples()
+            # Generate the cover letter
+            messages = self._cover_letter_messages(job_description, portfolio_chunks, examples_text)
+            result = self.llm.invoke(messages)
+            self.usage.record(result.usage_metadata)
+            logger.info("Cover letter generated successfully")
             
-            # Build hybrid context (resume direct + portfolio RAG)
-            context = self._build_context(job_description)
+            return result.content
             
-            # Generate the cover letter
-            messages = prompt.format_messages(
-                context=context,
-                job_description=job_description,
-                example_style=examples_text,
-                candidate_name=CANDIDATE_NAME,
-                max_words=MAX_WORDS
-            )
+        except Exception as e:
+            logger.error(f"Error generating cover letter: {str(e)}")
+            raise
+    
+    async def agenerate_cover_letter(self, job_description: str, company_name: str, 
+                                     job_title: str) -> str:
+        """
+        Asynchronously generate a personalized cover letter (non-blocking LLM call and retrieval).
+        
+        Args:
+            job_description: The job description text
+            company_name: Name of the company
+            job_title: Title of the position
+        
+        Returns:
+            Generated cover letter text
+        """
+        try:
+            logger.info(f"Generating cover letter (async) for {job_title} at {company_name}")
             
-            result = self.llm.invoke(messages)
+            portfolio_chunks = await self.context_service.aget_portfolio_chunks(job_description)
+            examples_text = await self._aget_combined_examples(job_description)
+            messages = self._cover_letter_messages(job_description, portfolio_chunks, examples_text)
+            result = await self.llm.ainvoke(messages)
+            self.usage.record(result.usage_metadata)
             logger.info("Cover letter generated successfully")
             
             return result.content
@@ -170,8 +298,156 @@ class CoverLetterGenerator:
             logger.error(f"Error generating cover letter: {str(e)}")
             raise
     
+    async def astream_cover_letter(self, job_description: str, company_name: str, 
+                                   job_title: str) -> AsyncIterator[str]:
+        """
+        Stream a personalized cover letter token by token.
+        
+        Args:
+            job_description: The job description text
+            company_name: Name of the company
+            job_title: Title of the position
+        
+        Yields:
+            Text chunks of the cover letter as they are generated
+        """
+        try:
+            logger.info(f"Streaming cover letter for {job_title} at {company_name}")
+            
+            portfolio_chunks = await self.context_service.aget_portfolio_chunks(job_description)
+            examples_text = await self._aget_combined_examples(job_description)
+            messages = self._cover_letter_messages(job_description, portfolio_chunks, examples_text)
+            usage = None
+            async for chunk in self.llm.astream(messages):
+                usage = merge_usage(usage, chunk.usage_metadata)
+                if chunk.text:
+                    yield chunk.text
+            self.usage.record(usage)
+            logger.info("Cover letter streamed successfully")
+            
+        except Exception as e:
+            logger.error(f"Error streaming cover letter: {str(e)}")
+            raise
+    
+    async def _ainvoke_with_backoff(self, messages: list):
+        """
+        Invoke the LLM, retrying rate-limit / overload errors with exponential backoff.
+        
+        Honors the Retry-After header when the API provides one.
+        
+        Args:
+            messages: Messages for the LLM
+        
+        Returns:
+            Tuple of (LLM result, number of attempts)
+        """
+        import anthropic
+        
+        for attempt in range(1, BATCH_MAX_RETRIES + 2):
+            try:
+                return await self.llm.ainvoke(messages), attempt
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                # Rate limits, server errors and 529 "overloaded" (anthropic.OverloadedError) are transient
+                transient = isinstance(e, anthropic.APIConnectionError) or e.status_code in (429, 500, 502, 503, 529)
+                if not transient or attempt > BATCH_MAX_RETRIES:
+                    raise
+                
+                retry_after = None
+                response = getattr(e, "response", None)
+                if response is not None:
+                    try:
+                        retry_after = float(response.headers.get("retry-after"))
+                    except (TypeError, ValueError):
+                        retry_after = None
+                
+                delay = retry_after or min(BATCH_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), BATCH_BACKOFF_MAX_SECONDS)
+                delay += random.uniform(0, BATCH_BACKOFF_BASE_SECONDS)
+                logger.warning(f"LLM call failed ({type(e).__name__}), retrying in {delay:.1f}s (attempt {attempt}/{BATCH_MAX_RETRIES})")
+                await asyncio.sleep(delay)
+    
+    async def agenerate_batch(self, postings: List[Dict[str, str]],
+                              output_formats: Sequence[str] = ("txt", "pdf"),
+                              max_concurrency: int = BATCH_MAX_CONCURRENCY,
+                              output_dir: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate cover letters for many job postings with bounded concurrency.
+        
+        Each posting is generated independently (a failure does not stop the batch),
+        rate-limit errors are retried with backoff, and all outputs plus a
+        manifest.json are written to a per-batch directory.
+        
+        Args:
+            postings: List of dicts with company_name, job_title and job_description
+            output_formats: Formats to save for each letter ('txt' and/or 'pdf')
+            max_concurrency: Maximum number of concurrent LLM calls
+            output_dir: Batch output directory (defaults to OUTPUT_DIR/batch_<timestamp>)
+        
+        Returns:
+            Manifest dictionary (also written to manifest.json)
+        """
+        batch_dir = Path(output_dir or Path(OUTPUT_DIR) / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        logger.info(f"Starting batch of {len(postings)} cover letters (concurrency={max_concurrency})")
+        
+        async def run_one(index: int, posting: Dict[str, str]) -> Dict[str, Any]:
+            entry = {
+                "index": index,
+                "company_name": posting["company_name"],
+                "job_title": posting["job_title"],
+                "status": "ok",
+                "files": [],
+                "attempts": 0,
+                "error": None
+            }
+            started = time.perf_counter()
+            try:
+                async with semaphore:
+                    portfolio_chunks = await self.context_service.aget_portfolio_chunks(posting["job_description"])
+                    examples_text = await self._aget_combined_examples(posting["job_description"])
+                    messages = self._cover_letter_messages(posting["job_description"], portfolio_chunks, examples_text)
+                    result, entry["attempts"] = await self._ainvoke_with_backoff(messages)
+                    self.usage.record(result.usage_metadata)
+                
+                # File writes (and PDF builds) run in worker threads so other postings keep streaming
+                for output_format in output_formats:
+                    entry["files"].append(await asyncio.to_thread(
+                        self.save_cover_letter,
+                        cover_letter=result.content,
+                        company_name=posting["company_name"],
+                        job_title=posting["job_title"],
+                        format=output_format,
+                        output_dir=str(batch_dir),
+                        filename_prefix=f"{index:03d}_"  # Postings can share company and title
+                    ))
+            except Exception as e:
+                entry["status"] = "error"
+                entry["error"] = str(e)
+                logger.error(f"Batch item {index} ({posting['job_title']} at {posting['company_name']}) failed: {str(e)}")
+            
+            entry["duration_seconds"] = round(time.perf_counter() - started, 2)
+            return entry
+        
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run_one(i, posting) for i, posting in enumerate(postings, start=1)))
+        
+        succeeded = sum(1 for entry in results if entry["status"] == "ok")
+        manifest = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "output_dir": str(batch_dir),
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "results": results
+        }
+        manifest["manifest_path"] = await asyncio.to_thread(write_manifest, manifest, batch_dir)
+        logger.info(f"Batch finished: {succeeded}/{len(results)} succeeded in {manifest['elapsed_seconds']}s")
+        return manifest
+    
     def save_cover_letter(self, cover_letter: str, company_name: str, 
-                          job_title: str, format: str = "txt") -> str:
+                          job_title: str, format: str = "txt",
+                          output_dir: Optional[str] = None, filename_prefix: str = "") -> str:
         """
         Save the generated cover letter to a file.
         
@@ -180,19 +456,21 @@ class CoverLetterGenerator:
             company_name: Name of the company
             job_title: Title of the position
             format: Output format ('txt' or 'pdf')
+            output_dir: Directory to save into (defaults to OUTPUT_DIR)
+            filename_prefix: Prepended to the file name (e.g. the posting index in a batch)
         
         Returns:
             Path to the saved file
         """
         try:
-            output_dir = Path(OUTPUT_DIR)
+            output_dir = Path(output_dir or OUTPUT_DIR)
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Sanitize company_name and job_title to remove path separators and invalid chars
             safe_company = company_name.replace("/", "_").replace("\\", "_").replace(".", "_")
             safe_job = job_title.replace("/", "_").replace("\\", "_").replace(".", "_")
             
-            filename = f"Cover_Letter_Muhammad_Cikal_Merdeka_{safe_company}_{safe_job}".replace(" ", "_")
+            filename = f"{filename_prefix}Cover_Letter_Muhammad_Cikal_Merdeka_{safe_company}_{safe_job}".replace(" ", "_")
             
             if format.lower() == "pdf":
                 file_path = output_dir / f"{filename}.pdf"
@@ -217,6 +495,13 @@ class CoverLetterGenerator:
                      job_title: str) -> None:
         """Save cover letter as PDF file."""
         try:
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib.styles import ParagraphStyle
+            from reportlab.platypus import SimpleDocTemplate, Paragraph
+            from reportlab.lib.enums import TA_JUSTIFY
+            from reportlab.pdfbase import pdfmetrics
+            from reportlab.pdfbase.ttfonts import TTFont
+            
             # Register Arial font (fallback to default if not available)
             try:
                 pdfmetrics.registerFont(TTFont('Arial', 'arial.ttf'))
@@ -263,6 +548,44 @@ class CoverLetterGenerator:
             logger.error(f"Error creating PDF: {str(e)}")
             raise
     
+    def _cold_message_messages(self, job_description: str, company_name: str, job_title: str,
+                               contact_name: str, contact_position: str, resume_link: str,
+                               context: str) -> list:
+        """
+        Format the cold message prompt into chat messages.
+        
+        Args:
+            job_description: The job description text
+            company_name: Name of the company
+            job_title: Title of the position
+            contact_name: Name of the contact person
+            contact_position: Position/title of the contact person
+            resume_link: Link to the resume
+            context: Combined resume + portfolio context
+        
+        Returns:
+            List of messages for the LLM
+        """
+        from langchain_core.prompts import ChatPromptTemplate
+        
+        # Get the prompt template with pre-filled candidate info
+        template = get_cold_message_prompt(
+            candidate_name=CANDIDATE_NAME,
+            resume_link=resume_link,
+            github_link=GITHUB_LINK,
+            website_link=WEBSITE_LINK
+        )
+        prompt = ChatPromptTemplate.from_template(template)
+        
+        return prompt.format_messages(
+            context=context,
+            job_description=job_description,
+            company_name=company_name,
+            job_title=job_title,
+            contact_name=contact_name,
+            contact_position=contact_position
+        )
+    
     def generate_cold_message(self, job_description: str, company_name: str, 
                              job_title: str, contact_name: str, contact_position: str,
                              resume_link: str) -> str:
@@ -283,29 +606,16 @@ class CoverLetterGenerator:
         try:
             logger.info(f"Generating cold message for {contact_name} ({contact_position}) at {company_name}")
             
-            # Get the prompt template with pre-filled candidate info
-            template = get_cold_message_prompt(
-                candidate_name=CANDIDATE_NAME,
-                resume_link=resume_link,
-                github_link=GITHUB_LINK,
-                website_link=WEBSITE_LINK
-            )
-            prompt = ChatPromptTemplate.from_template(template)
-            
             # Build hybrid context
-            context = self._build_context(job_description)
+            context = self._build_context(job_description, label="cold_message")
             
             # Generate the cold message
-            messages = prompt.format_messages(
-                context=context,
-                job_description=job_description,
-                company_name=company_name,
-                job_title=job_title,
-                contact_name=contact_name,
-                contact_position=contact_position
+            messages = self._cold_message_messages(
+                job_description, company_name, job_title,
+                contact_name, contact_position, resume_link, context
             )
-            
             result = self.llm.invoke(messages)
+            self.usage.record(result.usage_metadata)
             logger.info("Cold message generated successfully")
             return result.content
             
@@ -313,6 +623,77 @@ class CoverLetterGenerator:
             logger.error(f"Error generating cold message: {str(e)}")
             raise
     
+    async def agenerate_cold_message(self, job_description: str, company_name: str, 
+                                     job_title: str, contact_name: str, contact_position: str,
+                                     resume_link: str) -> str:
+        """
+        Asynchronously generate a concise cold message (non-blocking LLM call and retrieval).
+        
+        Args:
+            job_description: The job description text
+            company_name: Name of the company
+            job_title: Title of the position
+            contact_name: Name of the contact person
+            contact_position: Position/title of the contact person
+            resume_link: Link to the resume
+        
+        Returns:
+            Generated cold message text
+        """
+        try:
+            logger.info(f"Generating cold message (async) for {contact_name} ({contact_position}) at {company_name}")
+            
+            context = await self._abuild_context(job_description, label="cold_message")
+            messages = self._cold_message_messages(
+                job_description, company_name, job_title,
+                contact_name, contact_position, resume_link, context
+            )
+            result = await self.llm.ainvoke(messages)
+            self.usage.record(result.usage_metadata)
+            logger.info("Cold message generated successfully")
+            return result.content
+            
+        except Exception as e:
+            logger.error(f"Error generating cold message: {str(e)}")
+            raise
+    
+    async def astream_cold_message(self, job_description: str, company_name: str, 
+                                   job_title: str, contact_name: str, contact_position: str,
+                                   resume_link: str) -> AsyncIterator[str]:
+        """
+        Stream a concise cold message token by token.
+        
+        Args:
+            job_description: The job description text
+            company_name: Name of the company
+            job_title: Title of the position
+            contact_name: Name of the contact person
+            contact_position: Position/title of the contact person
+            resume_link: Link to the resume
+        
+        Yields:
+            Text chunks of the cold message as they are generated
+        """
+        try:
+            logger.info(f"Streaming cold message for {contact_name} ({contact_position}) at {company_name}")
+            
+            context = await self._abuild_context(job_description, label="cold_message")
+            messages = self._cold_message_messages(
+                job_description, company_name, job_title,
+                contact_name, contact_position, resume_link, context
+            )
+            usage = None
+            async for chunk in self.llm.astream(messages):
+                usage = merge_usage(usage, chunk.usage_metadata)
+                if chunk.text:
+                    yield chunk.text
+            self.usage.record(usage)
+            logger.info("Cold message streamed successfully")
+            
+        except Exception as e:
+            logger.error(f"Error streaming cold message: {str(e)}")
+            raise
+    
     def save_cold_message(self, cold_message: str, contact_name: str, company_name: str) -> str:
         """
         Save the generated cold message to a text file.
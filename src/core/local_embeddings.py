@@ -0,0 +1,95 @@
+"""
+Local embedding models for ApplyCopilot (no network calls).
+HashingEmbeddings is a deterministic feature-hashing embedder with no model download;
+SentenceTransformerEmbeddings runs a small sentence-transformer on the CPU.
+"""
+
+import hashlib
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+from src.config.logging_config import setup_logger
+from src.config.settings import LOCAL_EMBEDDING_MODEL, HASHING_EMBEDDING_DIM, EMBEDDING_BATCH_SIZE
+from src.core.bm25 import TOKEN_PATTERN
+
+logger = setup_logger(__name__)
+
+
+@lru_cache(maxsize=65536)
+def _feature_slot(feature: str, dim: int) -> tuple:
+    """Hash a feature to a (vector index, sign) pair."""
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest % dim, 1.0 if (digest >> 63) & 1 else -1.0
+
+
+class HashingEmbeddings(Embeddings):
+    """Offline embeddings from signed feature hashing of word unigrams and bigrams."""
+    
+    def __init__(self, dim: int = HASHING_EMBEDDING_DIM):
+        """
+        Initialize the hashing embedder.
+        
+        Args:
+            dim: Vector size
+        """
+        self.dim = dim
+    
+    def _embed(self, text: str) -> List[float]:
+        """Embed one text as an L2-normalized, sublinear-TF hashed feature vector."""
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        features = Counter(tokens)
+        features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+        
+        vector = [0.0] * self.dim
+        for feature, count in features.items():
+            index, sign = _feature_slot(feature, self.dim)
+            vector[index] += sign * (1.0 + math.log(count))
+        
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents."""
+        return [self._embed(text) for text in texts]
+    
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a search query."""
+        return self._embed(text)
+
+
+class SentenceTransformerEmbeddings(Embeddings):
+    """Local CPU embeddings from a sentence-transformers model, encoded in batches."""
+    
+    def __init__(self, model_name: str = LOCAL_EMBEDDING_MODEL, batch_size: int = EMBEDDING_BATCH_SIZE):
+        """
+        Load the sentence-transformers model.
+        
+        Args:
+            model_name: Hugging Face model name
+            batch_size: Texts per inference batch
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "The sentence-transformers backend needs `pip install sentence-transformers`"
+            ) from e
+        
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(model_name, device="cpu")
+        logger.info(f"Loaded local embeddings model: {model_name}")
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents in batches."""
+        vectors = self.model.encode(texts, batch_size=self.batch_size, normalize_embeddings=True,
+                                    show_progress_bar=False)
+        return vectors.tolist()
+    
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a search query."""
+        return self.embed_documents([text])[0]
@@ -0,0 +1,121 @@
+"""
+PDF text extraction for ApplyCopilot.
+Parses PDFs in a process pool (text extraction is CPU-bound) and caches the parsed
+pages keyed by a hash of the file contents, so the same document is never parsed twice,
+even when it is re-uploaded under a new path.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Dict, Sequence, Tuple
+
+from src.config.logging_config import setup_logger
+from src.config.settings import (PDF_PARSE_MAX_WORKERS, PDF_PARSE_PARALLEL_MIN_FILES,
+                                 PDF_PARSE_CACHE_MAX_ENTRIES)
+
+logger = setup_logger(__name__)
+
+# Process-wide parsed-text cache shared by every generator/session, keyed by content hash
+_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+# Content hashes of files already read, keyed by (path, mtime, size), so unchanged files are not re-hashed
+_digests: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def extract_pdf_pages(pdf_path: str) -> List[str]:
+    """
+    Extract the text of each page of a PDF (runs inside worker processes).
+    
+    Args:
+        pdf_path: Path to the PDF file
+    
+    Returns:
+        List of page texts
+    """
+    from pypdf import PdfReader
+    
+    reader = PdfReader(pdf_path)
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def _cache_key(pdf_path: str) -> str:
+    """Build the cache key for a file from the SHA-256 of its contents."""
+    path = Path(pdf_path).resolve()
+    stat = path.stat()
+    stat_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    
+    with _cache_lock:
+        digest = _digests.get(stat_key)
+        if digest is not None:
+            _digests.move_to_end(stat_key)
+            return digest
+    
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    with _cache_lock:
+        _digests[stat_key] = digest
+        while len(_digests) > PDF_PARSE_CACHE_MAX_ENTRIES:
+            _digests.popitem(last=False)
+    return digest
+
+
+def load_pdfs(pdf_paths: Sequence[str], max_workers: int = PDF_PARSE_MAX_WORKERS) -> Dict[str, List[str]]:
+    """
+    Load the page texts of several PDFs, parsing uncached files in parallel.
+    
+    Args:
+        pdf_paths: Paths to the PDF files
+        max_workers: Maximum number of worker processes
+    
+    Returns:
+        Dictionary mapping each given path to its list of page texts
+    """
+    keys = {str(path): _cache_key(str(path)) for path in pdf_paths}
+    pages: Dict[str, List[str]] = {}
+    
+    with _cache_lock:
+        for path, key in keys.items():
+            if key in _cache:
+                _cache.move_to_end(key)
+                pages[path] = _cache[key]
+    
+    missing = [path for path in keys if path not in pages]
+    # Identical files given under several paths are parsed once
+    to_parse = {keys[path]: path for path in missing}
+    if to_parse:
+        parse_paths = list(to_parse.values())
+        if len(parse_paths) >= PDF_PARSE_PARALLEL_MIN_FILES and max_workers > 1:
+            workers = min(max_workers, len(parse_paths))
+            # spawn avoids forking a multi-threaded server process
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+                parsed = list(pool.map(extract_pdf_pages, parse_paths))
+            logger.info(f"Parsed {len(parse_paths)} PDFs with {workers} worker processes")
+        else:
+            parsed = [extract_pdf_pages(path) for path in parse_paths]
+        
+        parsed_by_key = dict(zip(to_parse.keys(), parsed))
+        with _cache_lock:
+            for path in missing:
+                pages[path] = parsed_by_key[keys[path]]
+            _cache.update(parsed_by_key)
+            while len(_cache) > PDF_PARSE_CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+    
+    logger.info(f"Loaded {len(keys)} PDFs ({len(keys) - len(missing)} from cache, {len(to_parse)} parsed)")
+    return pages
+
+
+def load_pdf(pdf_path: str) -> List[str]:
+    """
+    Load the page texts of a single PDF (cached by content hash).
+    
+    Args:
+        pdf_path: Path to the PDF file
+    
+    Returns:
+        List of page texts
+    """
+    return load_pdfs([pdf_path])[str(pdf_path)]
@@ -0,0 +1,180 @@
+"""
+Persistent candidate profile store for ApplyCopilot.
+Saves the parsed resume text, FAISS indexes (resume + portfolio, chunk metadata included)
+and cover letter examples under a profile name, so a restart doesn't force re-parsing PDFs
+and re-embedding the portfolio.
+"""
+
+import json
+import re
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from src.config.logging_config import setup_logger
+from src.config.settings import PROFILES_DIR, DEFAULT_PROFILE_NAME
+
+logger = setup_logger(__name__)
+
+PROFILE_FILE = "profile.json"
+
+
+class CandidateProfileStore:
+    """Saves and restores named candidate profiles on disk."""
+    
+    def __init__(self, profiles_dir: Path = PROFILES_DIR):
+        """
+        Initialize the profile store.
+        
+        Args:
+            profiles_dir: Directory holding one sub-directory per profile
+        """
+        self.profiles_dir = Path(profiles_dir)
+        self._lock = threading.Lock()
+    
+    def profile_dir(self, name: str = DEFAULT_PROFILE_NAME) -> Path:
+        """
+        Get the directory of a profile.
+        
+        Args:
+            name: Profile name (letters, digits, '-' and '_')
+        
+        Returns:
+            Path to the profile directory
+        """
+        if not re.fullmatch(r"[A-Za-z0-9_-]+", name or ""):
+            raise ValueError(f"Invalid profile name: {name!r} (use letters, digits, '-' or '_')")
+        return self.profiles_dir / name
+    
+    def exists(self, name: str = DEFAULT_PROFILE_NAME) -> bool:
+        """Check whether a saved profile exists."""
+        self._recover_interrupted_swap(name)
+        return (self.profile_dir(name) / PROFILE_FILE).exists()
+    
+    def _recover_interrupted_swap(self, name: str) -> None:
+        """Put the previous profile back if a save crashed after moving it aside."""
+        target_dir = self.profile_dir(name)
+        old_dir = target_dir.with_name(f".{name}.old")
+        if old_dir.exists() and not target_dir.exists():
+            old_dir.rename(target_dir)
+            logger.warning(f"Restored candidate profile '{name}' after an interrupted save")
+    
+    def save(self, generator, name: str = DEFAULT_PROFILE_NAME) -> str:
+        """
+        Save the generator's resume, portfolio, indexes and examples as a profile.
+        
+        The profile is written to a temporary directory first. The previous profile is
+        then renamed aside, the new one renamed into place and only then is the old one
+        deleted, so a crash mid-save leaves either the old or the new profile (an
+        interrupted swap is undone on the next exists()/load()).
+        
+        Args:
+            generator: CoverLetterGenerator holding the indexed documents
+            name: Profile name
+        
+        Returns:
+            Path to the profile directory
+        """
+        target_dir = self.profile_dir(name)
+        tmp_dir = target_dir.with_name(f".{name}.tmp")
+        
+        try:
+            with self._lock:
+                self._recover_interrupted_swap(name)
+                self._write(generator, name, target_dir, tmp_dir)
+            logger.info(f"Saved candidate profile '{name}' to: {target_dir}")
+            return str(target_dir)
+            
+        except Exception as e:
+            logger.error(f"Error saving candidate profile '{name}': {str(e)}")
+            raise
+    
+    def _write(self, generator, name: str, target_dir: Path, tmp_dir: Path) -> None:
+        """Write a profile into tmp_dir and swap it into place (caller holds the lock)."""
+        vector_store_manager = generator.vector_store_manager
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+        
+        vector_store_manager.save_vector_store(str(tmp_dir / "resume"), store_type="resume")
+        vector_store_manager.save_vector_store(str(tmp_dir / "portfolio"), store_type="portfolio")
+        
+        profile = {
+            "name": name,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "embeddings_model": vector_store_manager.embeddings_model,
+            "resume_text": vector_store_manager.resume_text_cache,
+            "cover_letter_examples": generator.cover_letter_examples
+        }
+        with open(tmp_dir / PROFILE_FILE, "w", encoding="utf-8") as f:
+            json.dump(profile, f, ensure_ascii=False)
+        
+        old_dir = target_dir.with_name(f".{name}.old")
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+        if target_dir.exists():
+            target_dir.rename(old_dir)
+        tmp_dir.rename(target_dir)
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+    
+    def load(self, generator, name: str = DEFAULT_PROFILE_NAME) -> Optional[Dict[str, Any]]:
+        """
+        Restore a saved profile into a generator (and its VectorStoreManager).
+        
+        Args:
+            generator: CoverLetterGenerator to load the profile into
+            name: Profile name
+        
+        Returns:
+            Profile summary dictionary, or None if no usable profile exists
+        """
+        profile_dir = self.profile_dir(name)
+        if not self.exists(name):
+            logger.info(f"No saved candidate profile '{name}'")
+            return None
+        
+        try:
+            with open(profile_dir / PROFILE_FILE, encoding="utf-8") as f:
+                profile = json.load(f)
+            
+            vector_store_manager = generator.vector_store_manager
+            if profile.get("embeddings_model") != vector_store_manager.embeddings_model:
+                logger.warning(
+                    f"Profile '{name}' was embedded with {profile.get('embeddings_model')}, "
+                    f"not {vector_store_manager.embeddings_model}; skipping it"
+                )
+                return None
+            
+            if (profile_dir / "resume").exists():
+                vector_store_manager.load_vector_store(str(profile_dir / "resume"), store_type="resume")
+            if (profile_dir / "portfolio").exists():
+                vector_store_manager.load_vector_store(str(profile_dir / "portfolio"), store_type="portfolio")
+            
+            vector_store_manager.resume_text_cache = profile.get("resume_text")
+            generator.cover_letter_examples = profile.get("cover_letter_examples", [])
+            
+            logger.info(f"Loaded candidate profile '{name}' saved at {profile.get('saved_at')}")
+            return {
+                "name": name,
+                "saved_at": profile.get("saved_at"),
+                "has_resume": vector_store_manager.has_resume(),
+                "has_portfolio": vector_store_manager.has_portfolio(),
+                "examples": len(generator.cover_letter_examples)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error loading candidate profile '{name}': {str(e)}")
+            raise
+    
+    def delete(self, name: str = DEFAULT_PROFILE_NAME) -> None:
+        """Delete a saved profile."""
+        profile_dir = self.profile_dir(name)
+        old_dir = profile_dir.with_name(f".{name}.old")
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+        if profile_dir.exists():
+            shutil.rmtree(profile_dir)
+            logger.info(f"Deleted candidate profile '{name}'")
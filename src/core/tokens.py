@@ -0,0 +1,84 @@
+"""
+Token counting helpers for ApplyCopilot.
+Used to report and budget prompt sizes. Counts come from tiktoken's cl100k_base encoding,
+which approximates Claude's tokenizer closely enough for budgeting; without tiktoken,
+a ~4 characters per token estimate is used. tiktoken downloads the encoding file once on
+first use (cached under TIKTOKEN_CACHE_DIR); offline, the estimate is used instead.
+estimate_tokens never loads tiktoken (used where exact counts don't matter).
+"""
+
+from functools import lru_cache
+
+from src.config.logging_config import setup_logger
+
+logger = setup_logger(__name__)
+
+CHARS_PER_TOKEN = 4  # Fallback estimate when tiktoken is unavailable
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding once (None if tiktoken is not installed)."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable, estimating tokens from characters: {e}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the tokens in a text from its length, without loading tiktoken.
+    
+    Args:
+        text: Text to estimate
+    
+    Returns:
+        Estimated number of tokens
+    """
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+@lru_cache(maxsize=256)
+def count_tokens(text: str) -> int:
+    """
+    Count (approximately) the tokens in a text.
+    
+    Args:
+        text: Text to count
+    
+    Returns:
+        Number of tokens
+    """
+    if not text:
+        return 0
+    
+    encoding = _get_encoding()
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut a text down to at most max_tokens tokens (keeping the beginning).
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+    
+    Returns:
+        The text itself if it fits, otherwise its truncated beginning
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
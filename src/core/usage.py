@@ -0,0 +1,101 @@
+"""
+Token usage tracking for ApplyCopilot LLM calls.
+Accumulates input/output tokens and Anthropic prompt-cache reads/writes.
+"""
+
+import threading
+from typing import Dict, Any, Optional
+
+from src.config.logging_config import setup_logger
+
+logger = setup_logger(__name__)
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def cached_text_block(text: str) -> Dict[str, Any]:
+    """
+    Build a text content block marked as an Anthropic prompt-cache breakpoint.
+    
+    Args:
+        text: Block text (everything up to and including it is cached)
+    
+    Returns:
+        Content block dict
+    """
+    return {"type": "text", "text": text, "cache_control": CACHE_CONTROL}
+
+
+def merge_usage(total: Optional[Dict[str, Any]], chunk_usage: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Add the usage metadata of a streamed chunk to a running total.
+    
+    Args:
+        total: Usage accumulated so far (None before the first chunk)
+        chunk_usage: Usage metadata of the current chunk (may be None)
+    
+    Returns:
+        Updated running total
+    """
+    if not chunk_usage:
+        return total
+    
+    from langchain_core.messages.ai import add_usage
+    return add_usage(total, chunk_usage)
+
+
+class UsageTracker:
+    """Accumulates token usage, including prompt-cache read/write tokens."""
+    
+    def __init__(self, name: str):
+        """
+        Initialize the usage tracker.
+        
+        Args:
+            name: Label used in log messages (e.g. "cover_letter")
+        """
+        self.name = name
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
+        self._lock = threading.Lock()
+    
+    def record(self, usage_metadata: Optional[Dict[str, Any]]) -> None:
+        """
+        Record the usage of one LLM call.
+        
+        Args:
+            usage_metadata: LangChain usage metadata from the AIMessage (may be None)
+        """
+        if not usage_metadata:
+            return
+        
+        details = usage_metadata.get("input_token_details") or {}
+        cache_read = details.get("cache_read") or 0
+        cache_creation = details.get("cache_creation") or 0
+        
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += usage_metadata.get("input_tokens", 0)
+            self.output_tokens += usage_metadata.get("output_tokens", 0)
+            self.cache_read_tokens += cache_read
+            self.cache_creation_tokens += cache_creation
+        
+        logger.info(
+            f"[{self.name}] tokens: input={usage_metadata.get('input_tokens', 0)} "
+            f"(cache read={cache_read}, cache write={cache_creation}), "
+            f"output={usage_metadata.get('output_tokens', 0)}"
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cumulative usage counters."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "cache_read_tokens": self.cache_read_tokens,
+                "cache_creation_tokens": self.cache_creation_tokens
+            }
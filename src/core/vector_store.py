@@ -1,22 +1,30 @@
 import os
+import re
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
-from langchain_core.documents import Document
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 
 from src.config.logging_config import setup_logger
 from src.config.settings import (
-    EMBEDDING_MODEL, 
+    EMBEDDING_BACKEND,
     TOP_K_RESULTS, 
     PORTFOLIO_TOP_K,
+    HYBRID_CANDIDATES,
+    RETRIEVAL_CACHE_MAX_ENTRIES,
     CHUNK_SIZE, 
     CHUNK_OVERLAP,
     PORTFOLIO_CHUNK_SIZE,
     PORTFOLIO_CHUNK_OVERLAP
 )
+from src.core.bm25 import BM25Index, reciprocal_rank_fusion
+from src.core.pdf_loader import load_pdf
+
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+    from src.core.embedding_cache import CachedEmbeddings
 
 logger = setup_logger(__name__)
 
@@ -24,18 +32,48 @@ logger = setup_logger(__name__)
 class VectorStoreManager:
     """Manages FAISS vector store for resume and portfolio documents with hybrid approach."""
     
-    def __init__(self, embeddings_model: str = EMBEDDING_MODEL):
+    def __init__(self, embeddings_model: Optional[str] = None, embedding_backend: str = EMBEDDING_BACKEND):
         """
         Initialize the vector store manager.
         
         Args:
-            embeddings_model: OpenAI embeddings model name
+            embeddings_model: Embeddings model name (defaults to the backend's model)
+            embedding_backend: "openai", "hashing" or "sentence-transformers"
         """
-        self.embeddings = OpenAIEmbeddings(model=embeddings_model)
+        from src.core.embedding_backends import default_model_name
+        
+        self.embedding_backend = embedding_backend
+        self.embeddings_model = embeddings_model or default_model_name(embedding_backend)
+        self._embeddings: Optional["CachedEmbeddings"] = None  # Created on first use
         self.resume_vector_store = None
         self.portfolio_vector_store = None
+        self.portfolio_chunk_ids: Dict[str, str] = {}  # Chunk fingerprint -> docstore id
+        self.portfolio_keyword_index = BM25Index()  # Keyword side of hybrid portfolio retrieval, by docstore id
+        # Index versions are bumped on every mutation; retrieval results are cached per version
+        self.index_versions: Dict[str, int] = {"resume": 0, "portfolio": 0}
+        self._retrieval_cache: "OrderedDict[Tuple[str, str, int, int], List[str]]" = OrderedDict()
+        self._retrieval_lock = threading.Lock()
+        self.retrieval_hits = 0
+        self.retrieval_misses = 0
         self.resume_text_cache = None  # For direct injection when resume is short
-        logger.info(f"Initialized VectorStoreManager with embeddings model: {embeddings_model}")
+        logger.info(f"Initialized VectorStoreManager with {embedding_backend} embeddings model: {self.embeddings_model}")
+    
+    @property
+    def embeddings(self) -> "CachedEmbeddings":
+        """Cached embeddings of the configured backend, constructed on first use to keep construction cheap."""
+        if self._embeddings is None:
+            from src.core.embedding_backends import create_embeddings
+            from src.core.embedding_cache import CachedEmbeddings
+            self._embeddings = CachedEmbeddings(
+                create_embeddings(self.embedding_backend, self.embeddings_model), self.embeddings_model
+            )
+        return self._embeddings
+    
+    @embeddings.setter
+    def embeddings(self, embeddings: "CachedEmbeddings") -> None:
+        self._embeddings = embeddings
+        self._bump_version("resume")
+        self._bump_version("portfolio")
     
     def load_and_index_resume(self, resume_path: str) -> Dict[str, Any]:
         """
@@ -49,11 +87,17 @@ class VectorStoreManager:
             Dictionary with resume info (use_direct_injection, text_length)
         """
         try:
+            from langchain_core.documents import Document
+            from langchain_text_splitters import RecursiveCharacterTextSplitter
+            
             logger.info(f"Loading resume from: {resume_path}")
             
-            # Load PDF
-            loader = PyPDFLoader(resume_path)
-            documents = loader.load()
+            # Load PDF (re-uploads of an unchanged file hit the parse cache)
+            pages = load_pdf(resume_path)
+            documents = [
+                Document(page_content=text, metadata={"source": resume_path, "page": page, "total_pages": len(pages)})
+                for page, text in enumerate(pages)
+            ]
             logger.info(f"Loaded {len(documents)} pages from resume")
             
             # Combine all text for length check
@@ -73,17 +117,19 @@ class VectorStoreManager:
             logger.info(f"Split resume into {len(splits)} chunks")
             
             # Create or update vector store
-            if self.resume_vector_store is None:
-                self.resume_vector_store = FAISS.from_documents(splits, self.embeddings)
-                logger.info("Created new FAISS vector store for resume")
-            else:
-                self.resume_vector_store.add_documents(splits)
-                logger.info("Added documents to existing resume vector store")
+            cache_before = self.embeddings.get_stats()
+            created = self.resume_vector_store is None
+            self.resume_vector_store, embedding_stats = self._index_documents(self.resume_vector_store, splits)
+            logger.info("Created new FAISS vector store for resume" if created
+                        else "Added documents to existing resume vector store")
+            self._bump_version("resume")
             
             return {
                 "use_direct_injection": True,  # Always prefer direct for resume
                 "text_length": text_length,
-                "chunks_created": len(splits)
+                "chunks_created": len(splits),
+                "chunks_per_sec": embedding_stats["chunks_per_sec"],
+                **self._cache_delta(cache_before)
             }
                 
         except Exception as e:
@@ -92,9 +138,14 @@ class VectorStoreManager:
     
     def load_and_index_portfolio(self, portfolio_path: str) -> Dict[str, Any]:
         """
-        Load a portfolio text file and create/update the FAISS vector store.
+        Load a portfolio text file and incrementally update the FAISS vector store.
         Portfolio uses RAG approach due to longer content.
         
+        Chunks are fingerprinted by content and diffed against the currently indexed
+        portfolio: removed chunks are deleted, only new/changed chunks are embedded,
+        and unchanged chunks keep their existing vectors. Nothing is changed if
+        embedding fails, so the update can simply be retried.
+        
         Args:
             portfolio_path: Path to the portfolio text file
             
@@ -102,6 +153,9 @@ class VectorStoreManager:
             Dictionary with portfolio info
         """
         try:
+            from langchain_community.document_loaders import TextLoader
+            from langchain_text_splitters import RecursiveCharacterTextSplitter
+            
             logger.info(f"Loading portfolio from: {portfolio_path}")
             
             # Load text file
@@ -123,24 +177,236 @@ class VectorStoreManager:
             splits = text_splitter.split_documents(documents)
             logger.info(f"Split portfolio into {len(splits)} chunks")
             
-            # Create or update portfolio vector store
-            if self.portfolio_vector_store is None:
-                self.portfolio_vector_store = FAISS.from_documents(splits, self.embeddings)
-                logger.info("Created new FAISS vector store for portfolio")
-            else:
-                self.portfolio_vector_store.add_documents(splits)
-                logger.info("Added documents to existing portfolio vector store")
+            # Fingerprint chunks (identical chunks collapse into one entry)
+            new_chunks: Dict[str, "Document"] = {}
+            for doc in splits:
+                new_chunks.setdefault(self._fingerprint(doc.page_content), doc)
+            
+            removed = [fp for fp in self.portfolio_chunk_ids if fp not in new_chunks]
+            added = [fp for fp in new_chunks if fp not in self.portfolio_chunk_ids]
+            unchanged = len(new_chunks) - len(added)
+            
+            # Embed new/changed chunks first; the store is only touched once that succeeded
+            cache_before = self.embeddings.get_stats()
+            added_ids = [str(uuid.uuid4()) for _ in added]
+            added_docs = [new_chunks[fp] for fp in added]
+            embedded, embedding_stats = self._embed_documents(added_docs, added_ids)
+            self._apply_portfolio_diff(removed, added, added_docs, embedded)
+            logger.info(f"Portfolio diff: {len(added)} added, {len(removed)} removed, {unchanged} unchanged chunks")
             
             return {
                 "text_length": text_length,
                 "chunks_created": len(splits),
-                "use_rag": True
+                "chunks_added": len(added),
+                "chunks_removed": len(removed),
+                "chunks_unchanged": unchanged,
+                "chunks_per_sec": embedding_stats["chunks_per_sec"],
+                "use_rag": True,
+                **self._cache_delta(cache_before)
             }
                 
         except Exception as e:
             logger.error(f"Error loading and indexing portfolio: {str(e)}")
             raise
     
+    def _apply_portfolio_diff(self, removed: List[str], added: List[str], added_docs: List["Document"],
+                              embedded: Dict[str, list]) -> None:
+        """
+        Apply a portfolio chunk diff to the vector store, the id map and the keyword index together.
+        
+        If the store update fails part-way, the id map and keyword index are rebuilt from
+        the docstore so they keep describing exactly what is indexed.
+        
+        Args:
+            removed: Fingerprints of chunks to delete
+            added: Fingerprints of chunks to add
+            added_docs: Documents of the added chunks (same order as added)
+            embedded: _embed_documents() output for added_docs
+        """
+        created = self.portfolio_vector_store is None
+        try:
+            if created:
+                self.portfolio_vector_store = self._add_embedded(None, embedded)
+                logger.info("Created new FAISS vector store for portfolio")
+            else:
+                if removed:
+                    self.portfolio_vector_store.delete([self.portfolio_chunk_ids[fp] for fp in removed])
+                self._add_embedded(self.portfolio_vector_store, embedded)
+                logger.info("Updated existing portfolio vector store incrementally")
+        except Exception:
+            if not created:
+                logger.warning("Portfolio store update failed, rebuilding chunk map from the docstore")
+                self._rebuild_portfolio_chunk_ids()
+                self._bump_version("portfolio")
+            raise
+        
+        for fp in removed:
+            self.portfolio_keyword_index.remove(self.portfolio_chunk_ids.pop(fp))
+        self.portfolio_chunk_ids.update(zip(added, embedded["ids"]))
+        self.portfolio_keyword_index.add_many(zip(embedded["ids"], (doc.page_content for doc in added_docs)))
+        if added or removed:
+            self._bump_version("portfolio")
+    
+    def _index_documents(self, vector_store, documents: List["Document"],
+                         ids: Optional[List[str]] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Embed documents through the batched pipeline and add them to a FAISS store.
+        
+        Args:
+            vector_store: Existing FAISS store, or None to create one
+            documents: Documents to embed and add
+            ids: Docstore ids for the documents (generated when omitted)
+            
+        Returns:
+            Tuple of (FAISS store, embedding pipeline stats)
+        """
+        embedded, stats = self._embed_documents(documents, ids)
+        return self._add_embedded(vector_store, embedded), stats
+    
+    def _embed_documents(self, documents: List["Document"],
+                         ids: Optional[List[str]] = None) -> Tuple[Dict[str, list], Dict[str, Any]]:
+        """
+        Embed documents through the batched pipeline without touching any store.
+        
+        Vectors are collected until every batch has succeeded, so a failed batch
+        never leaves part of the documents in an index.
+        
+        Args:
+            documents: Documents to embed
+            ids: Docstore ids for the documents (generated when omitted)
+            
+        Returns:
+            Tuple of (dict with text_embeddings, metadatas and ids in document order, pipeline stats)
+        """
+        from src.core.embedding_pipeline import embed_in_batches
+        from src.core.tokens import count_tokens, estimate_tokens
+        
+        texts = [doc.page_content for doc in documents]
+        vectors: List[Optional[List[float]]] = [None] * len(documents)
+        
+        def collect_batch(indices: List[int], batch_vectors: List[List[float]]) -> None:
+            for i, vector in zip(indices, batch_vectors):
+                vectors[i] = vector
+        
+        # Only the OpenAI API enforces a per-request token limit; local backends skip tiktoken
+        token_counter = count_tokens if self.embedding_backend == "openai" else estimate_tokens
+        stats = embed_in_batches(self.embeddings, texts, collect_batch, token_counter=token_counter)
+        embedded = {
+            "text_embeddings": list(zip(texts, vectors)),
+            "metadatas": [doc.metadata for doc in documents],
+            "ids": ids or [str(uuid.uuid4()) for _ in documents]
+        }
+        return embedded, stats
+    
+    def _add_embedded(self, vector_store, embedded: Dict[str, list]):
+        """
+        Add pre-computed embeddings to a FAISS store in a single call.
+        
+        Args:
+            vector_store: Existing FAISS store, or None to create one
+            embedded: Output of _embed_documents()
+            
+        Returns:
+            The FAISS store
+        """
+        from langchain_community.vectorstores import FAISS
+        
+        if not embedded["text_embeddings"]:
+            if vector_store is None:
+                raise ValueError("No text chunks to index")
+            return vector_store
+        
+        if vector_store is None:
+            return FAISS.from_embeddings(embedded["text_embeddings"], self.embeddings,
+                                         metadatas=embedded["metadatas"], ids=embedded["ids"])
+        vector_store.add_embeddings(embedded["text_embeddings"], metadatas=embedded["metadatas"], ids=embedded["ids"])
+        return vector_store
+    
+    @staticmethod
+    def _fingerprint(text: str) -> str:
+        """Compute a content fingerprint for a chunk."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    
+    def _rebuild_portfolio_chunk_ids(self) -> None:
+        """Rebuild the fingerprint -> docstore id map and the keyword index from the portfolio vector store."""
+        from langchain_core.documents import Document
+        
+        self.portfolio_chunk_ids = {}
+        self.portfolio_keyword_index.clear()
+        if self.portfolio_vector_store is None:
+            return
+        
+        for doc_id in self.portfolio_vector_store.index_to_docstore_id.values():
+            doc = self.portfolio_vector_store.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                self.portfolio_chunk_ids[self._fingerprint(doc.page_content)] = doc_id
+                self.portfolio_keyword_index.add(doc_id, doc.page_content)
+    
+    def _bump_version(self, store_type: str) -> None:
+        """Mark an index as changed and drop its cached retrieval results."""
+        with self._retrieval_lock:
+            self.index_versions[store_type] += 1
+            for key in [key for key in self._retrieval_cache if key[0] == store_type]:
+                del self._retrieval_cache[key]
+    
+    def _retrieval_key(self, store_type: str, query: str, k: int) -> Tuple[str, str, int, int]:
+        """Key a retrieval by store, normalized query hash, k and current index version."""
+        normalized = re.sub(r"\s+", " ", query).strip()
+        query_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return (store_type, query_hash, k, self.index_versions[store_type])
+    
+    def _recall_retrieval(self, key: Tuple[str, str, int, int]) -> Optional[List[str]]:
+        """Return a copy of a cached retrieval result (or None), updating the counters."""
+        with self._retrieval_lock:
+            chunks = self._retrieval_cache.get(key)
+            if chunks is None:
+                self.retrieval_misses += 1
+                return None
+            self._retrieval_cache.move_to_end(key)
+            self.retrieval_hits += 1
+        logger.info(f"Using cached {key[0]} retrieval (k={key[2]})")
+        return list(chunks)
+    
+    def _remember_retrieval(self, key: Tuple[str, str, int, int], chunks: List[str]) -> List[str]:
+        """Cache a retrieval result (unless the index changed meanwhile) and return it."""
+        with self._retrieval_lock:
+            if key[3] == self.index_versions[key[0]]:
+                self._retrieval_cache[key] = list(chunks)
+                while len(self._retrieval_cache) > RETRIEVAL_CACHE_MAX_ENTRIES:
+                    self._retrieval_cache.popitem(last=False)
+        return chunks
+    
+    def get_retrieval_cache_stats(self) -> Dict[str, int]:
+        """
+        Get retrieval result cache counters.
+        
+        Returns:
+            Dictionary with hits, misses and number of cached results
+        """
+        with self._retrieval_lock:
+            return {
+                "hits": self.retrieval_hits,
+                "misses": self.retrieval_misses,
+                "entries": len(self._retrieval_cache)
+            }
+    
+    def clear_retrieval_cache(self) -> None:
+        """Drop all cached retrieval results."""
+        with self._retrieval_lock:
+            self._retrieval_cache.clear()
+    
+    def _cache_delta(self, before: Dict[str, Any]) -> Dict[str, int]:
+        """Compute embedding cache hits/misses since a previous stats snapshot."""
+        after = self.embeddings.get_stats()
+        hits = after["hits"] - before["hits"]
+        misses = after["misses"] - before["misses"]
+        logger.info(f"Embedding cache: {hits} hits, {misses} misses")
+        return {"cache_hits": hits, "cache_misses": misses}
+    
+    def get_embedding_cache_stats(self) -> Dict[str, Any]:
+        """Get cumulative embedding cache hit/miss counters."""
+        return self.embeddings.get_stats()
+    
     def get_resume_context(self, use_rag: bool = False, query: str = None, k: int = TOP_K_RESULTS) -> str:
         """
         Get resume context either through direct injection or RAG.
@@ -158,10 +424,14 @@ class VectorStoreManager:
             return self.resume_text_cache
         
         if use_rag and query and self.resume_vector_store:
-            logger.info(f"Using RAG for resume retrieval with k={k}")
-            results = self.resume_vector_store.similarity_search(query, k=k)
-            context = "\n\n".join([doc.page_content for doc in results])
-            return context
+            key = self._retrieval_key("resume", query, k)
+            chunks = self._recall_retrieval(key)
+            if chunks is None:
+                logger.info(f"Using RAG for resume retrieval with k={k}")
+                query_vector = self.embeddings.embed_query(query)
+                results = self.resume_vector_store.similarity_search_by_vector(query_vector, k=k)
+                chunks = self._remember_retrieval(key, [doc.page_content for doc in results])
+            return "\n\n".join(chunks)
         
         if self.resume_text_cache:
             logger.info("Falling back to direct resume injection")
@@ -169,6 +439,87 @@ class VectorStoreManager:
         
         raise ValueError("No resume data available. Please load a resume first.")
     
+    def get_portfolio_chunks(self, query: str, k: int = PORTFOLIO_TOP_K) -> List[str]:
+        """
+        Retrieve portfolio chunks through hybrid (vector + BM25) retrieval, most relevant first.
+        
+        Args:
+            query: Search query (job description)
+            k: Number of chunks to retrieve
+            
+        Returns:
+            List of chunk texts ordered by fused rank
+        """
+        if self.portfolio_vector_store is None:
+            logger.info("No portfolio indexed, returning empty context")
+            return []
+        
+        key = self._retrieval_key("portfolio", query, k)
+        chunks = self._recall_retrieval(key)
+        if chunks is not None:
+            return chunks
+        
+        logger.info(f"Retrieving portfolio context with k={k}")
+        # Query embeddings come from the LRU in CachedEmbeddings (no API call for repeated queries)
+        query_vector = self.embeddings.embed_query(query)
+        dense_results = self.portfolio_vector_store.similarity_search_by_vector(
+            query_vector, k=max(k, HYBRID_CANDIDATES)
+        )
+        return self._remember_retrieval(key, self._fuse_portfolio_results(query, dense_results, k))
+    
+    async def aget_portfolio_chunks(self, query: str, k: int = PORTFOLIO_TOP_K) -> List[str]:
+        """
+        Asynchronously retrieve portfolio chunks through hybrid (vector + BM25) retrieval, most relevant first.
+        
+        Args:
+            query: Search query (job description)
+            k: Number of chunks to retrieve
+            
+        Returns:
+            List of chunk texts ordered by fused rank
+        """
+        if self.portfolio_vector_store is None:
+            logger.info("No portfolio indexed, returning empty context")
+            return []
+        
+        key = self._retrieval_key("portfolio", query, k)
+        chunks = self._recall_retrieval(key)
+        if chunks is not None:
+            return chunks
+        
+        logger.info(f"Retrieving portfolio context asynchronously with k={k}")
+        query_vector = await self.embeddings.aembed_query(query)
+        dense_results = await self.portfolio_vector_store.asimilarity_search_by_vector(
+            query_vector, k=max(k, HYBRID_CANDIDATES)
+        )
+        return self._remember_retrieval(key, self._fuse_portfolio_results(query, dense_results, k))
+    
+    def _fuse_portfolio_results(self, query: str, dense_results: List["Document"], k: int) -> List[str]:
+        """
+        Fuse dense (FAISS) and keyword (BM25) portfolio rankings with reciprocal rank fusion.
+        
+        Args:
+            query: Search query
+            dense_results: FAISS results, most similar first
+            k: Number of chunks to return
+            
+        Returns:
+            List of chunk texts, best fused rank first
+        """
+        dense_ids = [self.portfolio_chunk_ids.get(self._fingerprint(doc.page_content)) for doc in dense_results]
+        dense_ids = [doc_id for doc_id in dense_ids if doc_id is not None]
+        keyword_ids = [doc_id for doc_id, _ in self.portfolio_keyword_index.search(query, max(k, HYBRID_CANDIDATES))]
+        
+        chunks = []
+        for doc_id in reciprocal_rank_fusion([dense_ids, keyword_ids])[:k]:
+            doc = self.portfolio_vector_store.docstore.search(doc_id)
+            if not isinstance(doc, str):
+                chunks.append(doc.page_content)
+        
+        logger.info(f"Retrieved {len(chunks)} portfolio chunks "
+                    f"({len(dense_ids)} dense and {len(keyword_ids)} keyword candidates)")
+        return chunks
+    
     def get_portfolio_context(self, query: str, k: int = PORTFOLIO_TOP_K) -> str:
         """
         Get portfolio context through RAG retrieval.
@@ -181,15 +532,20 @@ class VectorStoreManager:
         Returns:
             Portfolio context as string
         """
-        if self.portfolio_vector_store is None:
-            logger.info("No portfolio indexed, returning empty context")
-            return ""
+        return "\n\n".join(self.get_portfolio_chunks(query, k=k))
+    
+    async def aget_portfolio_context(self, query: str, k: int = PORTFOLIO_TOP_K) -> str:
+        """
+        Asynchronously get portfolio context through RAG retrieval.
         
-        logger.info(f"Retrieving portfolio context with k={k}")
-        results = self.portfolio_vector_store.similarity_search(query, k=k)
-        context = "\n\n".join([doc.page_content for doc in results])
-        logger.info(f"Retrieved {len(results)} portfolio chunks")
-        return context
+        Args:
+            query: Search query (job description)
+            k: Number of chunks to retrieve
+            
+        Returns:
+            Portfolio context as string
+        """
+        return "\n\n".join(await self.aget_portfolio_chunks(query, k=k))
     
     def has_portfolio(self) -> bool:
         """Check if portfolio has been indexed."""
@@ -230,6 +586,8 @@ class VectorStoreManager:
             store_type: Either "resume" or "portfolio"
         """
         try:
+            from langchain_community.vectorstores import FAISS
+            
             vector_store = FAISS.load_local(
                 load_path, 
                 self.embeddings,
@@ -240,6 +598,8 @@ class VectorStoreManager:
                 self.resume_vector_store = vector_store
             else:
                 self.portfolio_vector_store = vector_store
+                self._rebuild_portfolio_chunk_ids()
+            self._bump_version(store_type)
                 
             logger.info(f"Loaded {store_type} vector store from: {load_path}")
         except Exception as e:
@@ -256,10 +616,14 @@ class VectorStoreManager:
         if store_type in ["resume", "all"]:
             self.resume_vector_store = None
             self.resume_text_cache = None
+            self._bump_version("resume")
             logger.info("Resume vector store cleared")
         
         if store_type in ["portfolio", "all"]:
             self.portfolio_vector_store = None
+            self.portfolio_chunk_ids = {}
+            self.portfolio_keyword_index.clear()
+            self._bump_version("portfolio")
             logger.info("Portfolio vector store cleared")
     
     def get_resume_retriever(self, k: int = TOP_K_RESULTS):
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import shutil
 from pathlib import Path
@@ -5,9 +6,11 @@ import gradio as gr
 from dotenv import load_dotenv
 
 from src.config.logging_config import setup_logger
-from src.config.settings import RESUMES_DIR, VECTOR_STORES_DIR, CANDIDATE_NAME, DATA_DIR
-from src.core.generator import CoverLetterGenerator
-from src.core.chatbot import EmployerQAChatbot
+from src.config.settings import (RESUMES_DIR, CANDIDATE_NAME, DATA_DIR, UI_PROFILE_NAME,
+                                 UI_CONCURRENCY_LIMIT, FAQ_QUESTIONS, ensure_data_dirs)
+from src.core.batch import load_job_postings
+from src.core.profile_store import CandidateProfileStore
+from src.ui.session import SessionRegistry, UserSession, delete_path
 
 # Load environment variables
 load_dotenv()
@@ -19,32 +22,47 @@ class ApplyCopilotUI:
     """Gradio UI for ApplyCopilot - Cover Letter Generation and Employer Q&A."""
     
     def __init__(self):
-        """Initialize the UI and components."""
-        self.generator = CoverLetterGenerator()
-        self.chatbot = EmployerQAChatbot(self.generator.vector_store_manager)
+        """Initialize the UI and the per-session state registry."""
+        ensure_data_dirs()
         
-        # Shared state
-        self.current_resume_path = None
-        self.current_portfolio_path = None
-        self.job_details = {
-            "company_name": "",
-            "job_title": "",
-            "job_description": ""
-        }
+        # Persisting indexed documents as a candidate profile is opt-in (UI_PROFILE_NAME): a shared
+        # profile would hand one visitor's resume to every other session on a public deployment
+        self.profile_store = None
+        if UI_PROFILE_NAME:
+            self.profile_store = CandidateProfileStore()
+            logger.info(f"UI profile persistence enabled: {self.profile_store.profile_dir(UI_PROFILE_NAME)}")
+        
+        # Each browser session gets its own generator, vector stores, chatbot and job details
+        self.sessions = SessionRegistry(profile_store=self.profile_store, profile_name=UI_PROFILE_NAME)
         
         logger.info("Initialized ApplyCopilotUI")
     
-    def index_resume(self, resume_file) -> str:
+    def _session(self, request: gr.Request = None) -> UserSession:
+        """Get the state for the browser session that issued the request."""
+        return self.sessions.get(getattr(request, "session_hash", None))
+    
+    async def _asession(self, request: gr.Request = None) -> UserSession:
+        """Get the session from an async handler (creating one may restore a profile from disk)."""
+        return await asyncio.to_thread(self._session, request)
+    
+    def end_session(self, request: gr.Request = None) -> None:
+        """Release a session's state when its browser tab is closed."""
+        self.sessions.remove(getattr(request, "session_hash", None))
+    
+    def index_resume(self, resume_file, request: gr.Request = None) -> str:
         """
         Index a resume from uploaded file using direct injection (no RAG).
         
         Args:
             resume_file: The uploaded resume file (Gradio file object)
+            request: Gradio request identifying the browser session
         
         Returns:
             Status message
         """
         try:
+            session = self._session(request)
+            
             if resume_file is None:
                 return "❌ Please upload a resume file first."
             
@@ -62,30 +80,31 @@ class ApplyCopilotUI:
             # Copy uploaded file to resumes directory with timestamp to avoid conflicts
             import time
             timestamp = int(time.time())
-            resume_filename = f"uploaded_resume_{timestamp}.pdf"
+            resume_filename = f"uploaded_resume_{session.session_id}_{timestamp}.pdf"
             resume_path = Path(RESUMES_DIR) / resume_filename
             
             # Copy the uploaded file to our data directory
             shutil.copy2(uploaded_path, resume_path)
             logger.info(f"Saved uploaded resume to: {resume_path}")
             
-            # Always create fresh vector store - delete any existing temp stores
-            temp_vector_path = Path(VECTOR_STORES_DIR) / f"temp_{timestamp}"
-            if temp_vector_path.exists():
-                shutil.rmtree(temp_vector_path)
-            
             # Load and index the resume (direct injection approach)
             logger.info(f"Indexing resume with direct injection approach")
-            result = self.generator.vector_store_manager.load_and_index_resume(str(resume_path))
-            self.generator.vector_store_manager.save_vector_store(str(temp_vector_path), store_type="resume")
+            result = session.generator.vector_store_manager.load_and_index_resume(str(resume_path))
+            
+            # Store the current resume path (replacing this session's previous upload)
+            delete_path(session.current_resume_path)
+            session.current_resume_path = str(resume_path)
             
-            # Store the current resume path
-            self.current_resume_path = str(resume_path)
+            # Load cover letter examples (only new or changed files are parsed)
+            examples = session.generator.load_cover_letter_examples()
             
-            # Load cover letter examples
-            self.generator.load_cover_letter_examples()
+            # Persist the candidate profile (only when UI_PROFILE_NAME opts in)
+            session.save_profile()
             
-            message = f"✅ Resume indexed successfully: {Path(uploaded_path).name} ({result['text_length']} chars) - Using direct context injection"
+            # Answer the common employer questions before they are asked
+            session.start_faq_precompute()
+            
+            message = f"✅ Resume indexed successfully: {Path(uploaded_path).name} ({result['text_length']} chars) - Using direct context injection, {examples['total']} cover letter examples (~{examples['tokens']} tokens)"
             logger.info(message)
             return message
             
@@ -94,17 +113,20 @@ class ApplyCopilotUI:
             logger.error(error_msg)
             return error_msg
     
-    def index_portfolio(self, portfolio_file) -> str:
+    def index_portfolio(self, portfolio_file, request: gr.Request = None) -> str:
         """
         Index a portfolio from uploaded file using RAG approach.
         
         Args:
             portfolio_file: The uploaded portfolio file (Gradio file object)
+            request: Gradio request identifying the browser session
         
         Returns:
             Status message
         """
         try:
+            session = self._session(request)
+            
             if portfolio_file is None:
                 return "⚠️ No portfolio file uploaded. This is optional - you can proceed without a portfolio."
             
@@ -122,7 +144,7 @@ class ApplyCopilotUI:
             # Copy uploaded file to data directory
             import time
             timestamp = int(time.time())
-            portfolio_filename = f"uploaded_portfolio_{timestamp}.txt"
+            portfolio_filename = f"uploaded_portfolio_{session.session_id}_{timestamp}.txt"
             portfolio_path = Path(DATA_DIR) / portfolio_filename
             
             # Copy the uploaded file
@@ -131,12 +153,19 @@ class ApplyCopilotUI:
             
             # Index portfolio with RAG approach
             logger.info(f"Indexing portfolio with RAG approach")
-            result = self.generator.load_portfolio(str(portfolio_path))
+            result = session.generator.load_portfolio(str(portfolio_path))
+            
+            # Store the current portfolio path (replacing this session's previous upload)
+            delete_path(session.current_portfolio_path)
+            session.current_portfolio_path = str(portfolio_path)
             
-            # Store the current portfolio path
-            self.current_portfolio_path = str(portfolio_path)
+            # Persist the candidate profile (only when UI_PROFILE_NAME opts in)
+            session.save_profile()
             
-            message = f"✅ Portfolio indexed successfully: {Path(uploaded_path).name} ({result['text_length']} chars, {result['chunks_created']} chunks) - Using RAG retrieval"
+            # The portfolio changed, so earlier pre-generated answers no longer apply
+            session.start_faq_precompute()
+            
+            message = f"✅ Portfolio indexed successfully: {Path(uploaded_path).name} ({result['text_length']} chars, {result['chunks_created']} chunks, {result['chunks_added']} new, {result['chunks_removed']} removed) - Using RAG retrieval"
             logger.info(message)
             return message
             
@@ -145,60 +174,22 @@ class ApplyCopilotUI:
             logger.error(error_msg)
             return error_msg
     
-    def restart_application(self) -> tuple:
+    def restart_application(self, request: gr.Request = None) -> tuple:
         """
-        Restart the application by clearing all state and deleting temporary files.
+        Restart the application for this session by clearing its state and deleting its temporary files.
+        
+        Args:
+            request: Gradio request identifying the browser session
         
         Returns:
             Tuple of cleared values for UI components
         """
         try:
-            # Clear vector store
-            self.generator.vector_store_manager.clear_vector_store(store_type="all")
-            
-            # Clear chatbot history
-            self.chatbot.clear_history()
-            self.chatbot.clear_job_context()
-            
-            # Clear job details
-            self.job_details = {
-                "company_name": "",
-                "job_title": "",
-                "job_description": ""
-            }
-            
-            # Clear file paths
-            self.current_resume_path = None
-            self.current_portfolio_path = None
-            
-            # Clean up temporary vector stores
-            if VECTOR_STORES_DIR.exists():
-                for item in VECTOR_STORES_DIR.iterdir():
-                    if item.is_dir() and item.name.startswith("temp_"):
-                        try:
-                            shutil.rmtree(item)
-                            logger.info(f"Deleted temporary vector store: {item}")
-                        except Exception as e:
-                            logger.warning(f"Could not delete {item}: {e}")
-            
-            # Clean up uploaded resumes
-            if RESUMES_DIR.exists():
-                for item in RESUMES_DIR.iterdir():
-                    if item.is_file() and item.name.startswith("uploaded_resume_"):
-                        try:
-                            item.unlink()
-                            logger.info(f"Deleted uploaded resume: {item}")
-                        except Exception as e:
-                            logger.warning(f"Could not delete {item}: {e}")
-            
-            # Clean up uploaded portfolios
-            for item in DATA_DIR.iterdir():
-                if item.is_file() and item.name.startswith("uploaded_portfolio_"):
-                    try:
-                        item.unlink()
-                        logger.info(f"Deleted uploaded portfolio: {item}")
-                    except Exception as e:
-                        logger.warning(f"Could not delete {item}: {e}")
+            # Clear vector stores, chat, job details and uploaded files of this session only
+            session = self._session(request)
+            session.reset()
+            # With opt-in persistence, also forget the saved profile so it isn't restored again
+            session.delete_profile()
             
             logger.info("Application restarted successfully")
             return (
@@ -230,133 +221,203 @@ class ApplyCopilotUI:
                 []
             )
     
-    def update_job_details(self, company_name: str, job_title: str, job_description: str) -> str:
+    def update_job_details(self, company_name: str, job_title: str, job_description: str,
+                           request: gr.Request = None) -> str:
         """
-        Update shared job details for both features.
+        Update the session's job details shared by all features.
         
         Args:
             company_name: Name of the company
             job_title: Job title/position
             job_description: Full job description
+            request: Gradio request identifying the browser session
         
         Returns:
             Status message
         """
         try:
-            self.job_details["company_name"] = company_name
-            self.job_details["job_title"] = job_title
-            self.job_details["job_description"] = job_description
+            session = self._session(request)
+            session.job_details["company_name"] = company_name
+            session.job_details["job_title"] = job_title
+            session.job_details["job_description"] = job_description
             
             # Update chatbot with job context if available
             if company_name or job_title:
                 job_context = f"Position: {job_title} at {company_name}" if job_title and company_name else f"Position: {job_title or company_name}"
-                self.chatbot.set_job_context(job_context, job_description)
+                session.chatbot.set_job_context(job_context, job_description)
             
             logger.info(f"Updated job details: {job_title} at {company_name}")
-            return f"✅ Job details updated: {job_title} at {company_name}"
+            message = f"✅ Job details updated: {job_title} at {company_name}"
+            if session.start_faq_precompute():
+                message += " (pre-generating answers to common employer questions in the background)"
+            return message
             
         except Exception as e:
             error_msg = f"❌ Error updating job details: {str(e)}"
             logger.error(error_msg)
             return error_msg
     
-    def generate_cover_letter(self, output_format: str) -> tuple:
+    async def generate_cover_letter(self, output_format: str, request: gr.Request = None):
         """
-        Generate a cover letter using shared job details.
+        Generate a cover letter using shared job details, streaming tokens to the UI.
         
         Args:
             output_format: Output format ('txt' or 'pdf')
+            request: Gradio request identifying the browser session
         
-        Returns:
-            Tuple of (cover letter text, file path, status message)
+        Yields:
+            Tuples of (cover letter text so far, file path, status message)
         """
         try:
-            # Validate inputs
-            if not self.job_details["company_name"] or not self.job_details["job_title"] or not self.job_details["job_description"]:
-                return "", None, "❌ Please fill in all job details in the Setup section"
-            
-            if not self.generator.vector_store_manager.has_resume():
-                return "", None, "❌ Please upload and index a resume first in the Setup section"
-            
-            # Generate cover letter
-            logger.info(f"Generating cover letter for {self.job_details['company_name']} - {self.job_details['job_title']}")
-            cover_letter = self.generator.generate_cover_letter(
-                job_description=self.job_details["job_description"],
-                company_name=self.job_details["company_name"],
-                job_title=self.job_details["job_title"]
-            )
+            session = await self._asession(request)
             
-            # Save cover letter
-            file_path = self.generator.save_cover_letter(
+            # Validate inputs
+            if not session.job_details["company_name"] or not session.job_details["job_title"] or not session.job_details["job_description"]:
+                yield "", None, "❌ Please fill in all job details in the Setup section"
+                return
+            
+            if not session.generator.vector_store_manager.has_resume():
+                yield "", None, "❌ Please upload and index a resume first in the Setup section"
+                return
+            
+            # Stream cover letter
+            logger.info(f"Generating cover letter for {session.job_details['company_name']} - {session.job_details['job_title']}")
+            cover_letter = ""
+            async for chunk in session.generator.astream_cover_letter(
+                job_description=session.job_details["job_description"],
+                company_name=session.job_details["company_name"],
+                job_title=session.job_details["job_title"]
+            ):
+                cover_letter += chunk
+                yield cover_letter, None, "⏳ Generating cover letter..."
+            
+            # Save cover letter once the stream completes
+            file_path = await asyncio.to_thread(
+                session.generator.save_cover_letter,
                 cover_letter=cover_letter,
-                company_name=self.job_details["company_name"],
-                job_title=self.job_details["job_title"],
+                company_name=session.job_details["company_name"],
+                job_title=session.job_details["job_title"],
                 format=output_format
             )
             
             success_msg = f"✅ Cover letter generated and saved to: {file_path}"
             logger.info(success_msg)
             
-            return cover_letter, file_path, success_msg
+            yield cover_letter, file_path, success_msg
             
         except Exception as e:
             error_msg = f"❌ Error generating cover letter: {str(e)}"
             logger.error(error_msg)
-            return "", None, error_msg
+            yield "", None, error_msg
+    
+    async def generate_cover_letter_batch(self, postings_file, output_formats: list,
+                                          request: gr.Request = None) -> tuple:
+        """
+        Generate cover letters for every posting in an uploaded CSV/JSONL file.
+        
+        Args:
+            postings_file: Uploaded CSV/JSONL with company, title and description columns
+            output_formats: Formats to save for each letter ('txt' and/or 'pdf')
+            request: Gradio request identifying the browser session
+        
+        Returns:
+            Tuple of (list of output file paths, status message)
+        """
+        try:
+            session = await self._asession(request)
+            
+            if postings_file is None:
+                return None, "❌ Please upload a CSV or JSONL file with job postings"
+            
+            if not session.generator.vector_store_manager.has_resume():
+                return None, "❌ Please upload and index a resume first in the Setup section"
+            
+            postings = await asyncio.to_thread(load_job_postings, postings_file)
+            if not postings:
+                return None, "❌ No job postings found in the uploaded file"
+            
+            manifest = await session.generator.agenerate_batch(postings, output_formats=output_formats or ["txt"])
+            
+            files = [path for entry in manifest["results"] for path in entry["files"]]
+            files.append(manifest["manifest_path"])
+            
+            status = (f"✅ Batch finished: {manifest['succeeded']}/{manifest['total']} cover letters generated "
+                      f"in {manifest['elapsed_seconds']}s. Saved to: {manifest['output_dir']}")
+            if manifest["failed"]:
+                status += f" ({manifest['failed']} failed, see manifest.json)"
+            logger.info(status)
+            return files, status
+            
+        except Exception as e:
+            error_msg = f"❌ Error generating batch: {str(e)}"
+            logger.error(error_msg)
+            return None, error_msg
     
-    def generate_cold_message(self, contact_name: str, contact_position: str, resume_link: str) -> tuple:
+    async def generate_cold_message(self, contact_name: str, contact_position: str, resume_link: str,
+                                    request: gr.Request = None):
         """
-        Generate a cold message using shared job details and contact info.
+        Generate a cold message using shared job details and contact info, streaming tokens to the UI.
         
         Args:
             contact_name: Name of the contact person
             contact_position: Position/title of the contact person
             resume_link: Link to the resume (Google Drive or other)
+            request: Gradio request identifying the browser session
         
-        Returns:
-            Tuple of (cold message text, file path, status message)
+        Yields:
+            Tuples of (cold message text so far, file path, status message)
         """
         try:
+            session = await self._asession(request)
+            
             # Validate inputs
-            if not self.job_details["company_name"] or not self.job_details["job_title"] or not self.job_details["job_description"]:
-                return "", None, "❌ Please fill in all job details in the Setup section"
+            if not session.job_details["company_name"] or not session.job_details["job_title"] or not session.job_details["job_description"]:
+                yield "", None, "❌ Please fill in all job details in the Setup section"
+                return
             
-            if not self.generator.vector_store_manager.has_resume():
-                return "", None, "❌ Please upload and index a resume first in the Setup section"
+            if not session.generator.vector_store_manager.has_resume():
+                yield "", None, "❌ Please upload and index a resume first in the Setup section"
+                return
             
             if not contact_name or not contact_position:
-                return "", None, "❌ Please enter both contact name and position"
+                yield "", None, "❌ Please enter both contact name and position"
+                return
             
             if not resume_link:
-                return "", None, "❌ Please provide a link to your resume"
-            
-            # Generate cold message
-            logger.info(f"Generating cold message for {contact_name} ({contact_position}) at {self.job_details['company_name']}")
-            cold_message = self.generator.generate_cold_message(
-                job_description=self.job_details["job_description"],
-                company_name=self.job_details["company_name"],
-                job_title=self.job_details["job_title"],
+                yield "", None, "❌ Please provide a link to your resume"
+                return
+            
+            # Stream cold message
+            logger.info(f"Generating cold message for {contact_name} ({contact_position}) at {session.job_details['company_name']}")
+            cold_message = ""
+            async for chunk in session.generator.astream_cold_message(
+                job_description=session.job_details["job_description"],
+                company_name=session.job_details["company_name"],
+                job_title=session.job_details["job_title"],
                 contact_name=contact_name,
                 contact_position=contact_position,
                 resume_link=resume_link
-            )
+            ):
+                cold_message += chunk
+                yield cold_message, None, "⏳ Generating cold message..."
             
-            # Save cold message
-            file_path = self.generator.save_cold_message(
+            # Save cold message once the stream completes
+            file_path = await asyncio.to_thread(
+                session.generator.save_cold_message,
                 cold_message=cold_message,
                 contact_name=contact_name,
-                company_name=self.job_details["company_name"]
+                company_name=session.job_details["company_name"]
             )
             
             success_msg = f"✅ Cold message generated and saved to: {file_path}"
             logger.info(success_msg)
             
-            return cold_message, file_path, success_msg
+            yield cold_message, file_path, success_msg
             
         except Exception as e:
             error_msg = f"❌ Error generating cold message: {str(e)}"
             logger.error(error_msg)
-            return "", None, error_msg
+            yield "", None, error_msg
     
     def create_setup_section(self) -> tuple:
         """Create the shared Setup section with Resume upload, Portfolio upload, and Job Details.
@@ -476,12 +537,40 @@ class ApplyCopilotUI:
                     )
                     file_output = gr.File(label="Download Cover Letter")
             
+            with gr.Accordion("📦 Batch Generation (many job postings)", open=False):
+                gr.Markdown(
+                    "*Upload a CSV or JSONL file with `company_name`, `job_title` and `job_description` "
+                    "columns to generate one cover letter per posting. Uses your indexed resume and portfolio.*"
+                )
+                with gr.Row():
+                    with gr.Column(scale=1):
+                        postings_upload = gr.File(
+                            label="Job Postings (CSV/JSONL)",
+                            file_types=[".csv", ".jsonl"],
+                            type="filepath"
+                        )
+                        batch_formats = gr.CheckboxGroup(
+                            choices=["txt", "pdf"],
+                            label="Output Formats",
+                            value=["txt", "pdf"]
+                        )
+                        batch_btn = gr.Button("📦 Generate Batch", variant="secondary")
+                    with gr.Column(scale=1):
+                        batch_status = gr.Textbox(label="Batch Status", interactive=False)
+                        batch_files = gr.File(label="Batch Outputs", file_count="multiple")
+            
             # Event handlers
             generate_btn.click(
                 fn=self.generate_cover_letter,
                 inputs=[output_format],
                 outputs=[cover_letter_output, file_output, generation_status]
             )
+            
+            batch_btn.click(
+                fn=self.generate_cover_letter_batch,
+                inputs=[postings_upload, batch_formats],
+                outputs=[batch_files, batch_status]
+            )
         
         return tab
     
@@ -535,59 +624,56 @@ class ApplyCopilotUI:
             # Chat examples
             gr.Markdown("### 💡 Example Questions You Might Receive")
             gr.Examples(
-                examples=[
-                    "Can you tell me about your experience with machine learning?",
-                    "What projects have you worked on related to data analysis?",
-                    "Are you familiar with Python and its data science libraries?",
-                    "What is your experience with cloud platforms like AWS or GCP?",
-                    "Can you describe a challenging technical problem you've solved?",
-                    "What is your educational background?",
-                    "Are you comfortable working in a team environment?",
-                    "What are your salary expectations?",
-                    "When would you be available to start?",
-                ],
+                examples=FAQ_QUESTIONS,
                 inputs=[msg_input],
                 label="Click any example to use it"
             )
             
             # Event handlers
-            def respond(message, history):
+            async def respond(message, request: gr.Request):
+                # The conversation lives server-side in the session; the client only sends the new message
+                session = await self._asession(request)
+                history = session.chatbot.get_chat_history()
+                
                 if not message.strip():
-                    return "", history
+                    yield "", history
+                    return
                 
-                if not self.generator.vector_store_manager.has_resume():
+                if not session.generator.vector_store_manager.has_resume():
                     history.append({"role": "assistant", "content": "❌ Please load a resume first by uploading a PDF in the Setup section."})
-                    return "", history
+                    yield "", history
+                    return
                 
+                history.append({"role": "user", "content": message})
+                history.append({"role": "assistant", "content": ""})
                 try:
-                    response = self.chatbot.chat(message, history)
-                    history.append({"role": "user", "content": message})
-                    history.append({"role": "assistant", "content": response})
-                    return "", history
+                    async for chunk in session.chatbot.astream_reply(message):
+                        history[-1]["content"] += chunk
+                        yield "", history
                 except Exception as e:
-                    error_msg = f"❌ Error: {str(e)}"
-                    history.append({"role": "user", "content": message})
-                    history.append({"role": "assistant", "content": error_msg})
-                    return "", history
+                    history[-1]["content"] = f"❌ Error: {str(e)}"
+                    yield "", history
             
-            def clear_chat():
-                self.chatbot.clear_history()
+            def clear_chat(request: gr.Request):
+                self._session(request).chatbot.clear_history()
                 return []
             
-            def update_qa_context():
+            def update_qa_context(request: gr.Request):
                 """Update the context status display."""
-                if not self.generator.vector_store_manager.has_resume():
+                session = self._session(request)
+                
+                if not session.generator.vector_store_manager.has_resume():
                     return "❌ No resume indexed. Please upload a resume PDF in the Setup section."
                 
                 context_info = "✅ Resume indexed (direct injection)"
                 
-                if self.generator.vector_store_manager.has_portfolio():
+                if session.generator.vector_store_manager.has_portfolio():
                     context_info += " | Portfolio indexed (RAG)"
                 
-                if self.job_details.get("job_title"):
-                    context_info += f" | Job: {self.job_details['job_title']}"
-                if self.job_details.get("company_name"):
-                    context_info += f" at {self.job_details['company_name']}"
+                if session.job_details.get("job_title"):
+                    context_info += f" | Job: {session.job_details['job_title']}"
+                if session.job_details.get("company_name"):
+                    context_info += f" at {session.job_details['company_name']}"
                 
                 return context_info
             
@@ -599,13 +685,13 @@ class ApplyCopilotUI:
             
             submit_btn.click(
                 fn=respond,
-                inputs=[msg_input, chatbot],
+                inputs=[msg_input],
                 outputs=[msg_input, chatbot]
             )
             
             msg_input.submit(
                 fn=respond,
-                inputs=[msg_input, chatbot],
+                inputs=[msg_input],
                 outputs=[msg_input, chatbot]
             )
             
@@ -721,12 +807,17 @@ class ApplyCopilotUI:
                     qa_chatbot          # Clear chat history
                 ]
             )
+            
+            # Release per-session state when the browser tab is closed
+            interface.unload(self.end_session)
         
         return interface
     
     def launch(self, **kwargs):
         """Launch the Gradio interface."""
         interface = self.create_interface()
+        # Async handlers share the event loop, so allow many concurrent events per handler
+        interface.queue(default_concurrency_limit=UI_CONCURRENCY_LIMIT)
         interface.launch(theme=gr.themes.Soft(), **kwargs)
 
 
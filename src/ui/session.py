@@ -0,0 +1,229 @@
+"""
+Per-session state for the ApplyCopilot UI.
+Each browser session gets its own generator, vector stores, chatbot and job details,
+so concurrent users never overwrite each other's data.
+"""
+
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict
+
+from src.config.logging_config import setup_logger
+from src.config.settings import SESSION_IDLE_TIMEOUT_SECONDS, MAX_SESSIONS, FAQ_QUESTIONS, FAQ_PRECOMPUTE_ENABLED
+from src.core.generator import CoverLetterGenerator
+from src.core.chatbot import EmployerQAChatbot
+from src.core.profile_store import CandidateProfileStore
+
+logger = setup_logger(__name__)
+
+DEFAULT_SESSION_ID = "default"
+
+
+class UserSession:
+    """State owned by a single browser session."""
+    
+    def __init__(self, session_id: str, profile_store: Optional[CandidateProfileStore] = None,
+                 profile_name: Optional[str] = None):
+        """
+        Initialize a session, restoring the saved candidate profile if persistence is enabled.
+        
+        Args:
+            session_id: Gradio session hash identifying the browser tab
+            profile_store: Store holding the persistent candidate profile (None disables persistence)
+            profile_name: Profile this session saves to and restores from (None disables persistence)
+        """
+        self.session_id = session_id
+        self.generator = CoverLetterGenerator()
+        # One context service for all features, so a job's portfolio retrieval runs once
+        self.chatbot = EmployerQAChatbot(self.generator.vector_store_manager,
+                                         context_service=self.generator.context_service)
+        
+        self.profile_store = profile_store if profile_name else None
+        self.profile_name = profile_name
+        self.profile: Optional[Dict] = None
+        if self.profile_store is not None:
+            try:
+                self.profile = self.profile_store.load(self.generator, profile_name)
+            except Exception as e:
+                logger.warning(f"Could not restore candidate profile for session {session_id}: {e}")
+        
+        self.current_resume_path: Optional[str] = None
+        self.current_portfolio_path: Optional[str] = None
+        self.job_details: Dict[str, str] = {
+            "company_name": "",
+            "job_title": "",
+            "job_description": ""
+        }
+        self.last_active = time.time()
+    
+    def reset(self) -> None:
+        """Clear all in-memory state and delete files uploaded by this session."""
+        self.generator.vector_store_manager.clear_vector_store(store_type="all")
+        self.generator.context_service.clear()
+        self.chatbot.clear_history()
+        self.chatbot.clear_job_context()
+        self.chatbot.answer_cache.clear()
+        
+        self.job_details = {
+            "company_name": "",
+            "job_title": "",
+            "job_description": ""
+        }
+        self.profile = None
+        self.cleanup_files()
+    
+    def start_faq_precompute(self) -> bool:
+        """
+        Pre-generate answers to the FAQ questions in a background thread.
+        
+        Returns:
+            True if a background job was started
+        """
+        if not FAQ_PRECOMPUTE_ENABLED or not self.generator.vector_store_manager.has_resume():
+            return False
+        
+        thread = threading.Thread(target=self._precompute_faq, name=f"faq-{self.session_id}", daemon=True)
+        thread.start()
+        return True
+    
+    def _precompute_faq(self) -> None:
+        """Background job body: answer the FAQ questions into the chatbot's answer cache."""
+        try:
+            self.chatbot.precompute_answers(FAQ_QUESTIONS)
+        except Exception as e:
+            logger.warning(f"FAQ pre-generation failed for session {self.session_id}: {e}")
+    
+    def save_profile(self) -> None:
+        """Persist this session's indexed documents as the candidate profile (no-op without persistence)."""
+        if self.profile_store is not None:
+            self.profile_store.save(self.generator, self.profile_name)
+    
+    def delete_profile(self) -> None:
+        """Delete this session's saved candidate profile (no-op without persistence)."""
+        if self.profile_store is not None:
+            self.profile_store.delete(self.profile_name)
+            self.profile = None
+    
+    def cleanup_files(self) -> None:
+        """Delete the uploaded resume and portfolio of this session."""
+        for path in [self.current_resume_path, self.current_portfolio_path]:
+            delete_path(path)
+        
+        self.current_resume_path = None
+        self.current_portfolio_path = None
+
+
+def delete_path(path: Optional[str]) -> None:
+    """
+    Delete an uploaded file or directory, logging failures.
+    
+    Args:
+        path: File or directory path (None is ignored)
+    """
+    if not path:
+        return
+    
+    target = Path(path)
+    try:
+        if target.is_dir():
+            shutil.rmtree(target)
+            logger.info(f"Deleted directory: {target}")
+        elif target.is_file():
+            target.unlink()
+            logger.info(f"Deleted uploaded file: {target}")
+    except Exception as e:
+        logger.warning(f"Could not delete {target}: {e}")
+
+
+class SessionRegistry:
+    """Session-keyed registry with idle-timeout and LRU-capacity eviction."""
+    
+    def __init__(self, idle_timeout: float = SESSION_IDLE_TIMEOUT_SECONDS,
+                 max_sessions: int = MAX_SESSIONS,
+                 profile_store: Optional[CandidateProfileStore] = None,
+                 profile_name: Optional[str] = None):
+        """
+        Initialize the session registry.
+        
+        Args:
+            idle_timeout: Seconds of inactivity after which a session is evicted
+            max_sessions: Maximum number of sessions kept in memory
+            profile_store: Candidate profile store (None keeps sessions in memory only)
+            profile_name: Profile every session saves to and restores from (opt-in, for
+                single-owner deployments; None keeps sessions isolated and in memory only)
+        """
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.profile_store = profile_store
+        self.profile_name = profile_name
+        self._sessions: "OrderedDict[str, UserSession]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, session_id: Optional[str]) -> UserSession:
+        """
+        Get the session for an id, creating it on first use.
+        
+        Args:
+            session_id: Gradio session hash (None falls back to a shared default session)
+        
+        Returns:
+            The UserSession for this id
+        """
+        session_id = session_id or DEFAULT_SESSION_ID
+        evicted = []
+        
+        with self._lock:
+            evicted.extend(self._pop_idle())
+            session = self._sessions.get(session_id)
+        
+        if session is None:
+            # Built outside the lock: restoring a profile loads FAISS indexes, which must not block other tabs
+            created = UserSession(session_id, self.profile_store, self.profile_name)
+            with self._lock:
+                session = self._sessions.setdefault(session_id, created)
+            if session is created:
+                logger.info(f"Created session {session_id}")
+            else:
+                created.reset()  # Another request created it first
+        
+        with self._lock:
+            self._sessions[session_id] = session  # Re-insert if it was evicted meanwhile
+            session.last_active = time.time()
+            self._sessions.move_to_end(session_id)
+            
+            while len(self._sessions) > self.max_sessions:
+                _, oldest = self._sessions.popitem(last=False)
+                evicted.append(oldest)
+        
+        for old_session in evicted:
+            old_session.reset()
+            logger.info(f"Evicted session {old_session.session_id}")
+        
+        return session
+    
+    def remove(self, session_id: Optional[str]) -> None:
+        """
+        Drop a session and release its resources (e.g. when the browser tab closes).
+        
+        Args:
+            session_id: Gradio session hash
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id or DEFAULT_SESSION_ID, None)
+        
+        if session is not None:
+            session.reset()
+            logger.info(f"Removed session {session.session_id}")
+    
+    def _pop_idle(self) -> list:
+        """Remove and return sessions idle longer than the timeout (caller holds the lock)."""
+        cutoff = time.time() - self.idle_timeout
+        idle_ids = [sid for sid, session in self._sessions.items() if session.last_active < cutoff]
+        return [self._sessions.pop(sid) for sid in idle_ids]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
@@ -0,0 +1,67 @@
+"""
+Tests for the semantic answer cache of the employer Q&A chatbot.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import unittest
+
+from src.core.answer_cache import SemanticAnswerCache, job_context_hash
+
+PROFILE = (1, 1, 0)
+JOB = job_context_hash("Position: ML Engineer at Acme", "Build RAG systems.")
+
+
+class SemanticAnswerCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = SemanticAnswerCache(threshold=0.9, ttl_seconds=3600)
+        self.cache.store("What is your RAG experience?", [1.0, 0.0, 0.0], "Two years.", PROFILE, JOB)
+
+    def test_near_duplicate_question_hits(self):
+        hit = self.cache.lookup([1.0, 0.2, 0.0], PROFILE, JOB)
+        self.assertEqual(hit["answer"], "Two years.")
+        self.assertGreaterEqual(hit["similarity"], 0.9)
+
+    def test_dissimilar_question_misses(self):
+        self.assertIsNone(self.cache.lookup([1.0, 1.0, 0.0], PROFILE, JOB))  # cosine ~0.71
+        self.assertIsNone(self.cache.lookup([1.0, 0.0], PROFILE, JOB))  # different embeddings model
+
+    def test_best_match_above_threshold_wins(self):
+        self.cache.store("Which vector stores?", [0.0, 1.0, 0.0], "FAISS.", PROFILE, JOB)
+        self.assertEqual(self.cache.lookup([0.1, 1.0, 0.0], PROFILE, JOB)["answer"], "FAISS.")
+
+    def test_entries_are_isolated_by_profile_and_job(self):
+        self.assertIsNone(self.cache.lookup([1.0, 0.0, 0.0], (2, 1, 0), JOB))
+        self.assertIsNone(self.cache.lookup([1.0, 0.0, 0.0], PROFILE, job_context_hash(None, None)))
+        self.assertIsNotNone(self.cache.lookup([1.0, 0.0, 0.0], PROFILE, JOB))
+
+    def test_expired_entries_miss_and_are_dropped(self):
+        cache = SemanticAnswerCache(ttl_seconds=0)
+        cache.store("What is your RAG experience?", [1.0, 0.0], "Two years.", PROFILE, JOB)
+        self.assertIsNone(cache.lookup([1.0, 0.0], PROFILE, JOB))
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = SemanticAnswerCache(max_entries=2)
+        for i, vector in enumerate([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]):
+            cache.store(f"Question {i}", vector, f"Answer {i}", PROFILE, JOB)
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], PROFILE, JOB))
+        self.assertEqual(cache.lookup([0.0, 0.0, 1.0], PROFILE, JOB)["answer"], "Answer 2")
+
+    def test_stats(self):
+        self.cache.lookup([1.0, 0.0, 0.0], PROFILE, JOB)
+        self.cache.lookup([0.0, 1.0, 0.0], PROFILE, JOB)
+        self.cache.lookup([1.0, 0.0, 0.0], PROFILE, JOB, record_stats=False)
+        self.assertEqual(self.cache.get_stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1})
+
+        self.cache.clear()
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+
+class JobContextHashTest(unittest.TestCase):
+    def test_missing_context_hashes_like_empty_context(self):
+        self.assertEqual(job_context_hash(None, None), job_context_hash("", ""))
+        self.assertNotEqual(job_context_hash("a", "bc"), job_context_hash("ab", "c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests for loading batch job postings from CSV and JSONL files.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.batch import load_job_postings, write_manifest
+
+EXPECTED = [
+    {"company_name": "Acme", "job_title": "ML Engineer", "job_description": "Build RAG systems."},
+    {"company_name": "Globex", "job_title": "Data Analyst", "job_description": "Own the dashboards."},
+]
+
+
+class LoadJobPostingsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, name: str, content: str, encoding: str = "utf-8") -> str:
+        path = self.tmp_dir / name
+        path.write_text(content, encoding=encoding)
+        return str(path)
+
+    def test_csv_with_canonical_columns(self):
+        path = self.write("postings.csv", "company_name,job_title,job_description\n"
+                                          "Acme,ML Engineer,Build RAG systems.\n"
+                                          "Globex,Data Analyst,Own the dashboards.\n")
+        self.assertEqual(load_job_postings(path), EXPECTED)
+
+    def test_csv_aliases_are_case_insensitive_and_bom_is_ignored(self):
+        path = self.write("postings.CSV", "Company, Title ,Description,Notes\n"
+                                          " Acme ,ML Engineer,Build RAG systems.,remote\n"
+                                          "Globex,Data Analyst,Own the dashboards.,\n", encoding="utf-8-sig")
+        self.assertEqual(load_job_postings(path), EXPECTED)
+
+    def test_jsonl_aliases_and_blank_lines(self):
+        rows = [{"company": "Acme", "position": "ML Engineer", "description": "Build RAG systems."},
+                {"company_name": "Globex", "title": "Data Analyst", "job_description": "Own the dashboards."}]
+        path = self.write("postings.jsonl", json.dumps(rows[0]) + "\n\n" + json.dumps(rows[1]) + "\n")
+        self.assertEqual(load_job_postings(path), EXPECTED)
+
+    def test_first_non_empty_alias_wins(self):
+        path = self.write("postings.ndjson", json.dumps(
+            {"company_name": "", "company": "Acme", "job_title": "ML Engineer", "title": "Engineer",
+             "job_description": "Build RAG systems."}) + "\n")
+        self.assertEqual(load_job_postings(path), EXPECTED[:1])
+
+    def test_missing_fields_name_the_row(self):
+        path = self.write("postings.csv", "company,title,description\n"
+                                          "Acme,ML Engineer,Build RAG systems.\n"
+                                          "Globex,,\n")
+        with self.assertRaisesRegex(ValueError, "Row 2 is missing required fields: job_title, job_description"):
+            load_job_postings(path)
+
+    def test_unsupported_file_type(self):
+        path = self.write("postings.xlsx", "")
+        with self.assertRaisesRegex(ValueError, "Unsupported postings file type"):
+            load_job_postings(path)
+
+
+class WriteManifestTest(unittest.TestCase):
+    def test_manifest_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = {"total": 1, "results": [{"company_name": "Café", "files": []}]}
+            path = write_manifest(manifest, Path(tmp))
+            self.assertEqual(json.loads(Path(path).read_text(encoding="utf-8")), manifest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for the BM25 keyword index and reciprocal rank fusion.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import unittest
+
+from src.core.bm25 import BM25Index, reciprocal_rank_fusion, tokenize
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_tech_terms_stay_intact(self):
+        self.assertEqual(tokenize("Used C++, node.js and scikit-learn with the team."),
+                         ["used", "c++", "node.js", "scikit-learn", "team"])
+
+
+class BM25IndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = BM25Index()
+        self.index.add_many([
+            ("rag", "Built a RAG assistant with LangGraph and FAISS"),
+            ("dbt", "Modelled the warehouse in dbt and Airflow"),
+            ("dash", "Dashboards in Tableau for the sales team"),
+        ])
+
+    def test_exact_terms_rank_their_document_first(self):
+        self.assertEqual(self.index.search("LangGraph experience", k=3)[0][0], "rag")
+        self.assertEqual(self.index.search("dbt models", k=3)[0][0], "dbt")
+
+    def test_documents_without_shared_terms_are_omitted(self):
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("FAISS", k=3)], ["rag"])
+        self.assertEqual(self.index.search("kubernetes", k=3), [])
+        self.assertEqual(self.index.search("the and with", k=3), [])
+
+    def test_results_are_capped_at_k(self):
+        self.assertEqual(len(self.index.search("RAG dbt Tableau", k=2)), 2)
+
+    def test_rarer_terms_score_higher(self):
+        self.index.add("etl", "Airflow ETL jobs orchestrated with Airflow sensors")
+        scores = dict(self.index.search("Tableau Airflow", k=4))
+        self.assertGreater(scores["dash"], scores["dbt"])
+
+    def test_re_adding_a_document_replaces_it(self):
+        self.index.add("rag", "Forecasting with Prophet")
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.search("LangGraph", k=3), [])
+        self.assertEqual(self.index.search("Prophet", k=3)[0][0], "rag")
+
+    def test_remove_and_clear(self):
+        self.index.remove("dbt")
+        self.index.remove("missing")
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.search("dbt", k=3), [])
+
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.search("RAG", k=3), [])
+
+
+class ReciprocalRankFusionTest(unittest.TestCase):
+    def test_documents_ranked_well_by_both_lists_win(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d", "a"]], k=60)
+        self.assertEqual(fused[:2], ["b", "a"])
+        self.assertEqual(set(fused), {"a", "b", "c", "d"})
+
+    def test_ties_keep_first_seen_order(self):
+        self.assertEqual(reciprocal_rank_fusion([["a", "b"], ["b", "a"]]), ["a", "b"])
+
+    def test_empty_rankings(self):
+        self.assertEqual(reciprocal_rank_fusion([[], []]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
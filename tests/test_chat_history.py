@@ -0,0 +1,119 @@
+"""
+Tests for the rolling chat summary and the seen portfolio chunk tracker.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import unittest
+
+from langchain_core.messages import AIMessage
+
+from src.core.chat_history import ChatHistoryManager, SeenChunkTracker
+from src.core.tokens import count_tokens
+
+
+def conversation(turns: int) -> list:
+    history = []
+    for i in range(1, turns + 1):
+        history.append({"role": "user", "content": f"Question {i}?"})
+        history.append({"role": "assistant", "content": f"Answer {i}."})
+    return history
+
+
+class RecordingLLM:
+    """Chat model stand-in that records summary prompts and returns numbered summaries."""
+
+    def __init__(self, fail: bool = False):
+        self.prompts = []
+        self.fail = fail
+
+    def invoke(self, messages):
+        if self.fail:
+            raise RuntimeError("rate limited")
+        self.prompts.append(messages[0].content)
+        return AIMessage(content=f"Summary {len(self.prompts)}")
+
+
+class ChatHistoryFoldingTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = ChatHistoryManager(keep_turns=2, fold_turns=2)
+        self.llm = RecordingLLM()
+
+    def test_short_conversations_are_not_folded(self):
+        history = conversation(3)
+        self.assertEqual(self.manager.prepare(history, self.llm), ("", history))
+        self.assertEqual(self.llm.prompts, [])
+
+    def test_evicted_turns_are_folded_in_blocks(self):
+        history = conversation(4)
+        summary, recent = self.manager.prepare(history, self.llm)
+        self.assertEqual(summary, "Summary 1")
+        self.assertEqual(recent, history[4:])
+        self.assertEqual(self.manager.folded_count, 4)
+        self.assertIn("Employer: Question 2?", self.llm.prompts[0])
+
+        # One more turn is not a full block yet
+        history = conversation(5)
+        self.assertEqual(self.manager.prepare(history, self.llm), ("Summary 1", history[4:]))
+        self.assertEqual(len(self.llm.prompts), 1)
+
+    def test_folding_is_incremental(self):
+        self.manager.prepare(conversation(4), self.llm)
+        summary, recent = self.manager.prepare(conversation(6), self.llm)
+
+        self.assertEqual(summary, "Summary 2")
+        self.assertEqual(len(recent), 4)
+        self.assertIn("Summary 1", self.llm.prompts[1])
+        self.assertIn("Question 4?", self.llm.prompts[1])
+        self.assertNotIn("Question 2?", self.llm.prompts[1])
+
+    def test_failed_summary_keeps_turns_verbatim(self):
+        history = conversation(4)
+        self.assertEqual(self.manager.prepare(history, RecordingLLM(fail=True)), ("", history))
+        self.assertEqual(self.manager.folded_count, 0)
+
+    def test_a_different_conversation_resets_the_summary(self):
+        self.manager.prepare(conversation(4), self.llm)
+        other = [{"role": msg["role"], "content": "Other " + msg["content"]} for msg in conversation(3)]
+        self.assertEqual(self.manager.prepare(other, self.llm), ("", other))
+
+    def test_drop_prefix_keeps_the_summary_aligned(self):
+        history = conversation(4)
+        self.manager.prepare(history, self.llm)
+        self.manager.drop_prefix(2, history[2:])
+        self.assertEqual(self.manager.folded_count, 2)
+        self.assertEqual(self.manager.prepare(history[2:], self.llm), ("Summary 1", history[4:]))
+
+
+class SeenChunkTrackerTest(unittest.TestCase):
+    def test_unseen_filters_shown_chunks_in_order(self):
+        tracker = SeenChunkTracker()
+        tracker.mark_shown(["chunk b"])
+        self.assertEqual(tracker.unseen(["chunk a", "chunk b", "chunk c"]), ["chunk a", "chunk c"])
+
+    def test_shown_chunks_are_append_only_and_deduplicated(self):
+        tracker = SeenChunkTracker()
+        tracker.mark_shown(["chunk a", "chunk b"])
+        tracker.mark_shown(["chunk b", "chunk c"])
+        self.assertEqual(tracker.shown_chunks(), ["chunk a", "chunk b", "chunk c"])
+
+    def test_oldest_chunks_are_forgotten_beyond_the_budget(self):
+        chunks = [f"Project {i}: " + "pipeline work " * 10 for i in range(3)]
+        tracker = SeenChunkTracker(token_budget=count_tokens(chunks[0]) + count_tokens(chunks[1]))
+        tracker.mark_shown(chunks)
+        self.assertEqual(tracker.shown_chunks(), chunks[1:])
+        self.assertEqual(tracker.unseen(chunks), chunks[:1])
+
+    def test_a_single_oversized_chunk_is_kept(self):
+        tracker = SeenChunkTracker(token_budget=1)
+        tracker.mark_shown(["A long chunk well over one token"])
+        self.assertEqual(len(tracker.shown_chunks()), 1)
+
+    def test_reset(self):
+        tracker = SeenChunkTracker()
+        tracker.mark_shown(["chunk a"])
+        tracker.reset()
+        self.assertEqual(tracker.shown_chunks(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
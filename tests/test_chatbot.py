@@ -0,0 +1,109 @@
+"""
+Regression tests for the server-side employer Q&A conversation in EmployerQAChatbot.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.core.chatbot import EmployerQAChatbot
+from src.core.embedding_cache import CachedEmbeddings
+from src.core.local_embeddings import HashingEmbeddings
+from src.core.vector_store import VectorStoreManager
+
+RESUME = "Jane Doe. Machine learning engineer. Built RAG assistants with LangChain and FAISS."
+
+
+class FailingLLM:
+    """Chat model stand-in that fails every call (a streamed call fails after one chunk)."""
+
+    def invoke(self, messages):
+        raise RuntimeError("rate limited")
+
+    async def ainvoke(self, messages):
+        raise RuntimeError("rate limited")
+
+    async def astream(self, messages):
+        yield FakeListChatModel(responses=["partial"]).invoke("x")
+        raise RuntimeError("overloaded")
+
+
+class ChatbotTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        manager = VectorStoreManager(embedding_backend="hashing")
+        manager.embeddings = CachedEmbeddings(
+            HashingEmbeddings(), manager.embeddings_model, cache_path=Path(self._tmp.name) / "embeddings.sqlite3"
+        )
+        manager.resume_text_cache = RESUME
+        self.chatbot = EmployerQAChatbot(manager)
+        self.chatbot.llm = FakeListChatModel(responses=[f"Answer {i}." for i in range(20)])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def stream_reply(self, message: str) -> str:
+        async def collect():
+            return "".join([chunk async for chunk in self.chatbot.astream_reply(message)])
+        return asyncio.run(collect())
+
+
+class ServerSideConversationTest(ChatbotTestCase):
+    def test_successful_turns_are_recorded(self):
+        self.chatbot.reply("What is your experience with RAG?")
+        self.stream_reply("Which vector stores have you used?")
+        self.assertEqual([msg["role"] for msg in self.chatbot.get_chat_history()],
+                         ["user", "assistant", "user", "assistant"])
+
+    def test_failed_turns_are_not_recorded(self):
+        self.chatbot.llm = FailingLLM()
+        self.assertTrue(self.chatbot.reply("What is your experience with RAG?").startswith("❌"))
+        streamed = self.stream_reply("Which vector stores have you used?")
+        self.assertIn("partial", streamed)
+        self.assertIn("❌", streamed)
+        self.assertEqual(self.chatbot.get_chat_history(), [])
+
+    def test_missing_resume_is_not_recorded(self):
+        self.chatbot.vector_store_manager.resume_text_cache = None
+        self.assertTrue(self.chatbot.reply("Hello?").startswith("❌"))
+        self.assertEqual(self.chatbot.get_chat_history(), [])
+
+
+class SeenPortfolioChunksTest(ChatbotTestCase):
+    def setUp(self):
+        super().setUp()
+        portfolio = Path(self._tmp.name) / "portfolio.txt"
+        portfolio.write_text("=== Project: Support RAG assistant\nRetrieval over support tickets with FAISS.",
+                             encoding="utf-8")
+        self.chatbot.vector_store_manager.load_and_index_portfolio(str(portfolio))
+
+    def test_chunks_are_marked_shown_only_after_a_successful_call(self):
+        self.chatbot.llm = FailingLLM()
+        self.chatbot.reply("Tell me about your RAG assistant.")
+        self.assertEqual(self.chatbot.seen_chunks.shown_chunks(), [])
+
+        self.chatbot.llm = FakeListChatModel(responses=["It retrieves support tickets."])
+        self.chatbot.reply("Tell me about your RAG assistant.")
+        self.assertEqual(len(self.chatbot.seen_chunks.shown_chunks()), 1)
+
+
+class AnswerCacheTest(ChatbotTestCase):
+    def test_standalone_repeat_is_served_from_cache(self):
+        first = self.chatbot.answer_question("What is your experience with RAG?", [])
+        self.assertEqual(self.chatbot.answer_question("What is your experience with RAG?", []), first)
+        self.assertEqual(self.chatbot.get_answer_cache_stats()["hits"], 1)
+
+    def test_follow_up_skips_the_cache(self):
+        first = self.chatbot.reply("What is your experience with RAG?")
+        follow_up = self.chatbot.reply("What is your experience with RAG?")
+        self.assertNotEqual(follow_up, first)
+        stats = self.chatbot.get_answer_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for fitting prompt sections into their token budgets in ContextAssembler.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import unittest
+
+from src.core.context import ContextAssembler, CHUNK_SEPARATOR, TRUNCATION_MARKER
+from src.core.tokens import count_tokens
+
+
+def chunk(name: str, repeat: int) -> str:
+    return f"{name}: " + "built a retrieval pipeline " * repeat
+
+
+class FitTextTest(unittest.TestCase):
+    def test_text_within_budget_is_unchanged(self):
+        assembler = ContextAssembler({"resume": 1000})
+        self.assertEqual(assembler.fit_text("Jane Doe, ML engineer.", "resume"),
+                         ("Jane Doe, ML engineer.", count_tokens("Jane Doe, ML engineer.")))
+
+    def test_long_text_keeps_its_beginning(self):
+        assembler = ContextAssembler({"resume": 50})
+        text = "Jane Doe. " + "Experience line. " * 200
+        fitted, tokens = assembler.fit_text(text, "resume")
+        self.assertTrue(fitted.startswith("Jane Doe."))
+        self.assertTrue(fitted.endswith(TRUNCATION_MARKER))
+        self.assertLessEqual(tokens, 50)
+
+
+class FitRankedTest(unittest.TestCase):
+    def test_lowest_ranked_pieces_are_dropped_first(self):
+        pieces = [chunk("first", 10), chunk("second", 10), chunk("third", 10)]
+        budget = count_tokens(pieces[0]) + count_tokens(pieces[1])
+        kept, tokens = ContextAssembler({"portfolio": budget}).fit_ranked(pieces, "portfolio")
+        self.assertEqual(kept, pieces[:2])
+        self.assertEqual(tokens, budget)
+
+    def test_smaller_lower_ranked_pieces_still_fill_the_budget(self):
+        pieces = [chunk("first", 10), chunk("large", 40), chunk("small", 1)]
+        budget = count_tokens(pieces[0]) + count_tokens(pieces[2])
+        kept, _ = ContextAssembler({"portfolio": budget}).fit_ranked(pieces, "portfolio")
+        self.assertEqual(kept, [pieces[0], pieces[2]])
+
+    def test_oversized_top_piece_is_trimmed_not_dropped(self):
+        pieces = [chunk("huge", 100), chunk("small", 1)]
+        kept, tokens = ContextAssembler({"portfolio": 40}).fit_ranked(pieces, "portfolio")
+        self.assertEqual(len(kept), 1)
+        self.assertTrue(kept[0].startswith("huge:"))
+        self.assertLessEqual(tokens, 40)
+
+
+class FitHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.history = []
+        for i in range(1, 5):
+            self.history.append({"role": "user", "content": f"Question {i}: " + "details " * 10})
+            self.history.append({"role": "assistant", "content": f"Answer {i}: " + "details " * 10})
+
+    def test_most_recent_messages_are_kept(self):
+        budget = sum(count_tokens(msg["content"]) for msg in self.history[-4:])
+        kept, tokens = ContextAssembler({"history": budget}).fit_history(self.history)
+        self.assertEqual(kept, self.history[-4:])
+        self.assertEqual(tokens, budget)
+
+    def test_kept_history_never_starts_with_an_assistant_reply(self):
+        budget = sum(count_tokens(msg["content"]) for msg in self.history[-3:])
+        kept, tokens = ContextAssembler({"history": budget}).fit_history(self.history)
+        self.assertEqual(kept, self.history[-2:])
+        self.assertEqual(tokens, sum(count_tokens(msg["content"]) for msg in kept))
+
+
+class AssembleTest(unittest.TestCase):
+    def test_only_given_sections_are_assembled(self):
+        pieces = [chunk("first", 2), chunk("second", 2)]
+        context = ContextAssembler().assemble(resume="Jane Doe.", portfolio=pieces, label="test")
+        self.assertEqual(context["portfolio"], CHUNK_SEPARATOR.join(pieces))
+        self.assertEqual(context["portfolio_chunks"], pieces)
+        self.assertNotIn("examples", context)
+        self.assertEqual(set(context["tokens"]), {"resume", "portfolio"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the shared SQLite embedding cache (CachedEmbeddings).
+Run from the project root with: python -m unittest discover tests
+"""
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.core.embedding_cache import CachedEmbeddings
+from src.core.local_embeddings import HashingEmbeddings
+
+
+class CachedEmbeddingsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._tmp.name) / "embeddings.sqlite3"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _cache(self, **kwargs) -> CachedEmbeddings:
+        return CachedEmbeddings(HashingEmbeddings(), "hashing", cache_path=self.cache_path, **kwargs)
+
+    def test_second_instance_hits_the_shared_file(self):
+        texts = ["python and sql", "rag with faiss"]
+        expected = self._cache().embed_documents(texts)
+        other = self._cache()
+        # Vectors are stored as float32
+        np.testing.assert_allclose(other.embed_documents(texts), expected, rtol=1e-6)
+        self.assertEqual(other.get_stats()["hits"], 2)
+
+    def test_uses_wal_journal(self):
+        cache = self._cache()
+        cache.embed_documents(["warm up"])
+        mode = sqlite3.connect(str(self.cache_path)).execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_concurrent_sessions_do_not_fail(self):
+        caches = [self._cache(max_entries=20) for _ in range(4)]
+        errors = []
+
+        def index(cache: CachedEmbeddings, worker: int) -> None:
+            try:
+                for round_ in range(10):
+                    cache.embed_documents([f"chunk {worker} {round_} {i}" for i in range(5)])
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=index, args=(cache, i)) for i, cache in enumerate(caches)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_locked_database_falls_through_to_the_embedder(self):
+        cache = self._cache(busy_timeout=0.05)
+        cache.embed_documents(["warm up"])
+
+        blocker = sqlite3.connect(str(self.cache_path), isolation_level=None)
+        blocker.execute("BEGIN EXCLUSIVE")
+        try:
+            vectors = cache.embed_documents(["new text while locked"])
+        finally:
+            blocker.execute("ROLLBACK")
+            blocker.close()
+        self.assertEqual(vectors, HashingEmbeddings().embed_documents(["new text while locked"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for selecting the cover letter examples most relevant to a job.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import asyncio
+import unittest
+from typing import List
+
+from src.core.examples import ExampleRegistry
+from src.core.local_embeddings import HashingEmbeddings
+
+EXAMPLES = [
+    {"filename": "data.pdf", "content": "Dear team, I built dashboards in Tableau and SQL reports for sales analytics."},
+    {"filename": "ml.pdf", "content": "Dear team, I trained machine learning models and deployed PyTorch inference."},
+    {"filename": "rag.pdf", "content": "Dear team, I built RAG assistants with LangChain, FAISS and vector search."},
+]
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    """Hashing embeddings that count how many texts were embedded."""
+
+    def __init__(self):
+        super().__init__()
+        self.documents = 0
+        self.queries = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.documents += len(texts)
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        self.queries += 1
+        return super().embed_query(text)
+
+
+class ExampleSelectionTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = ExampleRegistry()
+        self.registry.set_examples(EXAMPLES)
+        self.embeddings = CountingEmbeddings()
+
+    def test_all_examples_are_used_without_embedding_when_they_fit(self):
+        selected = self.registry.select("RAG engineer", self.embeddings, top_n=3, token_budget=10000)
+        self.assertEqual([ex["filename"] for ex in selected], ["data.pdf", "ml.pdf", "rag.pdf"])
+        self.assertEqual((self.embeddings.documents, self.embeddings.queries), (0, 0))
+
+    def test_most_similar_example_is_selected(self):
+        selected = self.registry.select("Build RAG assistants with LangChain and FAISS vector search",
+                                        self.embeddings, top_n=1, token_budget=10000)
+        self.assertEqual([ex["filename"] for ex in selected], ["rag.pdf"])
+
+    def test_selection_keeps_registry_order(self):
+        selected = self.registry.select("RAG assistants with LangChain, FAISS; dashboards in Tableau",
+                                        self.embeddings, top_n=2, token_budget=10000)
+        self.assertEqual([ex["filename"] for ex in selected], ["data.pdf", "rag.pdf"])
+
+    def test_token_budget_limits_the_selection_but_keeps_the_best_match(self):
+        best_only = self.registry.select("RAG assistants with LangChain and FAISS", self.embeddings,
+                                         top_n=3, token_budget=1)
+        self.assertEqual([ex["filename"] for ex in best_only], ["rag.pdf"])
+
+    def test_examples_are_embedded_once(self):
+        self.registry.select("RAG assistants", self.embeddings, top_n=1, token_budget=10000)
+        self.registry.select("Tableau dashboards", self.embeddings, top_n=1, token_budget=10000)
+        self.assertEqual((self.embeddings.documents, self.embeddings.queries), (3, 2))
+
+    def test_async_selection_matches(self):
+        query = "Trained machine learning models with PyTorch"
+        selected = asyncio.run(self.registry.aselect(query, self.embeddings, top_n=1, token_budget=10000))
+        self.assertEqual(selected, self.registry.select(query, self.embeddings, top_n=1, token_budget=10000))
+        self.assertEqual(selected[0]["filename"], "ml.pdf")
+
+    def test_duplicate_letters_are_registered_once(self):
+        self.registry.set_examples(EXAMPLES + [{"filename": "copy.pdf", "content": EXAMPLES[0]["content"]}])
+        self.assertEqual(len(self.registry), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Regression tests for the parsed-PDF cache in pdf_loader.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from reportlab.pdfgen import canvas
+
+from src.core import pdf_loader
+
+
+def write_pdf(path: Path, text: str) -> None:
+    pdf = canvas.Canvas(str(path))
+    pdf.drawString(72, 720, text)
+    pdf.save()
+
+
+class PdfCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        pdf_loader._cache.clear()
+        pdf_loader._digests.clear()
+        self.parse = mock.patch.object(pdf_loader, "extract_pdf_pages", wraps=pdf_loader.extract_pdf_pages).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_reupload_under_a_new_path_is_not_parsed_again(self):
+        first = self.tmp_dir / "resume_20260101_120000.pdf"
+        write_pdf(first, "Jane Doe, machine learning engineer")
+        second = self.tmp_dir / "resume_20260101_120500.pdf"
+        shutil.copy(first, second)
+
+        self.assertEqual(pdf_loader.load_pdf(str(first)), pdf_loader.load_pdf(str(second)))
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_duplicate_files_in_one_call_are_parsed_once(self):
+        paths = [self.tmp_dir / f"copy_{i}.pdf" for i in range(3)]
+        write_pdf(paths[0], "Same letter")
+        for path in paths[1:]:
+            shutil.copy(paths[0], path)
+
+        pages = pdf_loader.load_pdfs([str(path) for path in paths], max_workers=1)
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_changed_contents_are_parsed_again(self):
+        path = self.tmp_dir / "resume.pdf"
+        write_pdf(path, "Old resume")
+        self.assertIn("Old resume", pdf_loader.load_pdf(str(path))[0])
+        write_pdf(path, "New resume with more experience")
+        self.assertIn("New resume", pdf_loader.load_pdf(str(path))[0])
+        self.assertEqual(self.parse.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for saving and restoring candidate profiles with CandidateProfileStore.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.embedding_cache import CachedEmbeddings
+from src.core.generator import CoverLetterGenerator
+from src.core.local_embeddings import HashingEmbeddings
+from src.core.profile_store import CandidateProfileStore, PROFILE_FILE
+
+PORTFOLIO = "=== Project: Fraud detection\nXGBoost classifier on card transactions served with FastAPI."
+
+
+class CandidateProfileStoreTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        self.store = CandidateProfileStore(self.tmp_dir / "profiles")
+        self.generator = self._generator()
+        portfolio = self.tmp_dir / "portfolio.txt"
+        portfolio.write_text(PORTFOLIO, encoding="utf-8")
+        self.generator.vector_store_manager.load_and_index_portfolio(str(portfolio))
+        self.generator.vector_store_manager.resume_text_cache = "Jane Doe, data scientist."
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _generator(self) -> CoverLetterGenerator:
+        generator = CoverLetterGenerator()
+        manager = generator.vector_store_manager
+        manager.embeddings = CachedEmbeddings(
+            HashingEmbeddings(), manager.embeddings_model, cache_path=self.tmp_dir / "embeddings.sqlite3"
+        )
+        return generator
+
+    def test_round_trip_rebuilds_chunk_ids(self):
+        self.store.save(self.generator, "me")
+        profile = json.loads((self.store.profile_dir("me") / PROFILE_FILE).read_text(encoding="utf-8"))
+        self.assertNotIn("portfolio_chunk_ids", profile)
+
+        restored = self._generator()
+        summary = self.store.load(restored, "me")
+        self.assertTrue(summary["has_resume"] and summary["has_portfolio"])
+        self.assertEqual(restored.vector_store_manager.portfolio_chunk_ids,
+                         self.generator.vector_store_manager.portfolio_chunk_ids)
+
+    def test_resave_replaces_profile(self):
+        self.store.save(self.generator, "me")
+        self.generator.vector_store_manager.resume_text_cache = "Updated resume."
+        self.store.save(self.generator, "me")
+        restored = self._generator()
+        self.store.load(restored, "me")
+        self.assertEqual(restored.vector_store_manager.resume_text_cache, "Updated resume.")
+        self.assertEqual([p.name for p in self.store.profiles_dir.iterdir()], ["me"])
+
+    def test_interrupted_swap_keeps_previous_profile(self):
+        self.store.save(self.generator, "me")
+        # Simulate a crash after the old profile was moved aside, before the new one was renamed in
+        profile_dir = self.store.profile_dir("me")
+        profile_dir.rename(profile_dir.with_name(".me.old"))
+
+        self.assertTrue(self.store.exists("me"))
+        self.assertIsNotNone(self.store.load(self._generator(), "me"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Regression tests for the per-browser-session registry of the UI.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import threading
+import time
+import unittest
+
+from src.ui.session import SessionRegistry
+
+
+class SlowProfileStore:
+    """Profile store stand-in whose load is slow and records whether the registry lock was held."""
+
+    def __init__(self):
+        self.registry = None
+        self.loads = 0
+        self.lock_held_during_load = False
+
+    def load(self, generator, name):
+        self.loads += 1
+        self.lock_held_during_load |= self.registry._lock.locked()
+        time.sleep(0.05)
+        return None
+
+
+class SessionRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.store = SlowProfileStore()
+        self.registry = SessionRegistry(profile_store=self.store, profile_name="me")
+        self.store.registry = self.registry
+
+    def test_profile_is_restored_outside_the_lock(self):
+        self.registry.get("tab")
+        self.assertEqual(self.store.loads, 1)
+        self.assertFalse(self.store.lock_held_during_load)
+
+    def test_concurrent_first_requests_share_one_session(self):
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(self.registry.get("tab"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+        self.assertIs(self.registry.get("tab"), sessions[0])
+
+    def test_other_sessions_are_served_while_one_is_created(self):
+        self.registry.get("first")
+        creating = threading.Thread(target=self.registry.get, args=("second",))
+        creating.start()
+        time.sleep(0.01)
+        started = time.monotonic()
+        self.registry.get("first")
+        elapsed = time.monotonic() - started
+        creating.join()
+        self.assertLess(elapsed, 0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
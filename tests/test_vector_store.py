@@ -0,0 +1,85 @@
+"""
+Regression tests for incremental portfolio indexing in VectorStoreManager.
+Run from the project root with: python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+from src.core.embedding_cache import CachedEmbeddings
+from src.core.local_embeddings import HashingEmbeddings
+from src.core.vector_store import VectorStoreManager
+
+
+def build_portfolio(projects: range) -> str:
+    """One section per project, each long enough to be its own chunk."""
+    return "\n".join(f"=== Project {i}\n" + f"Built pipeline number {i} with tool{i} and library{i}. " * 8
+                     for i in projects)
+
+
+PORTFOLIO_A = build_portfolio(range(5))
+PORTFOLIO_B = build_portfolio(range(2, 8))
+
+
+class FailingOnceEmbeddings(HashingEmbeddings):
+    """Hashing embeddings whose next embed_documents call fails when armed."""
+
+    def __init__(self):
+        super().__init__()
+        self.fail_next = False
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if self.fail_next:
+            self.fail_next = False
+            raise ValueError("embedding failed")
+        return super().embed_documents(texts)
+
+
+class IncrementalPortfolioIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        self.underlying = FailingOnceEmbeddings()
+        self.manager = VectorStoreManager(embedding_backend="hashing")
+        self.manager.embeddings = CachedEmbeddings(
+            self.underlying, self.manager.embeddings_model, cache_path=self.tmp_dir / "embeddings.sqlite3"
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str, text: str) -> str:
+        path = self.tmp_dir / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def _assert_consistent(self, expected_chunks: int):
+        store = self.manager.portfolio_vector_store
+        indexed_ids = set(store.index_to_docstore_id.values())
+        self.assertEqual(store.index.ntotal, expected_chunks)
+        self.assertEqual(set(self.manager.portfolio_chunk_ids.values()), indexed_ids)
+        self.assertEqual(len(self.manager.portfolio_keyword_index), expected_chunks)
+
+    def test_failed_embedding_leaves_index_untouched_and_retry_succeeds(self):
+        info = self.manager.load_and_index_portfolio(self._write("a.txt", PORTFOLIO_A))
+        self._assert_consistent(info["chunks_added"])
+        version = self.manager.index_versions["portfolio"]
+
+        path_b = self._write("b.txt", PORTFOLIO_B)
+        self.underlying.fail_next = True
+        with self.assertRaises(ValueError):
+            self.manager.load_and_index_portfolio(path_b)
+        self._assert_consistent(info["chunks_added"])
+        self.assertEqual(self.manager.index_versions["portfolio"], version)
+
+        info = self.manager.load_and_index_portfolio(path_b)
+        self.assertGreater(info["chunks_added"], 0)
+        self.assertGreater(info["chunks_removed"], 0)
+        self._assert_consistent(info["chunks_added"] + info["chunks_unchanged"])
+        self.assertIn("tool7", self.manager.get_portfolio_chunks("tool7", k=1)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()